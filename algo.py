@@ -1,9 +1,29 @@
+import sys
+
+# With command-line arguments, run headless and never import the GUI stack
+if __name__ == "__main__" and len(sys.argv) > 1:
+    import cli
+    sys.exit(cli.main())
+
+import os
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.patches import Rectangle
+from tkinter import ttk, filedialog, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
 import random
+import scheduler
+import multicore
+import traces
+import gantt
+import workloads
+import results_view
+import runner
+import compare
+import cache
+import metrics
+import realtime_view
+import multiburst
+import capture
 
 class CPUSchedulingApp:
     def __init__(self, root):
@@ -11,7 +31,7 @@ class CPUSchedulingApp:
         self.root.title("CPU Scheduling Algorithms with Gantt Chart")
         self.root.geometry("1200x950")
         
-        self.algorithms = ["FCFS", "SJF with AT", "SJF without AT", "Priority Scheduling", "Round Robin"]
+        self.algorithms = list(scheduler.ALGORITHMS)
         self.selected_algo = tk.StringVar(value=self.algorithms[0])
         
         self.is_dark_mode = True
@@ -42,7 +62,16 @@ class CPUSchedulingApp:
         
         self.root.configure(bg=self.themes['dark']['bg'])
         self.gantt_data = []
+        self.trace = None
+        self.gantt_chart = None
+        self.current_run = None
+        self.compare_window = None
+        self.realtime_window = None
+        self.io_devices = None
+        self.capture = None
+        self.result_cache = cache.shared_cache()
         self.create_widgets()
+        self.root.bind("<Destroy>", self._on_destroy, add="+")
 
     def create_widgets(self):
         theme = self.themes['dark'] if self.is_dark_mode else self.themes['light']
@@ -87,7 +116,7 @@ class CPUSchedulingApp:
         self.num_processes_entry = tk.Entry(self.main_frame, **entry_style)
         self.num_processes_entry.grid(row=2, column=1, padx=10, pady=15, sticky="w")
 
-        self.burst_label = tk.Label(self.main_frame, text="Burst Times (e.g., 5,3,8):", **label_style)
+        self.burst_label = tk.Label(self.main_frame, text="Burst Times (e.g., 5,3,8; CPU/I-O: 5/3/4):", **label_style)
         self.burst_label.grid(row=3, column=0, padx=10, pady=15, sticky="e")
         self.burst_entry = tk.Entry(self.main_frame, **entry_style)
         self.burst_entry.grid(row=3, column=1, padx=10, pady=15, sticky="w")
@@ -97,323 +126,525 @@ class CPUSchedulingApp:
         self.arrival_entry = tk.Entry(self.main_frame, **entry_style)
         self.arrival_entry.grid(row=4, column=1, padx=10, pady=15, sticky="w")
 
-        self.priority_label = tk.Label(self.main_frame, text="Priority (for Priority Scheduling):", **label_style)
+        self.priority_label = tk.Label(self.main_frame, text="Priority (Priority algorithms, CFS nice):", **label_style)
         self.priority_label.grid(row=5, column=0, padx=10, pady=15, sticky="e")
         self.priority_entry = tk.Entry(self.main_frame, **entry_style)
         self.priority_entry.grid(row=5, column=1, padx=10, pady=15, sticky="w")
 
-        self.quantum_label = tk.Label(self.main_frame, text="Time Quantum (for Round Robin):", **label_style)
+        self.quantum_label = tk.Label(self.main_frame, text="Time Quantum (RR, MLFQ e.g. 2,4,8):", **label_style)
         self.quantum_label.grid(row=6, column=0, padx=10, pady=15, sticky="e")
-        self.quantum_entry = tk.Entry(self.main_frame, **entry_style)
-        self.quantum_entry.grid(row=6, column=1, padx=10, pady=15, sticky="w")
-
-        self.run_button = tk.Button(self.main_frame, text="Run Algorithm", bg=theme['button_bg'], fg=theme['button_fg'], 
+        quantum_frame = tk.Frame(self.main_frame, bg=theme['bg'])
+        quantum_frame.grid(row=6, column=1, padx=10, pady=15, sticky="w")
+        self.quantum_entry = tk.Entry(quantum_frame, width=14, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.quantum_entry.pack(side="left")
+        tk.Label(quantum_frame, text="MLFQ boost every:", bg=theme['bg'], fg=theme['fg'],
+                 font=("Arial", 11)).pack(side="left", padx=(10, 5))
+        self.boost_entry = tk.Entry(quantum_frame, width=6, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.boost_entry.pack(side="left")
+        tk.Label(quantum_frame, text="CFS latency:", bg=theme['bg'], fg=theme['fg'],
+                 font=("Arial", 11)).pack(side="left", padx=(10, 5))
+        self.latency_entry = tk.Entry(quantum_frame, width=6, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.latency_entry.insert(0, str(scheduler.CFS_TARGET_LATENCY))
+        self.latency_entry.pack(side="left")
+        tk.Label(quantum_frame, text="Switch cost:", bg=theme['bg'], fg=theme['fg'],
+                 font=("Arial", 11)).pack(side="left", padx=(10, 5))
+        self.switch_cost_entry = tk.Entry(quantum_frame, width=6, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.switch_cost_entry.insert(0, "0")
+        self.switch_cost_entry.pack(side="left")
+
+        self.cores_label = tk.Label(self.main_frame, text="CPU Cores (multi-core mode):", **label_style)
+        self.cores_label.grid(row=7, column=0, padx=10, pady=15, sticky="e")
+        smp_frame = tk.Frame(self.main_frame, bg=theme['bg'])
+        smp_frame.grid(row=7, column=1, padx=10, pady=15, sticky="w")
+        self.cores_entry = tk.Entry(smp_frame, width=5, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.cores_entry.pack(side="left")
+        self.queue_mode = tk.StringVar(value=multicore.GLOBAL)
+        ttk.Combobox(smp_frame, values=multicore.QUEUE_MODES, textvariable=self.queue_mode,
+                     width=9, font=("Arial", 12), state="readonly").pack(side="left", padx=10)
+        self.work_stealing = tk.BooleanVar(value=False)
+        tk.Checkbutton(smp_frame, text="Work stealing", variable=self.work_stealing,
+                       bg=theme['bg'], fg=theme['fg'], selectcolor=theme['output_bg']).pack(side="left")
+        self.load_balancing = tk.BooleanVar(value=False)
+        tk.Checkbutton(smp_frame, text="Balance every", variable=self.load_balancing,
+                       bg=theme['bg'], fg=theme['fg'], selectcolor=theme['output_bg']).pack(side="left")
+        self.balance_entry = tk.Entry(smp_frame, width=5, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.balance_entry.insert(0, "10")
+        self.balance_entry.pack(side="left")
+        tk.Label(smp_frame, text="Migration penalty:", bg=theme['bg'], fg=theme['fg'],
+                 font=("Arial", 11)).pack(side="left", padx=(10, 5))
+        self.migration_entry = tk.Entry(smp_frame, width=5, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.migration_entry.insert(0, "0")
+        self.migration_entry.pack(side="left")
+
+        self.generate_label = tk.Label(self.main_frame, text="Generate Workload:", **label_style)
+        self.generate_label.grid(row=8, column=0, padx=10, pady=15, sticky="e")
+        generate_frame = tk.Frame(self.main_frame, bg=theme['bg'])
+        generate_frame.grid(row=8, column=1, padx=10, pady=15, sticky="w")
+        tk.Label(generate_frame, text="Jobs", bg=theme['bg'], fg=theme['fg'], font=("Arial", 11)).pack(side="left")
+        self.generate_count_entry = tk.Entry(generate_frame, width=8, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.generate_count_entry.insert(0, "1000")
+        self.generate_count_entry.pack(side="left", padx=(5, 10))
+        self.arrival_pattern = tk.StringVar(value=workloads.ARRIVAL_PATTERNS[0])
+        ttk.Combobox(generate_frame, values=workloads.ARRIVAL_PATTERNS, textvariable=self.arrival_pattern,
+                     width=8, font=("Arial", 12), state="readonly").pack(side="left")
+        self.burst_distribution = tk.StringVar(value=workloads.BURST_DISTRIBUTIONS[1])
+        ttk.Combobox(generate_frame, values=workloads.BURST_DISTRIBUTIONS, textvariable=self.burst_distribution,
+                     width=10, font=("Arial", 12), state="readonly").pack(side="left", padx=10)
+        tk.Label(generate_frame, text="Seed", bg=theme['bg'], fg=theme['fg'], font=("Arial", 11)).pack(side="left")
+        self.seed_entry = tk.Entry(generate_frame, width=6, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.seed_entry.insert(0, "42")
+        self.seed_entry.pack(side="left", padx=(5, 10))
+        tk.Button(generate_frame, text="Generate", bg=theme['button_bg'], fg=theme['button_fg'],
+                  font=("Arial", 11, "bold"), command=self.generate_workload, cursor="hand2").pack(side="left")
+
+        button_frame = tk.Frame(self.main_frame, bg=theme['bg'])
+        button_frame.grid(row=9, column=0, columnspan=2, pady=30)
+        self.run_button = tk.Button(button_frame, text="Run Algorithm", bg=theme['button_bg'], fg=theme['button_fg'], 
                                     font=("Arial", 16, "bold"), command=self.run_algorithm, 
                                     padx=40, pady=15, cursor="hand2")
-        self.run_button.grid(row=7, column=0, columnspan=2, pady=30)
-
-        self.output_text = tk.Text(self.main_frame, height=15, width=110, bg=theme['output_bg'], fg=theme['output_fg'], 
+        self.run_button.pack(side="left", padx=10)
+        self.compare_button = tk.Button(button_frame, text="Compare All", bg=theme['button_bg'], fg=theme['button_fg'],
+                                        font=("Arial", 12, "bold"), command=self.compare_algorithms, padx=15, pady=8,
+                                        cursor="hand2")
+        self.compare_button.pack(side="left", padx=10)
+        self.realtime_button = tk.Button(button_frame, text="Real-Time...", bg=theme['button_bg'], fg=theme['button_fg'],
+                                         font=("Arial", 12, "bold"), command=self.open_realtime, padx=15, pady=8,
+                                         cursor="hand2")
+        self.realtime_button.pack(side="left", padx=10)
+        self.cancel_button = tk.Button(button_frame, text="Cancel", bg=theme['button_bg'], fg=theme['button_fg'],
+                                       font=("Arial", 12, "bold"), command=self.cancel_run, padx=15, pady=8,
+                                       cursor="hand2", state="disabled")
+        self.cancel_button.pack(side="left", padx=10)
+
+        self.trace_button = tk.Button(button_frame, text="Load Trace...", bg=theme['button_bg'], fg=theme['button_fg'],
+                                      font=("Arial", 12, "bold"), command=self.load_trace, padx=15, pady=8, cursor="hand2")
+        self.trace_button.pack(side="left", padx=10)
+        self.clear_trace_button = tk.Button(button_frame, text="Clear Trace", bg=theme['button_bg'], fg=theme['button_fg'],
+                                            font=("Arial", 12, "bold"), command=self.clear_trace, padx=15, pady=8, cursor="hand2")
+        self.clear_trace_button.pack(side="left", padx=10)
+        self.capture_button = tk.Button(button_frame, text="Capture Host", bg=theme['button_bg'], fg=theme['button_fg'],
+                                        font=("Arial", 12, "bold"), command=self.toggle_capture, padx=15, pady=8,
+                                        cursor="hand2")
+        self.capture_button.pack(side="left", padx=10)
+        self.trace_label = tk.Label(button_frame, text="", bg=theme['bg'], fg=theme['fg'], font=("Arial", 11))
+        self.trace_label.pack(side="left", padx=10)
+
+        self.progress_bar = ttk.Progressbar(button_frame, mode="indeterminate", length=150)
+        self.progress_bar.pack(side="left", padx=10)
+        self.status_label = tk.Label(button_frame, text="", bg=theme['bg'], fg=theme['fg'], font=("Arial", 11))
+        self.status_label.pack(side="left", padx=10)
+
+        self.results_table = results_view.ResultsTable(self.main_frame)
+        self.results_table.grid(row=10, column=0, columnspan=2, padx=10, pady=(20, 0), sticky="ew")
+
+        self.output_text = tk.Text(self.main_frame, height=10, width=110, bg=theme['output_bg'], fg=theme['output_fg'], 
                                    font=("Courier", 11), relief="solid", borderwidth=2)
-        self.output_text.grid(row=8, column=0, columnspan=2, padx=10, pady=20)
+        self.output_text.grid(row=11, column=0, columnspan=2, padx=10, pady=20)
 
         # Gantt Chart Frame
         self.gantt_frame = tk.Frame(self.main_frame, bg=theme['bg'])
-        self.gantt_frame.grid(row=9, column=0, columnspan=2, pady=20)
+        self.gantt_frame.grid(row=12, column=0, columnspan=2, pady=20)
         
         gantt_title = tk.Label(self.gantt_frame, text="Gantt Chart Visualization", 
                               bg=theme['bg'], fg=theme['title_fg'], font=("Arial", 18, "bold"))
         gantt_title.pack(pady=10)
 
-    def run_algorithm(self):
+    def read_workload(self):
+        """
+        Returns (arrival, burst, priority) from the loaded trace or the entry boxes,
+        or None after reporting an input error
+        """
+        if self.trace is not None:
+            return self.trace
+
+        num_processes = int(self.num_processes_entry.get().strip())
+        
+        burst_tokens = self.burst_entry.get().split(",")
+        self.io_devices = None
+        if any("/" in token for token in burst_tokens):
+            # CPU/I-O sequences such as 5/3@1/4 (CPU 5, I/O 3 on device 1, CPU 4)
+            parsed = [multiburst.parse_process(token) for token in burst_tokens]
+            burst = [bursts for bursts, _ in parsed]
+            self.io_devices = [devices for _, devices in parsed]
+        else:
+            burst = list(map(int, burst_tokens))
+        
+        if len(burst) != num_processes:
+            messagebox.showerror("Error", f"Number of burst times ({len(burst)}) must match number of processes ({num_processes})")
+            return
+        
+        arrival_text = self.arrival_entry.get().strip()
+        arrival = list(map(int, arrival_text.split(","))) if arrival_text else [0]*num_processes
+        
+        if arrival_text and len(arrival) != num_processes:
+            messagebox.showerror("Error", f"Number of arrival times ({len(arrival)}) must match number of processes ({num_processes})")
+            return
+        
+        priority_text = self.priority_entry.get().strip()
+        priority = list(map(int, priority_text.split(","))) if priority_text else [0]*num_processes
+        
+        if priority_text and len(priority) != num_processes:
+            messagebox.showerror("Error", f"Number of priority values ({len(priority)}) must match number of processes ({num_processes})")
+            return
+
+        return arrival, burst, priority
+
+    def load_trace(self):
+        path = filedialog.askopenfilename(title="Load Workload Trace",
+                                          filetypes=[("Traces", "*.csv *.trc"), ("All Files", "*.*")])
+        if not path:
+            return
         try:
-            num_processes = int(self.num_processes_entry.get().strip())
-            processes = [f"P{i+1}" for i in range(num_processes)]
-            
-            burst = list(map(int, self.burst_entry.get().split(",")))
-            
-            if len(burst) != num_processes:
-                messagebox.showerror("Error", f"Number of burst times ({len(burst)}) must match number of processes ({num_processes})")
+            self.trace = traces.load_trace(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not load trace: {e}")
+            return
+        self.trace_label.config(text=f"Trace: {os.path.basename(path)} ({len(self.trace[1])} jobs)")
+
+    def toggle_capture(self):
+        """
+        Starts sampling this host's processes; the second click stops and
+        loads the captured jobs as the trace, so any algorithm can replay them.
+        """
+        if self.capture is None:
+            try:
+                self.capture = capture.HostCapture()
+            except (OSError, ImportError, ValueError) as e:
+                messagebox.showerror("Error", f"Could not start capture: {e}")
                 return
-            
-            arrival_text = self.arrival_entry.get().strip()
-            arrival = list(map(int, arrival_text.split(","))) if arrival_text else [0]*num_processes
-            
-            if arrival_text and len(arrival) != num_processes:
-                messagebox.showerror("Error", f"Number of arrival times ({len(arrival)}) must match number of processes ({num_processes})")
-                return
-            
-            priority_text = self.priority_entry.get().strip()
-            priority = list(map(int, priority_text.split(","))) if priority_text else [0]*num_processes
-            
-            if priority_text and len(priority) != num_processes:
-                messagebox.showerror("Error", f"Number of priority values ({len(priority)}) must match number of processes ({num_processes})")
+            self.capture.start()
+            self.capture_button.config(text="Stop Capture")
+            self.root.after(1000, self._poll_capture)
+            return
+
+        host, self.capture = self.capture, None
+        host.stop()
+        self.capture_button.config(text="Capture Host")
+        arrival, burst, priority = host.jobs()
+        if not burst:
+            self.trace_label.config(text="")
+            messagebox.showinfo("Capture", "No process used the CPU during the capture")
+            return
+        self.trace = (arrival, burst, priority)
+        self.trace_label.config(text=f"Captured: {len(burst)} jobs from {host.process_count} processes")
+
+    def _poll_capture(self):
+        if self.capture is None:
+            return
+        self.trace_label.config(text=f"Capturing... {self.capture.elapsed:.0f}s, "
+                                     f"{self.capture.process_count} processes")
+        self.root.after(1000, self._poll_capture)
+
+    def generate_workload(self):
+        try:
+            count = int(self.generate_count_entry.get().strip())
+            seed_text = self.seed_entry.get().strip()
+            seed = int(seed_text) if seed_text else None
+            arrival, burst, priority = workloads.generate_workload(
+                count, seed=seed, arrival_pattern=self.arrival_pattern.get(),
+                burst_distribution=self.burst_distribution.get())
+        except ValueError as e:
+            messagebox.showerror("Error", f"Could not generate workload: {e}")
+            return
+        self.trace = (arrival.tolist(), burst.tolist(), priority.tolist())
+        self.trace_label.config(text=f"Generated: {count} jobs ({self.arrival_pattern.get()}, "
+                                     f"{self.burst_distribution.get()}, seed {seed_text or 'random'})")
+
+    def clear_trace(self):
+        self.trace = None
+        self.trace_label.config(text="")
+
+    def run_algorithm(self):
+        if self.current_run is not None:
+            return
+        try:
+            workload = self.read_workload()
+            if workload is None:
                 return
-            
-            quantum_text = self.quantum_entry.get().strip()
-            quantum = int(quantum_text) if quantum_text else 2
+            arrival, burst, priority = workload
 
             algo = self.selected_algo.get()
-            if algo == "FCFS":
-                st, ct, wt, tat = self.fcfs(processes, arrival, burst)
-            elif algo == "SJF with AT":
-                st, ct, wt, tat = self.sjf_with_at(processes, arrival, burst)
-            elif algo == "SJF without AT":
-                st, ct, wt, tat = self.sjf_without_at(processes, burst)
-            elif algo == "Priority Scheduling":
-                st, ct, wt, tat = self.priority_scheduling(processes, arrival, burst, priority)
-            elif algo == "Round Robin":
-                st, ct, wt, tat = self.round_robin(processes, arrival, burst, quantum)
+            quantum_text = self.quantum_entry.get().strip()
+            if algo == "MLFQ" and "," in quantum_text:
+                quantum = [int(q) for q in quantum_text.split(",")]
             else:
+                quantum = int(quantum_text) if quantum_text else 2
+
+            options = {}
+            if algo == "MLFQ" and self.boost_entry.get().strip():
+                options["boost_interval"] = int(self.boost_entry.get().strip())
+            if algo == "CFS" and self.latency_entry.get().strip():
+                options["target_latency"] = int(self.latency_entry.get().strip())
+            if multiburst.is_multiburst(burst):
+                if algo not in multiburst.POLICIES:
+                    messagebox.showerror("Error", f"{algo} does not support I/O bursts")
+                    return
+                options["devices"] = self.io_devices
+
+            cores_text = self.cores_entry.get().strip()
+            num_cores = int(cores_text) if cores_text else 1
+
+            switch_text = self.switch_cost_entry.get().strip()
+            switch_cost = int(switch_text) if switch_text else 0
+            migration_text = self.migration_entry.get().strip()
+            migration_penalty = int(migration_text) if migration_text else 0
+
+            if algo not in scheduler.ALGORITHMS:
                 messagebox.showerror("Error", "Unknown Algorithm")
                 return
+            balance_interval = None
+            if num_cores > 1 and self.load_balancing.get():
+                balance_interval = int(self.balance_entry.get().strip())
+
+            job = dict(algo=algo, arrival=arrival, burst=burst, priority=priority, quantum=quantum,
+                       num_cores=num_cores, queue_mode=self.queue_mode.get(),
+                       work_stealing=self.work_stealing.get(), balance_interval=balance_interval,
+                       switch_cost=switch_cost, migration_penalty=migration_penalty, **options)
+            self.run_key = cache.fingerprint(**job)
+            self.run_workload = (arrival, burst, num_cores)
+
+            # Same workload and settings as an earlier run: reuse its result
+            result = self.result_cache.get(self.run_key)
+            if result is not None:
+                self.show_results(arrival, burst, result, num_cores)
+                self.status_label.config(text="Loaded from cache")
+                return
 
-            avg_tat = sum(tat)/len(tat)
-            avg_wt = sum(wt)/len(wt)
-            total_time = max(ct)
-            throughput = len(processes) / total_time if total_time > 0 else 0
-
-            # Display results
-            self.output_text.delete("1.0", tk.END)
-            self.output_text.insert(tk.END, f"\n{'='*110}\n")
-            self.output_text.insert(tk.END, f"{'SCHEDULING RESULTS':^110}\n")
-            self.output_text.insert(tk.END, f"{'='*110}\n\n")
-            self.output_text.insert(tk.END, f"{'Process':<12}{'Arrival':<12}{'Burst':<12}{'Start':<12}{'Completion':<15}{'Waiting':<12}{'Turnaround':<12}\n")
-            self.output_text.insert(tk.END, "-"*110 + "\n")
-            for i in range(len(processes)):
-                self.output_text.insert(tk.END, f"{processes[i]:<12}{arrival[i]:<12}{burst[i]:<12}{st[i]:<12}{ct[i]:<15}{wt[i]:<12}{tat[i]:<12}\n")
-            self.output_text.insert(tk.END, "-"*110 + "\n\n")
-            self.output_text.insert(tk.END, f"{'PERFORMANCE METRICS':^110}\n")
-            self.output_text.insert(tk.END, f"{'-'*110}\n")
-            self.output_text.insert(tk.END, f"  Average Turnaround Time: {avg_tat:.2f}\n")
-            self.output_text.insert(tk.END, f"  Average Waiting Time: {avg_wt:.2f}\n")
-            self.output_text.insert(tk.END, f"  Throughput: {throughput:.4f} processes/unit time\n")
-            self.output_text.insert(tk.END, f"{'='*110}\n")
-
-            # Draw Gantt Chart
-            self.draw_gantt_chart(processes, st, ct)
-
+            # The simulation runs in a worker process so the UI stays live
+            self.current_run = runner.BackgroundRun(**job)
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
 
-    def draw_gantt_chart(self, processes, start_times, completion_times):
-        # Clear previous chart
-        for widget in self.gantt_frame.winfo_children():
-            if isinstance(widget, tk.Frame) and widget != self.gantt_frame.winfo_children()[0]:
-                widget.destroy()
-        
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(12, 4))
-        fig.patch.set_facecolor('#2E3440' if self.is_dark_mode else '#F5F5F5')
-        ax.set_facecolor('#3B4252' if self.is_dark_mode else '#FFFFFF')
-        
-        # Generate colors for processes
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8', 
-                  '#F7DC6F', '#BB8FCE', '#85C1E2', '#F8B739', '#52B788']
-        
-        # Plot each process
-        for i, (proc, start, end) in enumerate(zip(processes, start_times, completion_times)):
-            duration = end - start
-            color = colors[i % len(colors)]
-            
-            # Draw rectangle for process
-            rect = Rectangle((start, 0.4), duration, 0.2, 
-                           facecolor=color, edgecolor='black', linewidth=2)
-            ax.add_patch(rect)
-            
-            # Add process label
-            ax.text(start + duration/2, 0.5, proc, 
-                   ha='center', va='center', fontsize=10, fontweight='bold', color='black')
-        
-        # Set axis properties
-        ax.set_xlim(0, max(completion_times) + 2)
-        ax.set_ylim(0, 1)
-        ax.set_xlabel('Time', fontsize=12, fontweight='bold', 
-                     color='#D8DEE9' if self.is_dark_mode else '#2E3440')
-        ax.set_yticks([])
-        ax.set_title('Process Execution Timeline (Gantt Chart)', fontsize=14, fontweight='bold',
-                    color='#88C0D0' if self.is_dark_mode else '#0066CC', pad=20)
-        
-        # Style the axes
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False)
-        ax.tick_params(colors='#D8DEE9' if self.is_dark_mode else '#2E3440')
-        
-        # Add time markers
-        time_points = sorted(set([0] + start_times + completion_times))
-        ax.set_xticks(time_points)
-        ax.grid(axis='x', alpha=0.3, linestyle='--')
-        
-        plt.tight_layout()
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, master=self.gantt_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(pady=10)
-
-    def fcfs(self, processes, arrival, burst):
-        n = len(processes)
-        proc_data = list(zip(processes, arrival, burst, range(n)))
-        proc_data.sort(key=lambda x: x[1])
-        
-        start_time = [0]*n
-        completion_time = [0]*n
-        waiting_time = [0]*n
-        turnaround_time = [0]*n
-        
-        current_time = 0
-        for i in range(n):
-            proc, arr, bur, orig_idx = proc_data[i]
-            if current_time < arr:
-                current_time = arr
-            start_time[orig_idx] = current_time
-            completion_time[orig_idx] = current_time + bur
-            turnaround_time[orig_idx] = completion_time[orig_idx] - arr
-            waiting_time[orig_idx] = turnaround_time[orig_idx] - bur
-            current_time = completion_time[orig_idx]
-        
-        return start_time, completion_time, waiting_time, turnaround_time
-
-    def sjf_with_at(self, processes, arrival, burst):
-        n = len(processes)
-        completed = [False]*n
-        current_time = 0
-        start_time = [0]*n
-        completion_time = [0]*n
-        waiting_time = [0]*n
-        turnaround_time = [0]*n
-        completed_count = 0
-
-        while completed_count < n:
-            idx = -1
-            min_burst = float('inf')
-            
-            for i in range(n):
-                if arrival[i] <= current_time and not completed[i] and burst[i] < min_burst:
-                    min_burst = burst[i]
-                    idx = i
-            
-            if idx == -1:
-                current_time += 1
-                continue
-            
-            start_time[idx] = current_time
-            current_time += burst[idx]
-            completion_time[idx] = current_time
-            turnaround_time[idx] = completion_time[idx] - arrival[idx]
-            waiting_time[idx] = turnaround_time[idx] - burst[idx]
-            completed[idx] = True
-            completed_count += 1
-
-        return start_time, completion_time, waiting_time, turnaround_time
-
-    def sjf_without_at(self, processes, burst):
-        n = len(processes)
-        proc_data = list(zip(processes, burst, range(n)))
-        proc_data.sort(key=lambda x: x[1])
-        
-        start_time = [0]*n
-        completion_time = [0]*n
-        waiting_time = [0]*n
-        turnaround_time = [0]*n
-        current_time = 0
-
-        for proc, bur, orig_idx in proc_data:
-            start_time[orig_idx] = current_time
-            completion_time[orig_idx] = current_time + bur
-            turnaround_time[orig_idx] = completion_time[orig_idx]
-            waiting_time[orig_idx] = start_time[orig_idx]
-            current_time = completion_time[orig_idx]
-
-        return start_time, completion_time, waiting_time, turnaround_time
-
-    def priority_scheduling(self, processes, arrival, burst, priority):
-        n = len(processes)
-        completed = [False]*n
-        current_time = 0
-        start_time = [0]*n
-        completion_time = [0]*n
-        waiting_time = [0]*n
-        turnaround_time = [0]*n
-        completed_count = 0
-
-        while completed_count < n:
-            idx = -1
-            highest_priority = float('inf')
-            
-            for i in range(n):
-                if arrival[i] <= current_time and not completed[i] and priority[i] < highest_priority:
-                    highest_priority = priority[i]
-                    idx = i
-            
-            if idx == -1:
-                current_time += 1
-                continue
-            
-            start_time[idx] = current_time
-            current_time += burst[idx]
-            completion_time[idx] = current_time
-            turnaround_time[idx] = completion_time[idx] - arrival[idx]
-            waiting_time[idx] = turnaround_time[idx] - burst[idx]
-            completed[idx] = True
-            completed_count += 1
-
-        return start_time, completion_time, waiting_time, turnaround_time
-
-    def round_robin(self, processes, arrival, burst, quantum):
-        n = len(processes)
-        remaining = burst.copy()
-        current_time = 0
-        completion_time = [0]*n
-        start_time = [-1]*n
-        ready_queue = []
-        visited = [False]*n
-        
-        proc_indices = list(range(n))
-        proc_indices.sort(key=lambda x: arrival[x])
-        
-        i = 0
-        while True:
-            while i < n and arrival[proc_indices[i]] <= current_time:
-                if not visited[proc_indices[i]]:
-                    ready_queue.append(proc_indices[i])
-                    visited[proc_indices[i]] = True
-                i += 1
-            
-            if not ready_queue:
-                if i < n:
-                    current_time = arrival[proc_indices[i]]
-                    continue
-                else:
-                    break
-            
-            idx = ready_queue.pop(0)
-            
-            if start_time[idx] == -1:
-                start_time[idx] = current_time
-            
-            if remaining[idx] > quantum:
-                current_time += quantum
-                remaining[idx] -= quantum
-                
-                temp_i = i
-                while temp_i < n and arrival[proc_indices[temp_i]] <= current_time:
-                    if not visited[proc_indices[temp_i]]:
-                        ready_queue.append(proc_indices[temp_i])
-                        visited[proc_indices[temp_i]] = True
-                        i = temp_i + 1
-                    temp_i += 1
-                
-                ready_queue.append(idx)
+        self._begin_run()
+        self.root.after(100, self._poll_run)
+
+    def compare_algorithms(self):
+        if self.current_run is not None:
+            return
+        try:
+            workload = self.read_workload()
+            if workload is None:
+                return
+            arrival, burst, priority = workload
+            if multiburst.is_multiburst(burst):
+                messagebox.showerror("Error", "Compare All needs a single CPU burst per process")
+                return
+
+            # MLFQ and CFS use the entered quantum; Round Robin sweeps it alongside the usual powers of two
+            quantum_text = self.quantum_entry.get().strip()
+            if "," in quantum_text:
+                quantum = [int(q) for q in quantum_text.split(",")]
+                entered = quantum[0]
             else:
-                current_time += remaining[idx]
-                remaining[idx] = 0
-                completion_time[idx] = current_time
+                quantum = entered = int(quantum_text) if quantum_text else 2
+            quanta = sorted(set(compare.DEFAULT_QUANTA) | {entered})
+            switch_text = self.switch_cost_entry.get().strip()
+            switch_cost = int(switch_text) if switch_text else 0
+            options = {}
+            if self.boost_entry.get().strip():
+                options["MLFQ"] = {"boost_interval": int(self.boost_entry.get().strip())}
+            if self.latency_entry.get().strip():
+                options["CFS"] = {"target_latency": int(self.latency_entry.get().strip())}
+
+            # Every algorithm runs as its own task on a process pool
+            self.current_run = compare.Comparison(arrival, burst, priority, quanta, switch_cost, quantum, options)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        self._begin_run()
+        self.root.after(100, self._poll_comparison)
+
+    def _poll_comparison(self):
+        run = self.current_run
+        if run is None:
+            return
+        message = run.poll()
+        if message is None:
+            self.status_label.config(text=f"Comparing... {run.elapsed:.1f}s")
+            self.root.after(100, self._poll_comparison)
+            return
+
+        elapsed = run.elapsed
+        self._end_run()
+        status, rows = message
+        if status == "error":
+            self.status_label.config(text="Failed")
+            messagebox.showerror("Error", rows)
+            return
+        try:
+            self.show_comparison(rows)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+        self.status_label.config(text=f"Compared {len(rows)} runs in {elapsed:.2f}s")
+
+    def _poll_run(self):
+        run = self.current_run
+        if run is None:
+            return
+        message = run.poll()
+        if message is None:
+            self.status_label.config(text=f"Simulating... {run.elapsed:.1f}s")
+            self.root.after(100, self._poll_run)
+            return
+
+        elapsed = run.elapsed
+        self._end_run()
+        status, result = message
+        if status == "error":
+            self.status_label.config(text="Failed")
+            messagebox.showerror("Error", result)
+            return
+        self.result_cache.put(self.run_key, result)
+
+        self.status_label.config(text="Drawing results...")
+        self.root.update_idletasks()
+        try:
+            arrival, burst, num_cores = self.run_workload
+            self.show_results(arrival, burst, result, num_cores)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+        self.status_label.config(text=f"Simulated in {elapsed:.2f}s")
+
+    def cancel_run(self):
+        if self.current_run is None:
+            return
+        self.current_run.cancel()
+        self._end_run()
+        self.status_label.config(text="Cancelled")
+
+    def _begin_run(self):
+        self.run_button.config(state="disabled")
+        self.compare_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.progress_bar.start(15)
+        self.status_label.config(text="Simulating...")
+
+    def _end_run(self):
+        self.current_run = None
+        self.progress_bar.stop()
+        self.run_button.config(state="normal")
+        self.compare_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+
+    def _on_destroy(self, event):
+        # Stop the worker and the host sampler when the scheduling window is closed
+        if event.widget is not self.root:
+            return
+        if self.current_run is not None:
+            self.current_run.cancel()
+            self.current_run = None
+        if self.capture is not None:
+            host, self.capture = self.capture, None
+            host.stop()
+
+    def show_results(self, arrival, burst, result, num_cores=1):
+        processes = [f"P{i+1}" for i in range(len(burst))]
+        st, ct, wt, tat = result["st"], result["ct"], result["wt"], result["tat"]
+        smp = result["smp"]
+        io = result.get("io")
+        if io is not None:
+            # The table and metrics count CPU time; waiting excludes time spent on I/O
+            burst = io.cpu_time
+
+        avg_tat = sum(tat)/len(tat)
+        avg_wt = sum(wt)/len(wt)
+        total_time = max(ct)
+        throughput = len(processes) / total_time if total_time > 0 else 0
+
+        # Only the visible rows of the table are ever rendered
+        self.results_table.set_data({
+            "Process": processes, "Arrival": arrival, "Burst": burst, "Start": st,
+            "Completion": ct, "Waiting": wt, "Turnaround": tat,
+        })
+
+        lines = [
+            f"{'PERFORMANCE METRICS':^110}",
+            "-"*110,
+            f"  Processes: {len(processes)}",
+            f"  Average Turnaround Time: {avg_tat:.2f}",
+            f"  Average Waiting Time: {avg_wt:.2f}",
+            f"  Throughput: {throughput:.4f} processes/unit time",
+        ]
+        # Tail latency from bounded-size sketches, filled in one pass
+        stats = metrics.StreamingMetrics().add_result(arrival, burst, st, ct, wt if io is not None else None)
+        lines.extend(stats.format_lines())
+        overhead = result.get("overhead")
+        if overhead and overhead["time"]:
+            lines.append(f"  Context switches: {overhead['switches']}, overhead {overhead['time']} time units, "
+                         f"CPU efficiency {overhead['efficiency']*100:.2f}%")
+        if smp is not None:
+            lines.append(f"  Migrations: {smp.migrations} (work steals: {smp.steals})")
+            for core, util in enumerate(smp.utilization):
+                lines.append(f"  Core {core}: {util*100:6.2f}% busy, {smp.core_migrations[core]} migrations in")
+        if io is not None:
+            lines.append(f"  CPU: {io.cpu_utilization*100:6.2f}% busy, average I/O wait {sum(io.io_wait_time)/len(processes):.2f}")
+            for device, util in enumerate(io.device_utilization):
+                lines.append(f"  Device {device}: {util*100:6.2f}% busy, {io.device_requests[device]} requests")
+        lines.append("="*110)
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert(tk.END, "\n".join(lines) + "\n")
+
+        # Draw Gantt Chart
+        if io is not None:
+            segments, lanes = gantt.io_schedule(io)
+            self.draw_gantt_chart(processes, segments, len(lanes), lanes)
+        else:
+            self.draw_gantt_chart(processes, result["segments"], num_cores)
+
+    def show_comparison(self, rows):
+        """
+        Lists the comparison in the output box and charts it in its own window.
+        The window is reused for later comparisons while it stays open.
+        """
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert(tk.END, f"{'ALGORITHM COMPARISON':^124}\n" + compare.format_table(rows) + "\n")
 
-        waiting_time = [completion_time[i] - arrival[i] - burst[i] for i in range(n)]
-        turnaround_time = [completion_time[i] - arrival[i] for i in range(n)]
-        
-        return start_time, completion_time, waiting_time, turnaround_time
+        theme = self.themes['dark'] if self.is_dark_mode else self.themes['light']
+        if self.compare_window is None or not self.compare_window.winfo_exists():
+            self.compare_window = tk.Toplevel(self.root)
+            self.compare_window.title("Algorithm Comparison")
+            self.compare_window.configure(bg=theme['bg'])
+            self.compare_figure = Figure(figsize=(14, 5))
+            self.compare_canvas = FigureCanvasTkAgg(self.compare_figure, master=self.compare_window)
+            self.compare_canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        compare.plot_comparison(self.compare_figure, rows, theme)
+        self.compare_canvas.draw_idle()
+        self.compare_window.lift()
+
+    def open_realtime(self):
+        """Opens the EDF / Rate-Monotonic window, or raises it if it is already open."""
+        if self.realtime_window is None or not self.realtime_window.exists():
+            theme = self.themes['dark'] if self.is_dark_mode else self.themes['light']
+            self.realtime_window = realtime_view.RealTimeWindow(self.root, theme)
+        self.realtime_window.lift()
+
+    def draw_gantt_chart(self, processes, segments, num_lanes=1, lane_names=None):
+        """
+        Draws the execution segments as a Gantt chart, one lane per core.
+        The figure and canvas are created on the first run and updated in place after that.
+        """
+        if self.gantt_chart is None:
+            theme = self.themes['dark'] if self.is_dark_mode else self.themes['light']
+            self.gantt_chart = gantt.GanttChart(theme)
+
+            # Embed in tkinter with a pan/zoom toolbar
+            self.gantt_canvas = FigureCanvasTkAgg(self.gantt_chart.figure, master=self.gantt_frame)
+            self.gantt_toolbar = NavigationToolbar2Tk(self.gantt_canvas, self.gantt_frame, pack_toolbar=False)
+            self.gantt_toolbar.pack(fill="x")
+            self.gantt_canvas.get_tk_widget().pack(pady=10)
+
+        # Give each core lane room when there are many of them
+        height = max(4, 0.4 * num_lanes + 1)
+        if self.gantt_chart.figure.get_figheight() != height:
+            self.gantt_chart.figure.set_figheight(height)
+            self.gantt_canvas.get_tk_widget().config(height=int(height * self.gantt_chart.figure.dpi))
+
+        self.gantt_chart.update(processes, segments, num_lanes, lane_names)
+        self.gantt_toolbar.update()
+        self.gantt_canvas.draw_idle()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,306 @@
+"""
+Offscreen batch rendering of scheduling reports.
+
+Every scenario (an algorithm and its settings on a workload) is simulated
+and drawn to files: a Gantt chart and a plot of the waiting, turnaround and
+response time distributions, as PNG, SVG or PDF. Scenarios run as tasks on
+a process pool; each worker draws on Figures attached directly to the Agg
+canvas, never through pyplot or tkinter, so no display is needed. A summary
+chart comparing all scenarios is drawn last.
+
+A scenario file is a JSON list of objects such as
+
+    {"name": "rr-small", "algo": ["Round Robin", "SRTF"], "quantum": [2, 4],
+     "burst": [5, 3, 8], "arrival": [0, 1, 2]}
+
+where the workload comes from "burst" (with optional "arrival", "priority"
+and, for CPU/I-O processes, "devices"), "trace" (a trace file) or
+"generate" (a job count, with "seed"). Algorithms may be given by their
+cli.py aliases. Lists under "algo" or "quantum" expand into one scenario
+per combination (MLFQ level quanta are therefore written [[2, 4, 8]]);
+algorithms that take no quantum run once, whatever the quantum list.
+Other keys are runner.simulate options: num_cores, queue_mode,
+work_stealing, balance_interval, switch_cost, migration_penalty,
+boost_interval, target_latency, num_devices.
+
+    python batch_render.py scenarios.json --out charts --format png,svg --jobs 8
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import cli
+import compare
+import gantt
+import metrics
+import multiburst
+import runner
+import scheduler
+
+FORMATS = ("png", "svg", "pdf")
+RUN_OPTIONS = ("num_cores", "queue_mode", "work_stealing", "balance_interval", "switch_cost",
+               "migration_penalty", "boost_interval", "target_latency", "devices", "num_devices")
+WORKLOAD_KEYS = ("burst", "arrival", "priority", "trace", "generate", "seed")
+
+# The GUI's light theme; reports are usually printed or pasted into documents
+REPORT_THEME = {
+    'bg': '#F5F5F5',
+    'fg': '#2E3440',
+    'title_fg': '#0066CC',
+    'output_bg': '#FFFFFF',
+}
+
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", text).strip("-") or "scenario"
+
+
+def expand_scenarios(specs):
+    """One scenario per (algorithm, quantum) combination, each with a unique name."""
+    scenarios = []
+    names = set()
+    for index, spec in enumerate(specs):
+        unknown = set(spec) - set(RUN_OPTIONS) - set(WORKLOAD_KEYS) - {"name", "algo", "quantum"}
+        if unknown:
+            raise ValueError(f"Scenario {index + 1}: unknown keys {', '.join(sorted(unknown))}")
+        if "algo" not in spec:
+            raise ValueError(f"Scenario {index + 1}: no algorithm given")
+        io_options = sorted(set(spec) & {"devices", "num_devices"})
+        if io_options and not multiburst.is_multiburst(spec.get("burst", [])):
+            raise ValueError(f"Scenario {index + 1}: {', '.join(io_options)} need bursts given as "
+                             f"CPU/IO sequences, such as [[5, 3, 4], [6]]")
+        algos = spec["algo"] if isinstance(spec["algo"], list) else [spec["algo"]]
+        algos = [cli.ALIASES.get(algo.strip().lower(), algo) for algo in algos]
+        quanta = spec.get("quantum", 2)
+        if not isinstance(quanta, list):
+            quanta = [quanta]
+        for algo in algos:
+            # A quantum sweep would only repeat the same schedule for the others
+            algo_quanta = quanta if algo in scheduler.QUANTUM_ALGORITHMS else quanta[:1]
+            for q in algo_quanta:
+                scenario = dict(spec, algo=algo, quantum=q)
+                name = spec.get("name", f"scenario{index + 1}")
+                if len(algos) > 1 or len(algo_quanta) > 1:
+                    name = f"{name}-{algo}" + (f"-q{q}" if len(algo_quanta) > 1 else "")
+                name = _slug(name)
+                while name in names:
+                    name += "_"
+                names.add(name)
+                scenario["name"] = name
+                scenarios.append(scenario)
+    return scenarios
+
+
+def load_scenarios(path):
+    with open(path) as f:
+        specs = json.load(f)
+    if not isinstance(specs, list):
+        raise ValueError(f"{path}: expected a JSON list of scenarios")
+    return expand_scenarios(specs)
+
+
+def load_workload(spec):
+    """Return (arrival, burst, priority) for a scenario."""
+    if "trace" in spec:
+        import traces
+        return traces.load_trace(spec["trace"])
+    if "generate" in spec:
+        import workloads
+        arrays = workloads.generate_workload(spec["generate"], seed=spec.get("seed"))
+        return tuple(values.tolist() for values in arrays)
+    if "burst" not in spec:
+        raise ValueError(f"{spec['name']}: no workload (burst, trace or generate)")
+    burst = spec["burst"]
+    if not burst:
+        raise ValueError(f"{spec['name']}: the burst list is empty")
+    arrival = spec.get("arrival") or [0]*len(burst)
+    priority = spec.get("priority") or [0]*len(burst)
+    if len(arrival) != len(burst) or len(priority) != len(burst):
+        raise ValueError(f"{spec['name']}: burst, arrival and priority must have the same length")
+    return arrival, burst, priority
+
+
+def new_figure(figsize):
+    """A Figure that draws with Agg, whatever backend pyplot would pick."""
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def draw_gantt(result, title, theme=REPORT_THEME):
+    io = result["io"]
+    if io is not None:
+        segments, lanes = gantt.io_schedule(io)
+        num_lanes = len(lanes)
+    else:
+        segments = result["segments"]
+        lanes = None
+        num_lanes = len(result["smp"].core_busy) if result["smp"] is not None else 1
+    chart = gantt.GanttChart(theme, figsize=(12, max(4, 0.4 * num_lanes + 1)))
+    FigureCanvasAgg(chart.figure)
+    chart.update([f"P{i+1}" for i in range(len(result["ct"]))], segments, num_lanes, lanes)
+    chart.ax.set_title(title, fontsize=14, fontweight='bold', color=theme['title_fg'], pad=20)
+    return chart.figure
+
+
+def plot_metrics(figure, arrival, result, title=None, theme=REPORT_THEME):
+    """Histograms of waiting, turnaround and response time with p50/p95/p99 marked."""
+    figure.clear()
+    st, ct, wt, tat = result["st"], result["ct"], result["wt"], result["tat"]
+    # Waiting times are given, so no burst times are needed
+    stats = metrics.StreamingMetrics().add_result(arrival, None, st, ct, wt).summary()
+    values = {
+        "waiting": np.asarray(wt, dtype=np.float64),
+        "turnaround": np.asarray(tat, dtype=np.float64),
+        "response": np.asarray(st, dtype=np.float64) - np.asarray(arrival, dtype=np.float64),
+    }
+    axes = figure.subplots(1, len(values))
+    for ax, (name, data) in zip(axes, values.items()):
+        ax.hist(data, bins=min(50, max(1, len(np.unique(data)))), color='#45B7D1', edgecolor='white')
+        for p, style in ((50, '-'), (95, '--'), (99, ':')):
+            value = stats[name][f"p{p}"]
+            if value is not None:
+                ax.axvline(value, color='#FF6B6B', linestyle=style, label=f"p{p} {value:.1f}")
+        ax.set_title(f"{name.capitalize()} Time (mean {stats[name]['mean']:.2f})", fontsize=11,
+                     fontweight='bold', color=theme['title_fg'])
+        ax.set_facecolor(theme['output_bg'])
+        ax.tick_params(colors=theme['fg'])
+        ax.legend(fontsize=8)
+    if title:
+        figure.suptitle(title, fontsize=12, fontweight='bold', color=theme['title_fg'])
+    figure.patch.set_facecolor(theme['bg'])
+    figure.tight_layout()
+
+
+def _save(figure, out_dir, stem, formats, dpi):
+    paths = []
+    for fmt in formats:
+        path = os.path.join(out_dir, f"{stem}.{fmt}")
+        figure.savefig(path, format=fmt, dpi=dpi, facecolor=figure.get_facecolor())
+        paths.append(path)
+    return paths
+
+
+def render_scenario(scenario, out_dir, formats=("png",), dpi=100):
+    """Simulate one scenario and write its charts; returns its summary row and files."""
+    started = time.perf_counter()
+    arrival, burst, priority = load_workload(scenario)
+    options = {key: scenario[key] for key in RUN_OPTIONS if key in scenario}
+    result = runner.simulate(scenario["algo"], arrival, burst, priority, scenario.get("quantum", 2), **options)
+
+    name = scenario["name"]
+    title = f"{name}: {scenario['algo']}"
+    files = _save(draw_gantt(result, title), out_dir, f"{name}_gantt", formats, dpi)
+    figure = new_figure((14, 4))
+    plot_metrics(figure, arrival, result, title)
+    files += _save(figure, out_dir, f"{name}_metrics", formats, dpi)
+
+    row = compare.summarize(scenario["algo"], None, arrival, result["st"], result["ct"], result["wt"],
+                            result["tat"], result["overhead"])
+    row["label"] = name
+    return {"name": name, "row": row, "files": files, "elapsed": time.perf_counter() - started}
+
+
+def _render_task(task):
+    scenario, out_dir, formats, dpi = task
+    try:
+        return render_scenario(scenario, out_dir, formats, dpi)
+    except Exception as e:
+        # One bad scenario must not stop the rest of the batch
+        return {"name": scenario.get("name"), "error": f"{type(e).__name__}: {e}"}
+
+
+def _start_pool(workers):
+    # Forked workers skip re-importing matplotlib; they only ever draw with
+    # Agg, even when forked from the GUI. runner.start_method() avoids fork
+    # while other threads run. Workers are recycled now and then so
+    # matplotlib caches cannot pile up.
+    return multiprocessing.get_context(runner.start_method()).Pool(workers, maxtasksperchild=50)
+
+
+def render_batch(scenarios, out_dir, formats=("png",), jobs=None, dpi=100, summary=True, progress=None):
+    """
+    Render every scenario on a process pool and return one report per scenario.
+
+    `progress(done, total, report)` is called as each scenario finishes.
+    Failed scenarios report an "error" instead of files.
+    """
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format {fmt!r} (use {', '.join(FORMATS)})")
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(scenario, out_dir, tuple(formats), dpi) for scenario in scenarios]
+    workers = max(1, min(len(tasks), jobs or os.cpu_count() or 1))
+
+    reports = []
+    if workers == 1:
+        results = map(_render_task, tasks)
+        pool = None
+    else:
+        pool = _start_pool(workers)
+        results = pool.imap_unordered(_render_task, tasks, chunksize=1)
+    try:
+        for report in results:
+            reports.append(report)
+            if progress is not None:
+                progress(len(reports), len(tasks), report)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    # Keep the scenario order, not the completion order
+    order = {scenario["name"]: i for i, scenario in enumerate(scenarios)}
+    reports.sort(key=lambda report: order.get(report["name"], len(order)))
+    rows = [report["row"] for report in reports if "row" in report]
+    if summary and len(rows) > 1:
+        figure = new_figure((14, max(5, 0.3 * len(rows) + 1)))
+        compare.plot_comparison(figure, rows, REPORT_THEME)
+        _save(figure, out_dir, "summary", formats, dpi)
+        with open(os.path.join(out_dir, "summary.txt"), "w") as f:
+            f.write(compare.format_table(rows) + "\n")
+    return reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render Gantt charts and metric plots for many scenarios")
+    parser.add_argument("scenarios", help="JSON file with a list of scenarios")
+    parser.add_argument("--out", default="charts", help="output directory")
+    parser.add_argument("--format", default="png",
+                        help=f"comma-separated output formats ({', '.join(FORMATS)})")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--no-summary", action="store_true", help="skip the comparison chart")
+    args = parser.parse_args(argv)
+
+    try:
+        scenarios = load_scenarios(args.scenarios)
+    except (OSError, ValueError) as e:
+        parser.exit(2, f"error: could not load scenarios: {e}\n")
+    formats = [fmt.strip().lower() for fmt in args.format.split(",") if fmt.strip()]
+
+    def progress(done, total, report):
+        status = f"error: {report['error']}" if "error" in report else f"{report['elapsed']:.2f}s"
+        print(f"[{done}/{total}] {report['name']}: {status}", file=sys.stderr)
+
+    started = time.perf_counter()
+    try:
+        reports = render_batch(scenarios, args.out, formats, args.jobs, args.dpi, not args.no_summary, progress)
+    except ValueError as e:
+        parser.exit(2, f"error: {e}\n")
+    failed = sum("error" in report for report in reports)
+    print(f"Rendered {len(reports) - failed} of {len(reports)} scenarios to {args.out} "
+          f"in {time.perf_counter() - started:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Scaling benchmarks for the scheduling engine.
+
+Runs every algorithm in scheduler.ALGORITHMS over growing process counts,
+several arrival sparsities and, for the algorithms that take a quantum
+(Round Robin, MLFQ, CFS), several quanta, recording wall time and peak
+memory. Results are written as JSON and can be compared against a stored
+baseline to flag regressions.
+
+    python benchmark.py --out bench.json
+    python benchmark.py --baseline bench.json --out new.json
+    python benchmark.py --sizes 1000 10000 --plot curves.png
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import scheduler
+import workloads
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+# Mean arrivals per time unit; with a mean burst of 10, 1.0 keeps a long
+# ready queue while 0.01 leaves the CPU idle most of the time.
+DEFAULT_RATES = [1.0, 0.1, 0.01]
+DEFAULT_QUANTA = [1, 4, 16]
+
+
+def result_key(entry):
+    return f"{entry['algo']}|{entry['n']}|{entry['rate']}|{entry['quantum']}"
+
+
+def measure(algo, arrival, burst, priority, quantum, repeat):
+    """Return (best wall time in seconds, peak traced bytes) for one case."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        scheduler.schedule(algo, arrival, burst, priority, quantum)
+        best = min(best, time.perf_counter() - t0)
+
+    # Memory is traced in a separate run so tracing does not skew the timing
+    tracemalloc.start()
+    scheduler.schedule(algo, arrival, burst, priority, quantum)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_suite(sizes, rates, quanta, algorithms, repeat=3, seed=0, progress=None):
+    results = []
+    for n in sizes:
+        for rate in rates:
+            arrival, burst, priority = workloads.generate_workload(n, seed=seed, rate=rate)
+            arrival, burst, priority = arrival.tolist(), burst.tolist(), priority.tolist()
+            for algo in algorithms:
+                for quantum in (quanta if algo in scheduler.QUANTUM_ALGORITHMS else [None]):
+                    seconds, peak = measure(algo, arrival, burst, priority, quantum or 2, repeat)
+                    entry = {"algo": algo, "n": n, "rate": rate, "quantum": quantum,
+                             "seconds": seconds, "peak_bytes": peak}
+                    results.append(entry)
+                    if progress:
+                        progress(entry)
+    return results
+
+
+def find_regressions(results, baseline, tolerance=0.25, min_seconds=0.005):
+    """
+    Compare against baseline results and return a list of messages.
+
+    A case regresses when it is more than `tolerance` slower (or uses more
+    than `tolerance` more peak memory) than the baseline. Differences below
+    `min_seconds` are ignored as timer noise.
+    """
+    previous = {result_key(entry): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        old = previous.get(result_key(entry))
+        if old is None:
+            continue
+        if (entry["seconds"] > old["seconds"] * (1 + tolerance)
+                and entry["seconds"] - old["seconds"] > min_seconds):
+            regressions.append(f"{result_key(entry)}: time {old['seconds']:.4f}s -> {entry['seconds']:.4f}s")
+        if entry["peak_bytes"] > old["peak_bytes"] * (1 + tolerance):
+            regressions.append(f"{result_key(entry)}: peak memory {old['peak_bytes']} -> {entry['peak_bytes']} bytes")
+    return regressions
+
+
+def plot_curves(results, path):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    rates = sorted({entry["rate"] for entry in results}, reverse=True)
+    fig, axes = plt.subplots(1, len(rates), figsize=(6 * len(rates), 5), squeeze=False)
+    for ax, rate in zip(axes[0], rates):
+        curves = {}
+        for entry in results:
+            if entry["rate"] != rate:
+                continue
+            label = entry["algo"] if entry["quantum"] is None else f"{entry['algo']} (q={entry['quantum']})"
+            curves.setdefault(label, []).append((entry["n"], entry["seconds"]))
+        for label, points in curves.items():
+            points.sort()
+            ax.plot([n for n, _ in points], [s for _, s in points], marker="o", label=label)
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_title(f"Arrival rate {rate}")
+        ax.set_xlabel("Processes")
+        ax.set_ylabel("Wall time (s)")
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend(fontsize=8)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the CPU scheduling algorithms")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--rates", type=float, nargs="+", default=DEFAULT_RATES)
+    parser.add_argument("--quanta", type=int, nargs="+", default=DEFAULT_QUANTA)
+    parser.add_argument("--algo", nargs="+", default=list(scheduler.ALGORITHMS),
+                        choices=list(scheduler.ALGORITHMS), help="algorithms to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, best is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown before a case is a regression (default 0.25)")
+    parser.add_argument("--plot", help="save scaling curves to this image file")
+    args = parser.parse_args(argv)
+
+    def progress(entry):
+        quantum = "" if entry["quantum"] is None else f" q={entry['quantum']}"
+        print(f"{entry['algo'] + quantum:<28}{entry['n']:>10}{entry['rate']:>8}"
+              f"{entry['seconds']:>12.4f}s{entry['peak_bytes'] / 2**20:>10.1f} MiB", flush=True)
+
+    print(f"{'Algorithm':<28}{'n':>10}{'rate':>8}{'time':>13}{'peak':>14}")
+    results = run_suite(args.sizes, args.rates, args.quanta, args.algo, args.repeat, args.seed, progress)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.plot:
+        plot_curves(results, args.plot)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Memoization of scheduling runs keyed by a workload fingerprint.
+
+fingerprint() hashes the algorithm, the arrival, burst and priority arrays,
+the quantum and any other run options into a short digest. ResultCache keeps
+results for recent digests in memory, evicting the least recently used ones
+once an estimated memory budget is exceeded, and can optionally write every
+result to a directory so later sessions reuse it too.
+
+Every digest and the on-disk directory include engine_version(), a hash of
+CACHE_VERSION and the source of the engine modules, so results computed by
+an older engine are never served: they are simply misses.
+
+    results = cache.ResultCache(max_bytes=256 * 2**20, directory="~/.sched_cache")
+    result = results.get_or_run(runner.simulate, algo="FCFS", arrival=a, burst=b)
+"""
+import hashlib
+import importlib.util
+import os
+import pickle
+import sys
+from array import array
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+# Bump when the layout of cached results changes without an engine source change
+CACHE_VERSION = 1
+ENGINE_MODULES = ("scheduler", "multicore", "multiburst", "runner")
+
+_shared = None
+_engine_version = None
+
+
+def engine_version():
+    """Short digest of CACHE_VERSION and the engine modules' source."""
+    global _engine_version
+    if _engine_version is None:
+        digest = hashlib.blake2b(repr(CACHE_VERSION).encode(), digest_size=6)
+        for name in ENGINE_MODULES:
+            spec = importlib.util.find_spec(name)
+            if spec is not None and spec.origin and os.path.exists(spec.origin):
+                with open(spec.origin, "rb") as f:
+                    digest.update(f.read())
+        _engine_version = digest.hexdigest()
+    return _engine_version
+
+
+def _hash_sequence(digest, values):
+    if values is None:
+        digest.update(b"N")
+        return
+    try:
+        data = array('q', values).tobytes()
+        digest.update(b"Q")
+    except (TypeError, OverflowError):
+        # Floats or very large numbers; slower but still exact
+        data = repr(list(values)).encode()
+        digest.update(b"R")
+    digest.update(len(data).to_bytes(8, "little"))
+    digest.update(data)
+
+
+def fingerprint(algo, arrival, burst, priority=None, quantum=2, **options):
+    """Return a hex digest identifying one scheduling run."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(engine_version().encode())
+    digest.update(repr((algo, quantum, sorted(options.items()))).encode())
+    for values in (arrival, burst, priority):
+        _hash_sequence(digest, values)
+    return digest.hexdigest()
+
+
+def estimate_size(obj):
+    """
+    Rough in-memory size of a result in bytes.
+
+    Sequences are assumed homogeneous, so only their first element is
+    measured; this keeps the estimate O(depth) instead of O(n).
+    """
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        size = sys.getsizeof(obj)
+        if obj:
+            size += len(obj) * estimate_size(obj[0])
+        return size
+    if hasattr(obj, "__dict__"):
+        return sys.getsizeof(obj) + estimate_size(vars(obj))
+    return sys.getsizeof(obj)
+
+
+class ResultCache:
+    """LRU cache of results under a memory budget, with an optional disk tier."""
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        # One subdirectory per engine version; older ones are never read
+        self.directory = os.path.join(os.path.expanduser(directory), "v" + engine_version()) if directory else None
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries or (self.directory is not None and os.path.exists(self._path(key)))
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def get(self, key):
+        """Return the cached result for `key`, or None."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        result = self._load(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, result)
+        return result
+
+    def put(self, key, result):
+        self._remember(key, result)
+        if self.directory:
+            self._save(key, result)
+
+    def get_or_run(self, function, **job):
+        """Return function(**job), computing it only if the job is not cached."""
+        key = fingerprint(**job)
+        result = self.get(key)
+        if result is None:
+            result = function(**job)
+            self.put(key, result)
+        return result
+
+    def clear(self):
+        """Drop the in-memory tier; files on disk are kept."""
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def _remember(self, key, result):
+        size = estimate_size(result)
+        if size > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+        self.entries[key] = (result, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                version, result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError):
+            # Missing, damaged or written in another format
+            return None
+        return result if version == engine_version() else None
+
+    def _save(self, key, result):
+        path = self._path(key)
+        temp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp, "wb") as f:
+                pickle.dump((engine_version(), result), f, pickle.HIGHEST_PROTOCOL)
+            # Readers never see a half-written file
+            os.replace(temp, path)
+        except OSError:
+            if os.path.exists(temp):
+                os.remove(temp)
+
+
+def shared_cache():
+    """Process-wide cache; results also go to disk when SCHED_CACHE_DIR is set."""
+    global _shared
+    if _shared is None:
+        _shared = ResultCache(directory=os.environ.get("SCHED_CACHE_DIR"))
+    return _shared
@@ -0,0 +1,266 @@
+"""
+Capture the real CPU workload of this host as a scheduling trace.
+
+HostCapture samples every process's cumulative CPU time at a fixed
+interval. Each process is identified by (pid, start time), so reused pids
+are not confused. A stretch of consecutive samples in which a process used
+CPU becomes one job: it arrives when the stretch began (or when the process
+started, if that was during the capture) and its burst is the CPU time used.
+Processes that were already running when the capture began only count CPU
+used after it began.
+
+On Linux the sampler reads /proc/<pid>/stat directly: one small read per
+process, with no per-process objects kept between samples. Elsewhere it
+falls back to psutil, imported only then.
+
+The jobs replay through any algorithm, and the idle gaps between a process's
+stretches can become I/O bursts for multiburst.simulate():
+
+    capture = HostCapture(interval=0.5)
+    capture.run(30)
+    arrival, burst, priority = capture.jobs()
+    traces.write_csv("host.csv", zip(arrival, burst, priority))
+
+    python capture.py --duration 30 --out host.csv
+    python algo.py --algo rr --quantum 4 --trace host.csv
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+PROC = "/proc"
+DEFAULT_INTERVAL = 0.5
+DEFAULT_UNIT = 0.01                     # seconds per simulated time unit
+
+
+def _boot_time():
+    with open(os.path.join(PROC, "stat")) as f:
+        for line in f:
+            if line.startswith("btime"):
+                return int(line.split()[1])
+    raise OSError("No boot time in /proc/stat")
+
+
+def procfs_available():
+    return sys.platform.startswith("linux") and os.path.exists(os.path.join(PROC, "self", "stat"))
+
+
+class ProcfsReader:
+    """Reads (pid, start time) -> (CPU seconds, nice) for every process from /proc."""
+    def __init__(self):
+        self.ticks = os.sysconf("SC_CLK_TCK")
+        self.boot_time = _boot_time()
+
+    def read(self):
+        processes = {}
+        ticks = self.ticks
+        for entry in os.scandir(PROC):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"{PROC}/{entry.name}/stat", "rb") as f:
+                    data = f.read()
+            except OSError:
+                # The process exited between listing and reading
+                continue
+            # The command name may contain spaces and parentheses; the
+            # numeric fields start after the last ')'
+            fields = data[data.rfind(b")") + 2:].split()
+            cpu = (int(fields[11]) + int(fields[12])) / ticks
+            started = self.boot_time + int(fields[19]) / ticks
+            processes[(int(entry.name), round(started, 2))] = (cpu, int(fields[16]))
+        return processes
+
+
+class PsutilReader:
+    """The same readings through psutil, for systems without procfs."""
+    def __init__(self):
+        import psutil
+        self.psutil = psutil
+
+    def read(self):
+        processes = {}
+        for process in self.psutil.process_iter(["pid", "create_time", "cpu_times", "nice"]):
+            info = process.info
+            times = info["cpu_times"]
+            if times is None or info["create_time"] is None:
+                continue
+            nice = info["nice"] if isinstance(info["nice"], int) else 0
+            processes[(info["pid"], round(info["create_time"], 2))] = (times.user + times.system, nice)
+        return processes
+
+
+class HostCapture:
+    def __init__(self, interval=DEFAULT_INTERVAL, unit=DEFAULT_UNIT, reader=None, include_self=False):
+        if interval <= 0 or unit <= 0:
+            raise ValueError("Sampling interval and time unit must be positive")
+        self.interval = interval
+        self.unit = unit
+        self.reader = reader or (ProcfsReader() if procfs_available() else PsutilReader())
+        self.exclude = None if include_self else os.getpid()
+
+        self.started = None                 # wall-clock time of the first sample
+        self.samples = 0
+        self.last_time = 0.0                # seconds since the first sample
+        self.cpu = {}                       # key -> CPU seconds at the last sample
+        self.nice = {}
+        self.active = set()                 # keys that used CPU in the last interval
+        self.stretches = {}                 # key -> [[start, cpu seconds], ...]
+
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def sample(self):
+        """Take one sample now."""
+        now = time.time()
+        readings = self.reader.read()
+        with self._lock:
+            if self.started is None:
+                self.started = now
+                for key, (cpu, nice) in readings.items():
+                    self.cpu[key] = cpu
+                    self.nice[key] = nice
+                self.samples = 1
+                return
+            elapsed = now - self.started
+            previous = self.last_time
+            active = set()
+            for key, (cpu, nice) in readings.items():
+                if key[0] == self.exclude:
+                    continue
+                old = self.cpu.get(key)
+                if old is None:
+                    # Started during the capture: all of its CPU time is new
+                    old = 0.0
+                    begin = min(max(key[1] - self.started, previous), elapsed)
+                else:
+                    begin = previous
+                self.cpu[key] = cpu
+                self.nice[key] = nice
+                used = cpu - old
+                if used <= 0:
+                    continue
+                active.add(key)
+                stretches = self.stretches.setdefault(key, [])
+                if key in self.active and stretches:
+                    stretches[-1][1] += used
+                else:
+                    stretches.append([begin, used])
+            # Forget processes that have exited
+            if len(self.cpu) > len(readings):
+                for key in self.cpu.keys() - readings.keys():
+                    del self.cpu[key]
+            self.active = active
+            self.last_time = elapsed
+            self.samples += 1
+
+    def run(self, duration):
+        """Sample for `duration` seconds, blocking."""
+        end = time.monotonic() + duration
+        self.sample()
+        while True:
+            left = end - time.monotonic()
+            if left <= 0:
+                break
+            time.sleep(min(self.interval, left))
+            self.sample()
+
+    def start(self):
+        """Sample on a background thread until stop()."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        self.sample()
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        # Close the last interval so CPU used since the previous sample counts
+        self.sample()
+
+    @property
+    def elapsed(self):
+        return self.last_time
+
+    @property
+    def process_count(self):
+        return len(self.stretches)
+
+    def _units(self, seconds):
+        return int(round(seconds / self.unit))
+
+    def jobs(self, min_burst=1):
+        """(arrival, burst, priority) lists, one job per stretch, sorted by arrival."""
+        with self._lock:
+            rows = []
+            for key, stretches in self.stretches.items():
+                for begin, used in stretches:
+                    burst = self._units(used)
+                    if burst >= min_burst:
+                        rows.append((self._units(begin), burst, self.nice.get(key, 0)))
+        rows.sort()
+        return [row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows]
+
+    def processes(self, min_burst=1):
+        """
+        (arrival, bursts, priority) with one multi-burst process per captured process.
+
+        The idle time between two stretches becomes an I/O burst, so the
+        result replays through multiburst.simulate().
+        """
+        with self._lock:
+            rows = []
+            for key, stretches in self.stretches.items():
+                bursts = []
+                cpu_end = 0
+                for begin, used in stretches:
+                    burst = self._units(used)
+                    if burst < min_burst:
+                        continue
+                    start = self._units(begin)
+                    if bursts:
+                        bursts.append(max(1, start - cpu_end))
+                    else:
+                        arrival = start
+                    bursts.append(burst)
+                    cpu_end = start + burst
+                if bursts:
+                    rows.append((arrival, bursts, self.nice.get(key, 0)))
+        rows.sort(key=lambda row: row[0])
+        return [row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Capture this host's CPU workload as a scheduling trace")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to sample")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between samples")
+    parser.add_argument("--unit", type=float, default=DEFAULT_UNIT, help="seconds per trace time unit")
+    parser.add_argument("--psutil", action="store_true", help="sample through psutil even if /proc exists")
+    parser.add_argument("--out", required=True, help="trace file (.trc for the binary format, else CSV)")
+    args = parser.parse_args(argv)
+
+    import traces
+    capture = HostCapture(args.interval, args.unit, PsutilReader() if args.psutil else None)
+    print(f"Sampling for {args.duration:g}s every {args.interval:g}s...", file=sys.stderr)
+    capture.run(args.duration)
+    arrival, burst, priority = capture.jobs()
+    write = traces.write_binary if args.out.endswith(".trc") else traces.write_csv
+    count = write(args.out, zip(arrival, burst, priority))
+    print(f"Wrote {count} jobs from {capture.process_count} processes to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
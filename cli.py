@@ -0,0 +1,212 @@
+"""
+Command-line front end for the scheduling engine.
+
+Runs one algorithm on a trace, inline lists or a generated workload and
+writes per-process results as CSV, without importing tkinter, matplotlib
+or any other GUI library, so it starts quickly on headless servers.
+
+    python algo.py --algo rr --quantum 4 --trace jobs.csv --out result.csv
+    python cli.py --algo srtf --burst 5,3,8 --arrival 0,1,2
+    python cli.py --algo mlfq --quantum 2,4,8 --boost 50 --generate 100000 --seed 1
+    python cli.py --algo cfs --capture 10
+"""
+import argparse
+import csv
+import sys
+import time
+
+import multicore
+import metrics
+import runner
+import scheduler
+import traces
+
+ALIASES = {
+    "fcfs": "FCFS",
+    "sjf": "SJF with AT",
+    "sjf-at": "SJF with AT",
+    "sjf-noat": "SJF without AT",
+    "priority": "Priority Scheduling",
+    "rr": "Round Robin",
+    "srtf": "SRTF",
+    "pp": "Preemptive Priority",
+    "preemptive-priority": "Preemptive Priority",
+    "mlfq": "MLFQ",
+    "cfs": "CFS",
+}
+
+RESULT_HEADER = ["process", "arrival", "burst", "priority", "start", "completion",
+                 "waiting", "turnaround", "response"]
+
+
+def algorithm_name(text):
+    """Map an alias or a case-insensitive full name to a scheduler.ALGORITHMS key."""
+    lowered = text.strip().lower()
+    if lowered in ALIASES:
+        return ALIASES[lowered]
+    for name in scheduler.ALGORITHMS:
+        if name.lower() == lowered:
+            return name
+    choices = ", ".join(sorted(ALIASES))
+    raise argparse.ArgumentTypeError(f"unknown algorithm {text!r} (aliases: {choices})")
+
+
+def int_list(text):
+    try:
+        values = [int(value) for value in text.split(",") if value.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got {text!r}")
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected at least one integer, got {text!r}")
+    return values
+
+
+def positive_int_list(text):
+    values = int_list(text)
+    if min(values) <= 0:
+        raise argparse.ArgumentTypeError(f"expected positive integers, got {text!r}")
+    return values
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run a CPU scheduling algorithm without the GUI")
+    parser.add_argument("--algo", type=algorithm_name, required=True,
+                        help="fcfs, sjf, sjf-noat, priority, rr, srtf, pp, mlfq, cfs or a full algorithm name")
+    parser.add_argument("--quantum", type=positive_int_list, default=[2],
+                        help="time quantum; a comma-separated list gives the MLFQ level quanta")
+    parser.add_argument("--boost", type=int, help="MLFQ priority boost interval")
+    parser.add_argument("--latency", type=int, help="CFS target latency")
+    parser.add_argument("--switch-cost", type=int, default=0, help="context-switch cost")
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--trace", help="CSV or binary trace file")
+    source.add_argument("--burst", type=positive_int_list, help="comma-separated burst times")
+    source.add_argument("--generate", type=int, metavar="N", help="generate a synthetic workload of N jobs")
+    source.add_argument("--capture", type=float, metavar="SECONDS",
+                        help="sample this host's processes for SECONDS and replay what ran")
+    parser.add_argument("--arrival", type=int_list, help="comma-separated arrival times (with --burst)")
+    parser.add_argument("--priority", type=int_list, help="comma-separated priorities (with --burst)")
+    parser.add_argument("--seed", type=int, default=42, help="seed for --generate")
+
+    parser.add_argument("--cores", type=int, default=1)
+    parser.add_argument("--queue-mode", choices=multicore.QUEUE_MODES, default=multicore.GLOBAL)
+    parser.add_argument("--work-stealing", action="store_true")
+    parser.add_argument("--balance", type=int, help="load balancing interval (per-core queues)")
+    parser.add_argument("--migration-penalty", type=int, default=0)
+
+    parser.add_argument("--out", help="write per-process results as CSV ('-' for stdout)")
+    parser.add_argument("--segments", help="write execution segments as CSV")
+    parser.add_argument("--quiet", action="store_true", help="do not print the summary")
+    return parser
+
+
+def load_workload(args, parser):
+    if args.trace:
+        return traces.load_trace(args.trace)
+    if args.capture is not None:
+        import capture
+        host = capture.HostCapture()
+        host.run(args.capture)
+        return host.jobs()
+    if args.generate is not None:
+        # NumPy is only needed here
+        import workloads
+        arrays = workloads.generate_workload(args.generate, seed=args.seed)
+        return tuple(values.tolist() for values in arrays)
+
+    burst = args.burst
+    arrival = args.arrival if args.arrival is not None else [0]*len(burst)
+    priority = args.priority if args.priority is not None else [0]*len(burst)
+    if len(arrival) != len(burst) or len(priority) != len(burst):
+        parser.error("--burst, --arrival and --priority must have the same length")
+    return arrival, burst, priority
+
+
+def write_results(path, arrival, burst, priority, result):
+    f = sys.stdout if path == "-" else open(path, "w", newline="")
+    try:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_HEADER)
+        writer.writerows(
+            (f"P{i+1}", a, b, p, s, c, w, t, s - a)
+            for i, (a, b, p, s, c, w, t) in enumerate(zip(arrival, burst, priority, result["st"],
+                                                           result["ct"], result["wt"], result["tat"])))
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+def write_segments(path, segments):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        if segments and len(segments[0]) == 4:
+            writer.writerow(["process", "core", "start", "end"])
+            writer.writerows((f"P{pid+1}", core, start, end) for pid, core, start, end in segments)
+        else:
+            writer.writerow(["process", "start", "end"])
+            writer.writerows((f"P{pid+1}", start, end) for pid, start, end in segments)
+
+
+def summary_lines(algo, arrival, burst, result, elapsed):
+    n = len(burst)
+    makespan = max(result["ct"], default=0)
+    lines = [
+        f"{algo}: {n} processes simulated in {elapsed:.3f}s",
+        f"  Average Waiting Time: {sum(result['wt']) / n:.2f}" if n else "  No processes",
+        f"  Average Turnaround Time: {sum(result['tat']) / n:.2f}" if n else "",
+        f"  Throughput: {n / makespan if makespan > 0 else 0:.4f} processes/unit time",
+    ]
+    lines.extend(metrics.StreamingMetrics().add_result(arrival, burst, result["st"], result["ct"]).format_lines())
+    overhead = result["overhead"]
+    if overhead["time"]:
+        lines.append(f"  Context switches: {overhead['switches']}, overhead {overhead['time']}, "
+                     f"CPU efficiency {overhead['efficiency']*100:.2f}%")
+    smp = result["smp"]
+    if smp is not None:
+        lines.append(f"  Migrations: {smp.migrations} (work steals: {smp.steals})")
+        for core, util in enumerate(smp.utilization):
+            lines.append(f"  Core {core}: {util*100:6.2f}% busy")
+    return [line for line in lines if line]
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        arrival, burst, priority = load_workload(args, parser)
+    except (OSError, ValueError) as e:
+        parser.exit(2, f"error: could not load workload: {e}\n")
+
+    quantum = args.quantum if args.algo == "MLFQ" and len(args.quantum) > 1 else args.quantum[0]
+    options = {}
+    if args.boost is not None:
+        if args.algo != "MLFQ":
+            parser.error("--boost only applies to MLFQ")
+        options["boost_interval"] = args.boost
+    if args.latency is not None:
+        if args.algo != "CFS":
+            parser.error("--latency only applies to CFS")
+        options["target_latency"] = args.latency
+
+    t0 = time.perf_counter()
+    try:
+        result = runner.simulate(args.algo, arrival, burst, priority, quantum, args.cores, args.queue_mode,
+                                 args.work_stealing, args.balance, args.switch_cost, args.migration_penalty,
+                                 **options)
+    except ValueError as e:
+        parser.exit(2, f"error: {e}\n")
+    elapsed = time.perf_counter() - t0
+
+    if args.out:
+        write_results(args.out, arrival, burst, priority, result)
+    if args.segments:
+        write_segments(args.segments, result["segments"])
+    if not args.quiet:
+        # Keep stdout clean for the CSV when it goes there
+        stream = sys.stderr if args.out == "-" else sys.stdout
+        print("\n".join(summary_lines(args.algo, arrival, burst, result, elapsed)), file=stream)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
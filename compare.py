@@ -0,0 +1,194 @@
+"""
+Run every scheduling algorithm on the same workload in parallel.
+
+Each algorithm, plus a sweep of Round Robin quanta, becomes one task in a
+process pool. MLFQ and CFS run at the quantum the user entered, with any
+per-algorithm options (MLFQ boost interval, CFS target latency). Tasks
+carry only (algorithm, quantum); the workload and options reach the
+workers once, either inherited through fork or passed to the pool
+initializer, and never per task. Workers send back summary metrics only,
+so the result transfer is tiny regardless of the workload size. A
+context-switch cost applies to every case, so small quanta pay for the
+switches they cause.
+"""
+import multiprocessing
+import os
+import time
+
+import metrics
+import runner
+import scheduler
+
+DEFAULT_QUANTA = [1, 2, 4, 8, 16]
+# How per-algorithm options appear in row labels
+OPTION_NAMES = {"boost_interval": "boost", "target_latency": "latency"}
+
+_workload = None
+
+
+def _init_worker(workload):
+    global _workload
+    _workload = workload
+
+
+def _quantum_text(quantum):
+    # MLFQ may have one quantum per level
+    if isinstance(quantum, (list, tuple)):
+        return ",".join(map(str, quantum))
+    return quantum
+
+
+def _label(algo, quantum, options=None):
+    settings = [] if quantum is None else [f"q={_quantum_text(quantum)}"]
+    settings += [f"{OPTION_NAMES.get(key, key)}={value}" for key, value in sorted((options or {}).items())]
+    return f"{algo} ({', '.join(settings)})" if settings else algo
+
+
+def summarize(algo, quantum, arrival, st, ct, wt, tat, overhead=None):
+    n = len(ct)
+    makespan = max(ct) if n else 0
+    waiting = metrics.QuantileSketch()
+    response = metrics.QuantileSketch()
+    for w, s, a in zip(wt, st, arrival):
+        waiting.add(w)
+        response.add(s - a)
+    return {
+        "algo": algo,
+        "quantum": quantum,
+        "label": _label(algo, quantum),
+        "avg_waiting": sum(wt) / n if n else 0.0,
+        "avg_turnaround": sum(tat) / n if n else 0.0,
+        "avg_response": sum(s - a for s, a in zip(st, arrival)) / n if n else 0.0,
+        "p95_waiting": waiting.quantile(0.95) or 0,
+        "p95_response": response.quantile(0.95) or 0,
+        "throughput": n / makespan if makespan > 0 else 0.0,
+        "makespan": makespan,
+        "overhead": overhead["time"] if overhead else 0,
+        "efficiency": overhead["efficiency"] if overhead else 1.0,
+    }
+
+
+def _run_case(case):
+    algo, quantum = case
+    arrival, burst, priority, switch_cost, options = _workload
+    extra = options.get(algo, {})
+    switches = []
+    st, ct, wt, tat = scheduler.schedule(algo, arrival, burst, priority, 2 if quantum is None else quantum,
+                                         switch_cost=switch_cost, switches=switches, **extra)
+    row = summarize(algo, quantum, arrival, st, ct, wt, tat, scheduler.overhead_summary(burst, switches))
+    row["label"] = _label(algo, quantum, extra)
+    return row
+
+
+def comparison_cases(quanta=DEFAULT_QUANTA, quantum=2):
+    """Every algorithm once, with Round Robin once per quantum in `quanta`."""
+    cases = []
+    for algo in scheduler.ALGORITHMS:
+        if algo == "Round Robin":
+            continue
+        if algo not in scheduler.QUANTUM_ALGORITHMS:
+            cases.append((algo, None))
+        elif algo == "CFS" and isinstance(quantum, (list, tuple)):
+            # Per-level quanta only mean something to MLFQ
+            cases.append((algo, quantum[0]))
+        else:
+            cases.append((algo, quantum))
+    return cases + [("Round Robin", q) for q in quanta]
+
+
+def _start_pool(workload, tasks):
+    global _workload
+    workers = max(1, min(len(tasks), os.cpu_count() or 1))
+    method = runner.start_method()
+    if method == "fork":
+        # Forked workers inherit the workload with the parent's memory
+        _workload = workload
+        try:
+            pool = multiprocessing.get_context(method).Pool(workers)
+        finally:
+            _workload = None
+    else:
+        pool = multiprocessing.get_context(method).Pool(workers, _init_worker, (workload,))
+    return pool
+
+
+class Comparison:
+    """A comparison running on a process pool; poll() it from the Tk loop."""
+    def __init__(self, arrival, burst, priority=None, quanta=DEFAULT_QUANTA, switch_cost=0, quantum=2,
+                 options=None):
+        """`options` maps an algorithm name to extra scheduler.schedule() keywords for it."""
+        if priority is None:
+            priority = [0]*len(burst)
+        self.cases = comparison_cases(quanta, quantum)
+        self.started = time.perf_counter()
+        self.pool = _start_pool((arrival, burst, priority, switch_cost, options or {}), self.cases)
+        self.pending = self.pool.map_async(_run_case, self.cases, chunksize=1)
+        self.pool.close()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def poll(self):
+        """Return ("done", rows) or ("error", message) once finished, else None."""
+        if not self.pending.ready():
+            return None
+        self.pool.join()
+        try:
+            return ("done", self.pending.get())
+        except Exception as e:
+            return ("error", str(e))
+
+    def cancel(self):
+        self.pool.terminate()
+        self.pool.join()
+
+
+def compare_all(arrival, burst, priority=None, quanta=DEFAULT_QUANTA, switch_cost=0, quantum=2, options=None):
+    """Blocking comparison for scripts; returns one summary dict per case."""
+    comparison = Comparison(arrival, burst, priority, quanta, switch_cost, quantum, options)
+    try:
+        rows = comparison.pending.get()
+    finally:
+        comparison.cancel()
+    return rows
+
+
+def format_table(rows):
+    # The efficiency column only appears when switching cost anything
+    overhead = any(row["overhead"] for row in rows)
+    lines = [f"{'Algorithm':<28}{'Avg Waiting':>14}{'p95 Waiting':>14}{'Avg Turnaround':>16}"
+             f"{'Avg Response':>14}{'p95 Response':>14}{'Throughput':>12}" + (f"{'Efficiency':>12}" if overhead else ""),
+             "-"*(124 if overhead else 112)]
+    for row in rows:
+        lines.append(f"{row['label']:<28}{row['avg_waiting']:>14.2f}{row['p95_waiting']:>14.2f}"
+                     f"{row['avg_turnaround']:>16.2f}{row['avg_response']:>14.2f}{row['p95_response']:>14.2f}"
+                     f"{row['throughput']:>12.4f}" + (f"{row['efficiency'] * 100:>11.1f}%" if overhead else ""))
+    return "\n".join(lines)
+
+
+def plot_comparison(figure, rows, theme=None):
+    """Draw average waiting, turnaround and throughput bars on `figure`."""
+    figure.clear()
+    labels = [row["label"] for row in rows]
+    metrics = [("avg_waiting", "Average Waiting Time"),
+               ("avg_turnaround", "Average Turnaround Time"),
+               ("throughput", "Throughput (processes/unit time)")]
+    axes = figure.subplots(1, len(metrics), sharey=True)
+    for ax, (key, title) in zip(axes, metrics):
+        values = [row[key] for row in rows]
+        best = min(values) if key != "throughput" else max(values)
+        colors = ['#52B788' if value == best else '#45B7D1' for value in values]
+        ax.barh(range(len(rows)), values, color=colors)
+        ax.set_title(title, fontsize=11, fontweight='bold')
+        ax.grid(axis='x', alpha=0.3, linestyle='--')
+        if theme is not None:
+            ax.set_facecolor(theme['output_bg'])
+            ax.tick_params(colors=theme['fg'])
+            ax.title.set_color(theme['title_fg'])
+    axes[0].set_yticks(range(len(rows)))
+    axes[0].set_yticklabels(labels, fontsize=9)
+    axes[0].invert_yaxis()
+    if theme is not None:
+        figure.patch.set_facecolor(theme['bg'])
+    figure.tight_layout()
@@ -0,0 +1,279 @@
+"""
+Collection-based Gantt chart renderer for large schedules.
+
+All execution segments are kept in NumPy arrays and drawn through a single
+PolyCollection instead of one Rectangle patch per slice. When the view
+changes (pan or zoom) only the segments inside the visible time window are
+rebuilt, slices narrower than a pixel are merged per lane, and text labels
+are shown only while they fit. This keeps million-segment schedules
+interactive. The module needs matplotlib but not tkinter.
+"""
+from itertools import chain
+
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+from matplotlib.ticker import AutoLocator
+
+COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8',
+          '#F7DC6F', '#BB8FCE', '#85C1E2', '#F8B739', '#52B788']
+
+LANE_HEIGHT = 0.8
+MAX_LABELS = 60
+
+
+class GanttRenderer:
+    """Draws (pid, lane, start, end) segments on a matplotlib Axes."""
+    def __init__(self, ax, labels=None, max_bars=None, edgecolor='black'):
+        self.ax = ax
+        self.labels = labels
+        self.max_bars = max_bars
+        self.palette = to_rgba_array(COLORS)
+        self.collection = PolyCollection([], edgecolors=edgecolor, linewidths=0.5)
+        ax.add_collection(self.collection)
+        self.texts = []
+        self.num_lanes = 1
+        self._set_arrays(np.empty(0, np.int64), np.empty(0, np.int64),
+                         np.empty(0), np.empty(0))
+        self._callback = ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+
+    def set_segments(self, pids, starts, ends, lanes=None, num_lanes=None):
+        pids = np.asarray(pids, dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        lanes = np.zeros(pids.size, np.int64) if lanes is None else np.asarray(lanes, dtype=np.int64)
+        self.num_lanes = num_lanes or (int(lanes.max()) + 1 if lanes.size else 1)
+        order = np.argsort(starts, kind="stable")
+        self._set_arrays(pids[order], lanes[order], starts[order], ends[order])
+
+        end = float(self.ends_max[-1]) if self.ends.size else 1.0
+        self.ax.set_ylim(self.num_lanes - 1 + 0.6, -0.6)
+        # Changing the limits fires xlim_changed, which redraws the bars
+        self.ax.set_xlim(0, end + max(2, end * 0.01))
+
+    def set_schedule(self, segments, num_lanes=None):
+        """Accept scheduler (pid, start, end) or multicore (pid, core, start, end) tuples."""
+        if not segments:
+            self.set_segments([], [], [], num_lanes=num_lanes)
+            return
+        width = len(segments[0])
+        table = np.fromiter(chain.from_iterable(segments), dtype=np.float64,
+                            count=width * len(segments)).reshape(-1, width)
+        if width == 3:
+            self.set_segments(table[:, 0], table[:, 1], table[:, 2], num_lanes=num_lanes)
+        else:
+            self.set_segments(table[:, 0], table[:, 2], table[:, 3], table[:, 1], num_lanes)
+
+    def _set_arrays(self, pids, lanes, starts, ends):
+        self.pids = pids
+        self.lanes = lanes
+        self.starts = starts
+        self.ends = ends
+        # Running max of end times lets the left edge of the view be found
+        # with a binary search even though segments are sorted by start
+        self.ends_max = np.maximum.accumulate(ends) if ends.size else ends
+
+    def visible_range(self):
+        x0, x1 = self.ax.get_xlim()
+        lo = int(np.searchsorted(self.ends_max, x0, side="right"))
+        hi = int(np.searchsorted(self.starts, x1, side="right"))
+        return lo, max(lo, hi)
+
+    def _pixel_width(self):
+        x0, x1 = self.ax.get_xlim()
+        width_px = max(1.0, self.ax.get_window_extent().width)
+        return (x1 - x0) / width_px, int(width_px)
+
+    def _merge_subpixel(self, pids, lanes, starts, ends, px):
+        # Bucket slices by (lane, pixel column); each bucket becomes one bar
+        # spanning its slices, coloured like the first slice in it.
+        x0 = self.ax.get_xlim()[0]
+        column = np.floor((starts - x0) / px).astype(np.int64)
+        column -= column.min()
+        key = lanes * (int(column.max()) + 1) + column
+        order = np.argsort(key, kind="stable")
+        key = key[order]
+        first = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        merged_ends = np.maximum.reduceat(ends[order], first)
+        idx = order[first]
+        return pids[idx], lanes[idx], starts[idx], merged_ends
+
+    def refresh(self):
+        lo, hi = self.visible_range()
+        pids = self.pids[lo:hi]
+        lanes = self.lanes[lo:hi]
+        starts = self.starts[lo:hi]
+        ends = self.ends[lo:hi]
+
+        px, width_px = self._pixel_width()
+        limit = self.max_bars or 4 * width_px * self.num_lanes
+        if pids.size > limit:
+            pids, lanes, starts, ends = self._merge_subpixel(pids, lanes, starts, ends, px)
+
+        top = lanes - LANE_HEIGHT / 2
+        bottom = lanes + LANE_HEIGHT / 2
+        verts = np.stack([np.stack([starts, top], axis=1),
+                          np.stack([starts, bottom], axis=1),
+                          np.stack([ends, bottom], axis=1),
+                          np.stack([ends, top], axis=1)], axis=1)
+        self.collection.set_verts(verts)
+        self.collection.set_facecolors(self.palette[pids % len(self.palette)])
+        self.collection.set_edgecolor('black' if pids.size <= width_px else 'none')
+
+        for text in self.texts:
+            text.remove()
+        self.texts = []
+        if self.labels is not None and pids.size <= MAX_LABELS:
+            wide = (ends - starts) >= 20 * px
+            for pid, lane, start, end in zip(pids[wide], lanes[wide], starts[wide], ends[wide]):
+                self.texts.append(self.ax.text((start + end) / 2, lane, self.labels[pid],
+                                               ha='center', va='center', fontsize=9,
+                                               fontweight='bold', color='black', clip_on=True))
+        self.ax.figure.canvas.draw_idle()
+
+    def _on_xlim_changed(self, ax):
+        self.refresh()
+
+    def disconnect(self):
+        self.ax.callbacks.disconnect(self._callback)
+
+
+def io_schedule(io):
+    """Segments and lane names for a multiburst.IOResult: the CPU, then one lane per device."""
+    segments = [(pid, 0, start, end) for pid, start, end in io.segments]
+    segments += [(pid, device + 1, start, end) for pid, device, start, end in io.device_segments]
+    return segments, ["CPU"] + [f"Device {device}" for device in range(len(io.device_busy))]
+
+
+class GanttChart:
+    """
+    One persistent Figure holding a Gantt chart, updated in place between runs.
+
+    The Figure is created directly rather than through pyplot, so pyplot
+    never holds a reference to it and nothing accumulates across runs.
+    """
+    def __init__(self, theme, figsize=(12, 4)):
+        self.figure = Figure(figsize=figsize)
+        self.figure.patch.set_facecolor(theme['bg'])
+        self.ax = self.figure.add_subplot()
+        self.ax.set_facecolor(theme['output_bg'])
+        self.renderer = GanttRenderer(self.ax)
+
+        self.ax.set_xlabel('Time', fontsize=12, fontweight='bold', color=theme['fg'])
+        self.ax.set_title('Process Execution Timeline (Gantt Chart)', fontsize=14, fontweight='bold',
+                          color=theme['title_fg'], pad=20)
+        self.ax.spines['top'].set_visible(False)
+        self.ax.spines['right'].set_visible(False)
+        self.ax.spines['left'].set_visible(False)
+        self.ax.tick_params(colors=theme['fg'])
+        self.ax.grid(axis='x', alpha=0.3, linestyle='--')
+
+    def update(self, processes, segments, num_lanes=1, lane_names=None):
+        self.renderer.labels = processes
+        self.renderer.set_schedule(segments, num_lanes)
+
+        if num_lanes > 1:
+            self.ax.set_yticks(range(num_lanes))
+            self.ax.set_yticklabels(lane_names or [f"Core {core}" for core in range(num_lanes)])
+        else:
+            self.ax.set_yticks([])
+
+        # Mark every slice boundary while there are few enough to read
+        if len(segments) <= 30:
+            self.ax.set_xticks(sorted({0} | {seg[-2] for seg in segments} | {seg[-1] for seg in segments}))
+        else:
+            self.ax.xaxis.set_major_locator(AutoLocator())
+
+        self.figure.tight_layout()
+
+    def artist_count(self):
+        """Artists owned by the chart, not counting the (at most MAX_LABELS) slice labels."""
+        labels = len(self.renderer.texts)
+        return len(self.figure.get_children()) + len(self.ax.get_children()) - labels
+
+
+# Traced memory a warmed-up chart may gain over a check_bounded() run
+MAX_MEMORY_GROWTH = 1 * 2**20
+WARM_UP_RUNS = 10
+
+
+def check_bounded(runs=300, processes=50):
+    """
+    Update one GanttChart `runs` times and return its resource counts.
+
+    Runs alternate between a few wide slices, which get text labels, and a
+    long Round Robin schedule, which gets none, so labels are created and
+    removed throughout. The returned dict holds the pyplot figure count and
+    the chart's artist count after the first and the last run, the fewest
+    and most artists and slice labels seen after any run, and the traced
+    memory growth after the first WARM_UP_RUNS runs (font and text layout
+    caches fill during those). check_failures() lists what went wrong.
+    """
+    import random
+    import tracemalloc
+    import matplotlib.pyplot as plt
+    import scheduler
+
+    theme = {'bg': '#2E3440', 'fg': '#D8DEE9', 'title_fg': '#88C0D0', 'output_bg': '#3B4252'}
+    chart = GanttChart(theme)
+    rng = random.Random(0)
+    labels = [f"P{i+1}" for i in range(processes)]
+    artists = []
+    label_counts = []
+    tracemalloc.start()
+    for run in range(runs):
+        segments = []
+        if run % 2:
+            arrival = [rng.randint(0, 100) for _ in range(processes)]
+            burst = [rng.randint(1, 10) for _ in range(processes)]
+            scheduler.round_robin(arrival, burst, rng.randint(1, 4), segments)
+        else:
+            count = rng.randint(3, 8)
+            scheduler.fcfs([0]*count, [rng.randint(5, 20) for _ in range(count)], segments)
+        chart.update(labels, segments)
+        chart.figure.canvas.draw()
+        artists.append(chart.artist_count())
+        label_counts.append(len(chart.renderer.texts))
+        if run == 0:
+            first = (len(plt.get_fignums()), chart.artist_count())
+        if run == min(WARM_UP_RUNS, runs) - 1:
+            baseline, _ = tracemalloc.get_traced_memory()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'first': first,
+        'last': (len(plt.get_fignums()), chart.artist_count()),
+        'artists': (min(artists), max(artists)),
+        'labels': (min(label_counts), max(label_counts)),
+        'memory_growth': current - baseline,
+    }
+
+
+def check_failures(counts):
+    """Messages for every bound check_bounded() counts break; empty when all hold."""
+    failures = []
+    if counts['first'] != counts['last'] or counts['artists'][0] != counts['artists'][1]:
+        failures.append(f"chart artists changed between runs: {counts['artists']}")
+    if counts['labels'][1] == 0:
+        failures.append("no run drew slice labels, so the label limit was not exercised")
+    if counts['labels'][1] > MAX_LABELS:
+        failures.append(f"{counts['labels'][1]} slice labels at once (limit {MAX_LABELS})")
+    if counts['memory_growth'] > MAX_MEMORY_GROWTH:
+        failures.append(f"traced memory grew by {counts['memory_growth'] / 1024:.1f} KiB "
+                        f"(limit {MAX_MEMORY_GROWTH / 1024:.0f} KiB)")
+    return failures
+
+
+if __name__ == "__main__":
+    import matplotlib
+    matplotlib.use("Agg")
+    counts = check_bounded()
+    print(f"pyplot figures / chart artists after first run: {counts['first']}")
+    print(f"pyplot figures / chart artists after last run:  {counts['last']}")
+    print(f"fewest / most chart artists after any run: {counts['artists']}")
+    print(f"fewest / most slice labels at once: {counts['labels']} (limit {MAX_LABELS})")
+    print(f"traced memory growth after warm-up: {counts['memory_growth'] / 1024:.1f} KiB")
+    failures = check_failures(counts)
+    if failures:
+        raise SystemExit("Gantt chart resources are not bounded:\n" + "\n".join(failures))
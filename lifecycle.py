@@ -0,0 +1,90 @@
+"""
+Lifecycle of the suite's tool windows.
+
+WindowManager opens each tool in its own Toplevel and follows the window
+from then on:
+
+* minimized or withdrawn (unmapped): the tool's pause() is called, so it
+  stops sampling and redrawing until the window is shown again (resume());
+* closed: the tool's close() is called once, then the window is destroyed,
+  so timers, animations, threads and figures go away with it;
+* opened again while open: with single_instance the existing window is
+  raised instead of starting a second copy of the same samplers.
+
+pause(), resume() and close() are all optional; tools without background
+work need none of them. With every monitor hidden or closed, nothing in the
+suite wakes up on a timer, so it uses no CPU while idle.
+"""
+import tkinter as tk
+
+
+class WindowManager:
+    def __init__(self, root, single_instance=True):
+        self.root = root
+        self.single_instance = single_instance
+        self.tools = {}                     # window -> [key, app, paused]
+
+    def open(self, key, factory, single_instance=None):
+        """Open factory(Toplevel) as tool `key`, or raise its window if it is already open."""
+        single = self.single_instance if single_instance is None else single_instance
+        if single:
+            existing = self.find(key)
+            if existing is not None:
+                self.show(existing)
+                return self.tools[existing][1]
+        window = tk.Toplevel(self.root)
+        app = factory(window)
+        self.track(window, app, key)
+        return app
+
+    def track(self, window, app, key=None):
+        """Manage a window created elsewhere, such as a standalone tool's Tk root."""
+        self.tools[window] = [key, app, False]
+        window.protocol("WM_DELETE_WINDOW", lambda: self.close(window))
+        # Toplevel bindings also see events from every child widget
+        window.bind("<Unmap>", lambda event: self._on_visibility(event, window, False), add="+")
+        window.bind("<Map>", lambda event: self._on_visibility(event, window, True), add="+")
+        window.bind("<Destroy>", lambda event: self._on_destroy(event, window), add="+")
+
+    def find(self, key):
+        for window, (tool_key, _, _) in self.tools.items():
+            if tool_key == key:
+                return window
+        return None
+
+    def show(self, window):
+        window.deiconify()
+        window.lift()
+        window.focus_force()
+
+    def close(self, window):
+        self._release(window)
+        window.destroy()
+
+    def close_all(self):
+        for window in list(self.tools):
+            self.close(window)
+
+    def _on_visibility(self, event, window, visible):
+        if event.widget is not window or window not in self.tools:
+            return
+        entry = self.tools[window]
+        app = entry[1]
+        if visible and entry[2]:
+            entry[2] = False
+            if hasattr(app, "resume"):
+                app.resume()
+        elif not visible and not entry[2]:
+            entry[2] = True
+            if hasattr(app, "pause"):
+                app.pause()
+
+    def _on_destroy(self, event, window):
+        # Covers windows destroyed without the close button, e.g. with their parent
+        if event.widget is window:
+            self._release(window)
+
+    def _release(self, window):
+        entry = self.tools.pop(window, None)
+        if entry is not None and hasattr(entry[1], "close"):
+            entry[1].close()
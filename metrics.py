@@ -0,0 +1,157 @@
+"""
+Streaming percentile metrics for scheduling results.
+
+QuantileSketch is a log-bucketed histogram (the DDSketch scheme): a value x
+lands in bucket ceil(log(x) / log(gamma)), so every reported quantile is
+within `relative_accuracy` of the true value. Memory depends only on the
+range of values (about 1400 buckets cover 1 to 10**12 at 1%), never on how
+many values were added, and sketches can be merged. Quantiles use the
+nearest-rank definition; when every value added is an integer (scheduling
+times usually are) estimates are rounded, which makes small values exact.
+
+StreamingMetrics keeps one sketch each for waiting, turnaround and response
+time (first run minus arrival) and fills them in a single pass over a
+result, or one job at a time from a live simulation.
+"""
+import math
+import numbers
+
+PERCENTILES = (50, 95, 99)
+
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy=0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.integral = True
+
+    def add(self, value, count=1):
+        if value > 0:
+            key = math.ceil(math.log(value) / self.log_gamma)
+            self.positive[key] = self.positive.get(key, 0) + count
+        elif value < 0:
+            key = math.ceil(math.log(-value) / self.log_gamma)
+            self.negative[key] = self.negative.get(key, 0) + count
+        else:
+            self.zero_count += count
+        # NumPy integers from the vectorized paths count as integers too
+        if self.integral and type(value) is not int and not isinstance(value, numbers.Integral):
+            self.integral = False
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same accuracy can be merged")
+        for key, count in other.positive.items():
+            self.positive[key] = self.positive.get(key, 0) + count
+        for key, count in other.negative.items():
+            self.negative[key] = self.negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.integral = self.integral and other.integral
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def _value(self, key):
+        value = 2 * self.gamma ** key / (self.gamma + 1)
+        return round(value) if self.integral else value
+
+    def quantile(self, q):
+        """Value at quantile q (0..1); None if nothing was added."""
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = math.ceil(q * self.count) - 1
+        seen = 0
+        # Walk from the most negative value upwards
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return max(self.min, -self._value(key))
+        seen += self.zero_count
+        if seen > rank:
+            return 0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return min(self.max, self._value(key))
+        return self.max
+
+    def percentiles(self, percentiles=PERCENTILES):
+        return {p: self.quantile(p / 100) for p in percentiles}
+
+
+class StreamingMetrics:
+    """Waiting, turnaround and response time sketches for one run."""
+    NAMES = ("waiting", "turnaround", "response")
+
+    def __init__(self, relative_accuracy=0.01):
+        self.sketches = {name: QuantileSketch(relative_accuracy) for name in self.NAMES}
+
+    def add_job(self, arrival, burst, start, completion):
+        turnaround = completion - arrival
+        self.sketches["waiting"].add(turnaround - burst)
+        self.sketches["turnaround"].add(turnaround)
+        self.sketches["response"].add(start - arrival)
+
+    def add_result(self, arrival, burst, start_time, completion_time, waiting_time=None):
+        """
+        One pass over parallel sequences (lists, arrays or iterators).
+
+        Waiting time is turnaround minus burst unless `waiting_time` is given,
+        as it must be for processes that also spend time on I/O.
+        """
+        waiting = self.sketches["waiting"].add
+        turnaround = self.sketches["turnaround"].add
+        response = self.sketches["response"].add
+        if waiting_time is None:
+            for a, b, s, c in zip(arrival, burst, start_time, completion_time):
+                waiting(c - a - b)
+                turnaround(c - a)
+                response(s - a)
+        else:
+            for a, w, s, c in zip(arrival, waiting_time, start_time, completion_time):
+                waiting(w)
+                turnaround(c - a)
+                response(s - a)
+        return self
+
+    def summary(self, percentiles=PERCENTILES):
+        """{metric: {"mean": ..., "p50": ..., ...}} for every metric."""
+        result = {}
+        for name, sketch in self.sketches.items():
+            row = {"mean": sketch.mean}
+            for p, value in sketch.percentiles(percentiles).items():
+                row[f"p{p}"] = value
+            result[name] = row
+        return result
+
+    def format_lines(self, percentiles=PERCENTILES):
+        lines = []
+        for name, row in self.summary(percentiles).items():
+            tail = ", ".join(f"p{p} {row[f'p{p}']:.2f}" for p in percentiles if row[f"p{p}"] is not None)
+            lines.append(f"  {name.capitalize()} Time: mean {row['mean']:.2f}, {tail}")
+        return lines
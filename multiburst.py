@@ -0,0 +1,296 @@
+"""
+Processes that alternate between CPU and I/O bursts.
+
+Each process is a sequence of bursts starting and ending on the CPU:
+[cpu, io, cpu, io, ..., cpu]. Every I/O burst goes to one device; each
+device serves one request at a time from its own FIFO queue, and the
+process returns to the CPU ready queue when the request finishes. Waiting
+time is the time spent in the CPU ready queue; time queued for a device is
+reported separately as I/O wait.
+
+The simulator is event driven like the rest of the engine: the only events
+are arrivals, the end of the running CPU slice and device completions, each
+costing O(log n) at most, so 100k processes with dozens of bursts each
+(millions of events) run in seconds. CPU policies follow online.py; SJF
+and SRTF look at the current CPU burst, not the whole process.
+
+    result = multiburst.simulate([0, 2], [[5, 3, 4], [2, 6, 1]], "Round Robin")
+    result.cpu_utilization, result.device_utilization
+"""
+import heapq
+from collections import deque
+
+INF = float("inf")
+
+# Ready-queue key and whether a better arrival preempts the running process
+POLICIES = {
+    "FCFS": (None, False),
+    "SJF with AT": ("burst", False),
+    "Priority Scheduling": ("priority", False),
+    "Round Robin": (None, False),
+    "SRTF": ("remaining", True),
+    "Preemptive Priority": ("priority", True),
+}
+
+
+def parse_process(text):
+    """
+    Parse "5/3/4" (CPU 5, I/O 3, CPU 4) into (bursts, devices).
+
+    An I/O burst may name its device as "3@1"; the default is device 0.
+    """
+    bursts = []
+    devices = []
+    for i, part in enumerate(text.strip().split("/")):
+        if i % 2:
+            value, _, device = part.partition("@")
+            bursts.append(int(value))
+            devices.append(int(device) if device.strip() else 0)
+        else:
+            if "@" in part:
+                raise ValueError(f"Only I/O bursts have a device: {text!r}")
+            bursts.append(int(part))
+    return bursts, devices
+
+
+def is_multiburst(burst):
+    """True if `burst` holds burst sequences rather than single burst times."""
+    return len(burst) > 0 and not isinstance(burst[0], int) and hasattr(burst[0], "__len__")
+
+
+def _flatten(bursts, devices):
+    flat = []
+    first = []
+    last = []
+    for process in bursts:
+        if len(process) % 2 == 0:
+            raise ValueError("A process must start and end with a CPU burst")
+        if min(process) <= 0:
+            raise ValueError("Burst times must be positive")
+        first.append(len(flat))
+        flat.extend(process)
+        last.append(len(flat) - 1)
+
+    # device_of[i] is the device of I/O burst i in `flat` (0 at CPU bursts)
+    device_of = [0]*len(flat)
+    if devices is not None:
+        if len(devices) != len(bursts):
+            raise ValueError("Devices must be given for every process")
+        for f, l, process_devices in zip(first, last, devices):
+            if len(process_devices) != (l - f) // 2:
+                raise ValueError("Every I/O burst needs exactly one device")
+            device_of[f + 1:l:2] = process_devices
+    return flat, first, last, device_of
+
+
+class IOResult:
+    def __init__(self, n, num_devices):
+        self.start_time = [-1]*n
+        self.completion_time = [0]*n
+        self.turnaround_time = [0]*n
+        self.waiting_time = [0]*n           # CPU ready queue
+        self.io_wait_time = [0]*n           # device queues
+        self.cpu_time = [0]*n
+        self.io_time = [0]*n
+        self.segments = []                  # (pid, start, end) on the CPU
+        self.device_segments = []           # (pid, device, start, end)
+        self.cpu_busy = 0
+        self.device_busy = [0]*num_devices
+        self.device_requests = [0]*num_devices
+        self.switches = 0
+        self.overhead_time = 0
+        self.makespan = 0
+
+    @property
+    def cpu_utilization(self):
+        return self.cpu_busy / self.makespan if self.makespan > 0 else 0.0
+
+    @property
+    def device_utilization(self):
+        if self.makespan <= 0:
+            return [0.0]*len(self.device_busy)
+        return [busy / self.makespan for busy in self.device_busy]
+
+    @property
+    def efficiency(self):
+        busy = self.cpu_busy + self.overhead_time
+        return self.cpu_busy / busy if busy > 0 else 1.0
+
+
+def simulate(arrival, bursts, algo="FCFS", priority=None, quantum=2, devices=None, num_devices=None,
+             switch_cost=0, keep_segments=True):
+    """
+    Schedule multi-burst processes on one CPU and a set of I/O devices.
+
+    `bursts[i]` is process i's [cpu, io, ..., cpu] sequence and `devices[i]`
+    the device of each of its I/O bursts (default: all on device 0). With a
+    single CPU burst per process the schedule matches scheduler.py.
+    """
+    if algo not in POLICIES:
+        raise ValueError(f"{algo} is not supported for multi-burst processes")
+    if algo == "Round Robin" and quantum <= 0:
+        raise ValueError("Time quantum must be positive")
+    n = len(arrival)
+    if len(bursts) != n:
+        raise ValueError("Every process needs a burst sequence")
+    flat, first, last_burst, device_of = _flatten(bursts, devices)
+    used = max(device_of, default=-1) + 1
+    if num_devices is None:
+        num_devices = max(used, 1)
+    elif used > num_devices or min(device_of, default=0) < 0:
+        raise ValueError(f"Device numbers must be between 0 and {num_devices - 1}")
+    if priority is None:
+        priority = [0]*n
+
+    key_name, preemptive = POLICIES[algo]
+    fifo = key_name is None
+    round_robin = algo == "Round Robin"
+    result = IOResult(n, num_devices)
+    start_time = result.start_time
+    io_wait = result.io_wait_time
+    segments = result.segments
+    device_segments = result.device_segments
+    device_busy = result.device_busy
+    device_requests = result.device_requests
+
+    pos = first[:]                          # index in `flat` of each process's current burst
+    remaining = [flat[f] for f in first]    # of the current CPU burst
+    order = sorted(range(n), key=arrival.__getitem__)
+    next_arrival = 0
+
+    def key(idx):
+        if key_name == "remaining":
+            return remaining[idx]
+        if key_name == "burst":
+            return flat[pos[idx]]
+        return priority[idx]
+
+    ready = deque() if fifo else []
+    running = -1
+    last = -1
+    previous = -1                           # the process the CPU held before the current switch
+    run_since = 0
+    dispatched_at = 0
+    run_end = INF
+
+    device_queue = [deque() for _ in range(num_devices)]
+    device_pid = [-1]*num_devices
+    device_start = [0]*num_devices
+    queued_at = [0]*n
+    device_done = []                        # (time, device) of requests in service
+
+    def start_io(idx, device, t):
+        device_pid[device] = idx
+        device_start[device] = t
+        device_requests[device] += 1
+        heapq.heappush(device_done, (t + flat[pos[idx]], device))
+
+    def make_ready(idx, t):
+        nonlocal running, last, run_since, run_end
+        if fifo:
+            ready.append(idx)
+            return
+        if preemptive and running != -1:
+            # Charge the running process first so its key is current
+            if t > run_since:
+                remaining[running] -= t - run_since
+                result.cpu_busy += t - run_since
+                run_since = t
+            if key(idx) < key(running):
+                heapq.heappush(ready, (key(running), running))
+                if t < dispatched_at:
+                    # Preempted while switching in: the switch is cancelled
+                    result.switches -= 1
+                    result.overhead_time -= switch_cost
+                    last = previous
+                elif t > dispatched_at:
+                    if start_time[running] == -1:
+                        start_time[running] = dispatched_at
+                    if keep_segments:
+                        segments.append((running, dispatched_at, t))
+                running = -1
+                run_end = INF
+        heapq.heappush(ready, (key(idx), idx))
+
+    while True:
+        t = run_end
+        if device_done and device_done[0][0] < t:
+            t = device_done[0][0]
+        if next_arrival < n and arrival[order[next_arrival]] < t:
+            t = arrival[order[next_arrival]]
+        if t == INF:
+            break
+
+        # The slice ending at t, then device completions, then arrivals,
+        # then the re-queued slice (Round Robin), then dispatch
+        expired = -1
+        if run_end == t:
+            idx = running
+            if t > run_since:
+                remaining[idx] -= t - run_since
+                result.cpu_busy += t - run_since
+            if start_time[idx] == -1:
+                start_time[idx] = dispatched_at
+            if keep_segments:
+                segments.append((idx, dispatched_at, t))
+            running = -1
+            run_end = INF
+            if remaining[idx] > 0:
+                expired = idx
+            elif pos[idx] == last_burst[idx]:
+                result.completion_time[idx] = t
+            else:
+                pos[idx] += 1
+                device = device_of[pos[idx]]
+                if device_pid[device] == -1:
+                    start_io(idx, device, t)
+                else:
+                    queued_at[idx] = t
+                    device_queue[device].append(idx)
+
+        while device_done and device_done[0][0] == t:
+            _, device = heapq.heappop(device_done)
+            idx = device_pid[device]
+            device_busy[device] += t - device_start[device]
+            if keep_segments:
+                device_segments.append((idx, device, device_start[device], t))
+            pos[idx] += 1
+            remaining[idx] = flat[pos[idx]]
+            make_ready(idx, t)
+            if device_queue[device]:
+                waiting = device_queue[device].popleft()
+                io_wait[waiting] += t - queued_at[waiting]
+                start_io(waiting, device, t)
+            else:
+                device_pid[device] = -1
+
+        while next_arrival < n and arrival[order[next_arrival]] == t:
+            make_ready(order[next_arrival], t)
+            next_arrival += 1
+
+        if expired != -1:
+            ready.append(expired)
+
+        if running == -1 and ready:
+            idx = ready.popleft() if fifo else heapq.heappop(ready)[1]
+            begin = t
+            if switch_cost and idx != last:
+                begin = t + switch_cost
+                result.switches += 1
+                result.overhead_time += switch_cost
+            previous = last
+            last = idx
+            running = idx
+            run_since = dispatched_at = begin
+            run_end = begin + (min(quantum, remaining[idx]) if round_robin else remaining[idx])
+
+    for i in range(n):
+        cpu = sum(flat[first[i]:last_burst[i] + 1:2])
+        io = sum(flat[first[i] + 1:last_burst[i]:2])
+        tat = result.completion_time[i] - arrival[i]
+        result.cpu_time[i] = cpu
+        result.io_time[i] = io
+        result.turnaround_time[i] = tat
+        result.waiting_time[i] = tat - cpu - io - io_wait[i]
+    result.makespan = max(result.completion_time, default=0)
+    return result
@@ -0,0 +1,241 @@
+"""
+Multi-core (SMP) scheduling simulation.
+
+Processes are scheduled on N identical cores, either from one global run
+queue or from per-core run queues with optional work stealing and periodic
+load balancing. The simulation is event-driven like scheduler.py, so its
+cost depends on the number of dispatches, not on the simulated time.
+
+A core pays `switch_cost` before running a process other than the one it
+ran last, plus `migration_penalty` (cache warm-up) when the process last
+ran on another core.
+"""
+import heapq
+from collections import deque
+
+# Event kinds; at the same instant arrivals queue before a slice that just
+# ended is requeued, and the periodic balancer runs last.
+ARRIVAL = 0
+SLICE_END = 1
+BALANCE = 2
+
+GLOBAL = "Global"
+PER_CORE = "Per-core"
+QUEUE_MODES = [GLOBAL, PER_CORE]
+
+# Policy used inside every run queue: the ordering key (None keeps arrival
+# order) and whether processes are preempted after a time quantum.
+POLICIES = {
+    "FCFS": (None, False),
+    "SJF with AT": ("burst", False),
+    "Priority Scheduling": ("priority", False),
+    "Round Robin": (None, True),
+}
+
+
+class RunQueue:
+    """FIFO or keyed run queue; keyed queues pop the smallest (key, pid)."""
+    def __init__(self, key=None):
+        self.key = key
+        self.items = [] if key is not None else deque()
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, pid):
+        if self.key is None:
+            self.items.append(pid)
+        else:
+            heapq.heappush(self.items, (self.key[pid], pid))
+
+    def pop(self):
+        if self.key is None:
+            return self.items.popleft()
+        return heapq.heappop(self.items)[1]
+
+    def steal(self):
+        # Thieves take from the cold end of a FIFO queue
+        if self.key is None:
+            return self.items.pop()
+        return heapq.heappop(self.items)[1]
+
+
+class SMPResult:
+    def __init__(self, n, num_cores):
+        self.start_time = [-1]*n
+        self.completion_time = [0]*n
+        self.waiting_time = [0]*n
+        self.turnaround_time = [0]*n
+        self.segments = []              # (pid, core, start, end)
+        self.core_busy = [0]*num_cores
+        self.core_overhead = [0]*num_cores
+        self.core_migrations = [0]*num_cores
+        self.switches = 0
+        self.migrations = 0
+        self.steals = 0
+        self.makespan = 0
+
+    @property
+    def utilization(self):
+        if self.makespan <= 0:
+            return [0.0]*len(self.core_busy)
+        return [busy / self.makespan for busy in self.core_busy]
+
+    @property
+    def overhead_time(self):
+        return sum(self.core_overhead)
+
+    @property
+    def efficiency(self):
+        """Share of busy core time spent running processes rather than switching."""
+        useful = sum(self.core_busy)
+        busy = useful + self.overhead_time
+        return useful / busy if busy > 0 else 1.0
+
+
+def simulate_smp(arrival, burst, num_cores, algo="FCFS", priority=None, quantum=2,
+                 queue_mode=GLOBAL, work_stealing=False, balance_interval=None,
+                 switch_cost=0, migration_penalty=0):
+    """
+    Schedule the processes on `num_cores` cores and return an SMPResult.
+
+    In per-core mode an arriving process joins the least loaded core. An idle
+    core with an empty queue steals from the longest queue when
+    `work_stealing` is set, and every `balance_interval` time units queued
+    processes are moved from the busiest cores to the idlest ones.
+    """
+    if num_cores < 1:
+        raise ValueError("Number of cores must be at least 1")
+    if algo not in POLICIES:
+        raise ValueError(f"{algo} is not supported on multiple cores")
+    if queue_mode not in QUEUE_MODES:
+        raise ValueError(f"Unknown run queue mode: {queue_mode}")
+
+    key_name, preemptive = POLICIES[algo]
+    if preemptive and quantum <= 0:
+        raise ValueError("Time quantum must be positive")
+    n = len(arrival)
+    if priority is None:
+        priority = [0]*n
+    key = {"burst": burst, "priority": priority}.get(key_name)
+
+    result = SMPResult(n, num_cores)
+    remaining = list(burst)
+    last_core = [-1]*n
+    last_pid = [-1]*num_cores
+    running = [-1]*num_cores
+    per_core = queue_mode == PER_CORE
+    queues = [RunQueue(key) for _ in range(num_cores if per_core else 1)]
+
+    events = [(arrival[i], ARRIVAL, i, 0) for i in range(n)]
+    heapq.heapify(events)
+    if per_core and balance_interval and n:
+        heapq.heappush(events, (min(arrival) + balance_interval, BALANCE, 0, 0))
+
+    idle = [True]*num_cores
+    # Free cores for the global queue; each core is in the heap at most once,
+    # and per-core queues never use it
+    idle_heap = [] if per_core else list(range(num_cores))
+    in_heap = [not per_core]*num_cores
+    touched = set()
+    completed = 0
+
+    def load(core):
+        return len(queues[core]) + (running[core] != -1)
+
+    def dispatch(core, pid, t):
+        overhead = 0
+        if switch_cost and last_pid[core] != pid:
+            overhead += switch_cost
+            result.switches += 1
+        if last_core[pid] not in (-1, core):
+            result.migrations += 1
+            result.core_migrations[core] += 1
+            overhead += migration_penalty
+        result.core_overhead[core] += overhead
+        t += overhead
+        if result.start_time[pid] == -1:
+            result.start_time[pid] = t
+        last_core[pid] = core
+        last_pid[core] = pid
+        running[core] = pid
+        idle[core] = False
+        run = min(quantum, remaining[pid]) if preemptive else remaining[pid]
+        heapq.heappush(events, (t + run, SLICE_END, core, pid))
+
+    while events:
+        t, kind, a, b = heapq.heappop(events)
+
+        if kind == ARRIVAL:
+            if per_core:
+                core = min(range(num_cores), key=load)
+                queues[core].push(a)
+                touched.add(core)
+            else:
+                queues[0].push(a)
+        elif kind == SLICE_END:
+            core, pid = a, b
+            begin = t - (min(quantum, remaining[pid]) if preemptive else remaining[pid])
+            result.segments.append((pid, core, begin, t))
+            result.core_busy[core] += t - begin
+            remaining[pid] -= t - begin
+            running[core] = -1
+            idle[core] = True
+            if not in_heap[core]:
+                heapq.heappush(idle_heap, core)
+                in_heap[core] = True
+            touched.add(core)
+            if remaining[pid] == 0:
+                result.completion_time[pid] = t
+                completed += 1
+            else:
+                queues[core if per_core else 0].push(pid)
+        else:
+            # Move queued work from the busiest to the idlest cores
+            while True:
+                busiest = max(range(num_cores), key=load)
+                idlest = min(range(num_cores), key=load)
+                if load(busiest) - load(idlest) <= 1 or not queues[busiest]:
+                    break
+                queues[idlest].push(queues[busiest].steal())
+                touched.add(idlest)
+            if completed < n:
+                heapq.heappush(events, (t + balance_interval, BALANCE, 0, 0))
+
+        # Dispatch only after every event at this instant has been applied
+        if events and events[0][0] == t:
+            continue
+
+        if per_core:
+            for core in touched:
+                if not idle[core]:
+                    continue
+                if not queues[core] and work_stealing:
+                    victim = max(range(num_cores), key=lambda c: len(queues[c]))
+                    if queues[victim]:
+                        queues[core].push(queues[victim].steal())
+                        result.steals += 1
+                if queues[core]:
+                    dispatch(core, queues[core].pop(), t)
+            touched.clear()
+        else:
+            queue = queues[0]
+            while queue and idle_heap:
+                core = heapq.heappop(idle_heap)
+                in_heap[core] = False
+                if not idle[core]:
+                    continue
+                pid = queue.pop()
+                # Keep a process on its previous core when that core is free
+                if last_core[pid] != -1 and last_core[pid] != core and idle[last_core[pid]]:
+                    heapq.heappush(idle_heap, core)
+                    in_heap[core] = True
+                    core = last_core[pid]
+                dispatch(core, pid, t)
+            touched.clear()
+
+    result.makespan = max(result.completion_time, default=0)
+    for i in range(n):
+        result.turnaround_time[i] = result.completion_time[i] - arrival[i]
+        result.waiting_time[i] = result.turnaround_time[i] - burst[i]
+    return result
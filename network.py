@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.animation import FuncAnimation
 import socket
+import lifecycle
 
 class NetworkMonitorApp:
     def __init__(self, master):
@@ -22,6 +23,20 @@ class NetworkMonitorApp:
         # Start animation for live graph (updates every 1 second)
         self.ani = FuncAnimation(self.ax_net.figure, self.update_network_info, interval=1000, blit=False)
 
+    def pause(self):
+        """Stop polling connections and traffic while the window is hidden."""
+        self.ani.pause()
+
+    def resume(self):
+        # Measure traffic from now on, not across the paused time
+        self.last_net_io = psutil.net_io_counters()
+        self.ani.resume()
+
+    def close(self):
+        """Stop the animation timer and release the figure."""
+        self.ani.event_source.stop()
+        plt.close(self.ax_net.figure)
+
     def create_network_monitor(self, parent):
         panel = ttk.LabelFrame(parent, text="Network Activity", padding=10)
         panel.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -95,11 +110,12 @@ class NetworkMonitorApp:
         self.ax_net.set_xticks(range(0, len(self.timestamps), step))
         self.ax_net.set_xticklabels(self.timestamps[::step], rotation=30, ha='right')
 
-        self.canvas_net.draw()
+        self.canvas_net.draw_idle()
         self.last_net_io = current_net_io
 
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = NetworkMonitorApp(root)
+    lifecycle.WindowManager(root).track(root, app)
     root.mainloop()
@@ -0,0 +1,228 @@
+"""
+Online, incremental CPU scheduling.
+
+OnlineScheduler is a stateful simulator for a live job stream. Jobs are
+submitted with arrival times at or after the current clock, and
+advance(until) moves the clock forward, applying only the events in
+between. Running averages are updated as jobs start and finish, so nothing
+is ever replayed: each event costs one heap or deque operation no matter
+how long the simulation has been running. Waiting, turnaround and response
+time percentiles come from fixed-size sketches (see metrics.py).
+
+With every job submitted up front the schedule matches the batch functions
+in scheduler.py exactly, including their context-switch cost model.
+
+    sim = OnlineScheduler("SRTF")
+    sim.submit(0, 5)
+    sim.submit(3, 1)
+    sim.advance(4)
+    sim.metrics()
+"""
+import heapq
+from collections import deque
+
+import metrics
+
+INF = float("inf")
+
+# Ready-queue key and whether a better arrival preempts the running job
+POLICIES = {
+    "FCFS": ("arrival", False),
+    "SJF with AT": ("burst", False),
+    "Priority Scheduling": ("priority", False),
+    "Round Robin": (None, False),
+    "SRTF": ("remaining", True),
+    "Preemptive Priority": ("priority", True),
+}
+
+
+class OnlineScheduler:
+    def __init__(self, algo="FCFS", quantum=2, keep_segments=True, switch_cost=0):
+        if algo not in POLICIES:
+            raise ValueError(f"{algo} is not supported in online mode")
+        if algo == "Round Robin" and quantum <= 0:
+            raise ValueError("Time quantum must be positive")
+        self.algo = algo
+        self.quantum = quantum
+        key_name, self.preemptive = POLICIES[algo]
+        self.round_robin = key_name is None
+        self.keep_segments = keep_segments
+        self.switch_cost = switch_cost
+
+        self.arrival = []
+        self.burst = []
+        self.priority = []
+        self.remaining = []
+        self.start_time = []
+        self.completion_time = []
+        self.key = {"arrival": self.arrival, "burst": self.burst, "priority": self.priority,
+                    "remaining": self.remaining}.get(key_name)
+
+        self.now = 0
+        self.pending = []
+        self.ready = deque() if self.round_robin else []
+        self.running = -1
+        self.last = -1
+        self.previous = -1              # the job the CPU held before the current switch
+        self.run_since = 0
+        self.dispatched_at = 0
+        self.run_end = INF
+
+        self.segments = []
+        self.completed = 0
+        self.started = 0
+        self.busy_time = 0
+        self.switches = 0
+        self.overhead_time = 0
+        self.total_waiting = 0
+        self.total_turnaround = 0
+        self.total_response = 0
+        self.stats = metrics.StreamingMetrics()
+
+    def submit(self, arrival, burst, priority=0):
+        """Add a job arriving at or after the current clock; returns its pid."""
+        if arrival < self.now:
+            raise ValueError(f"Arrival {arrival} is before the current time {self.now}")
+        if burst <= 0:
+            raise ValueError("Burst time must be positive")
+        pid = len(self.arrival)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.priority.append(priority)
+        self.remaining.append(burst)
+        self.start_time.append(-1)
+        self.completion_time.append(-1)
+        heapq.heappush(self.pending, (arrival, pid))
+        return pid
+
+    def advance(self, until):
+        """Apply every event before `until` and move the clock there."""
+        if until < self.now:
+            raise ValueError("The clock cannot move backwards")
+        self._run_events(until)
+        self.now = until
+        self._confirm_start(until)
+
+    def run(self):
+        """Run until every submitted job has finished."""
+        self._run_events(INF)
+
+    def next_event_time(self):
+        return min(self.pending[0][0] if self.pending else INF, self.run_end)
+
+    def _run_events(self, until):
+        while True:
+            t = self.next_event_time()
+            if t >= until:
+                return
+            self.now = t
+            self._apply(t)
+
+    def _apply(self, t):
+        # Same order as the batch engine: the slice ending at t, then every
+        # arrival at t, then the re-queued slice (Round Robin), then dispatch
+        self._confirm_start(t)
+        expired = -1
+        if self.run_end == t:
+            idx = self.running
+            self._account(t)
+            self._record(idx, self.dispatched_at, t)
+            self.running = -1
+            self.run_end = INF
+            if self.remaining[idx] == 0:
+                self.completion_time[idx] = t
+                self.completed += 1
+                turnaround = t - self.arrival[idx]
+                self.total_turnaround += turnaround
+                self.total_waiting += turnaround - self.burst[idx]
+                self.stats.sketches["turnaround"].add(turnaround)
+                self.stats.sketches["waiting"].add(turnaround - self.burst[idx])
+            else:
+                expired = idx
+
+        while self.pending and self.pending[0][0] <= t:
+            _, idx = heapq.heappop(self.pending)
+            if self.round_robin:
+                self.ready.append(idx)
+                continue
+            if self.preemptive and self.running != -1:
+                self._account(t)
+                if self.key[idx] < self.key[self.running]:
+                    running = self.running
+                    heapq.heappush(self.ready, (self.key[running], running))
+                    if t < self.dispatched_at:
+                        # Preempted while switching in: the switch is cancelled
+                        self.switches -= 1
+                        self.overhead_time -= self.switch_cost
+                        self.last = self.previous
+                    elif t > self.dispatched_at:
+                        self._record(running, self.dispatched_at, t)
+                    self.running = -1
+                    self.run_end = INF
+            heapq.heappush(self.ready, (self.key[idx], idx))
+
+        if expired != -1:
+            self.ready.append(expired)
+
+        if self.running == -1 and self.ready:
+            if self.round_robin:
+                idx = self.ready.popleft()
+            else:
+                _, idx = heapq.heappop(self.ready)
+            begin = t
+            if self.switch_cost and idx != self.last:
+                begin = t + self.switch_cost
+                self.switches += 1
+                self.overhead_time += self.switch_cost
+            self.previous = self.last
+            self.last = idx
+            self.running = idx
+            self.run_since = self.dispatched_at = begin
+            run = min(self.quantum, self.remaining[idx]) if self.round_robin else self.remaining[idx]
+            self.run_end = begin + run
+
+    def _confirm_start(self, t):
+        """Count the running job as started once it has actually run, not when it was dispatched."""
+        idx = self.running
+        if idx != -1 and self.start_time[idx] == -1 and t > self.dispatched_at:
+            begin = self.dispatched_at
+            self.start_time[idx] = begin
+            self.started += 1
+            self.total_response += begin - self.arrival[idx]
+            self.stats.sketches["response"].add(begin - self.arrival[idx])
+
+    def _account(self, t):
+        """Charge the running job for the CPU time since it was last charged."""
+        if t > self.run_since:
+            self.remaining[self.running] -= t - self.run_since
+            self.busy_time += t - self.run_since
+            self.run_since = t
+
+    def _record(self, idx, start, end):
+        if self.keep_segments:
+            self.segments.append((idx, start, end))
+
+    def drain_segments(self):
+        """Return the segments finished since the last call and forget them."""
+        segments, self.segments = self.segments, []
+        return segments
+
+    def metrics(self):
+        """Current averages, percentiles, counts and utilization."""
+        busy = self.busy_time + (max(0, self.now - self.run_since) if self.running != -1 else 0)
+        return {
+            "time": self.now,
+            "submitted": len(self.arrival),
+            "completed": self.completed,
+            "running": None if self.running == -1 else self.running,
+            "ready": len(self.ready),
+            "avg_waiting": self.total_waiting / self.completed if self.completed else 0.0,
+            "avg_turnaround": self.total_turnaround / self.completed if self.completed else 0.0,
+            "avg_response": self.total_response / self.started if self.started else 0.0,
+            "throughput": self.completed / self.now if self.now > 0 else 0.0,
+            "utilization": busy / self.now if self.now > 0 else 0.0,
+            "switches": self.switches,
+            "overhead": self.overhead_time,
+            "efficiency": busy / (busy + self.overhead_time) if busy + self.overhead_time > 0 else 1.0,
+            "percentiles": self.stats.summary(),
+        }
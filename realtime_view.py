@@ -0,0 +1,116 @@
+"""
+Real-time scheduling window: EDF and Rate-Monotonic task sets.
+
+"Analyze" runs realtime.analyze(), which usually settles schedulability
+without simulating anything. "Simulate" draws the schedule over the chosen
+horizon (one hyperperiod by default) and lists every deadline miss.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+import gantt
+import realtime
+
+
+class RealTimeWindow:
+    def __init__(self, master, theme):
+        self.theme = theme
+        self.window = tk.Toplevel(master)
+        self.window.title("Real-Time Scheduling (EDF / Rate Monotonic)")
+        self.window.configure(bg=theme['bg'])
+
+        form = tk.Frame(self.window, bg=theme['bg'])
+        form.pack(fill="x", padx=10, pady=10)
+        self.entries = {}
+        for row, (name, text) in enumerate([("periods", "Periods (e.g., 4,5,10):"), ("wcets", "Execution times (WCET):"),
+                                            ("deadlines", "Deadlines (blank = periods):"),
+                                            ("offsets", "Offsets (blank = 0):")]):
+            tk.Label(form, text=text, bg=theme['bg'], fg=theme['fg'],
+                     font=("Arial", 12, "bold")).grid(row=row, column=0, padx=10, pady=5, sticky="e")
+            entry = tk.Entry(form, width=50, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+            entry.grid(row=row, column=1, padx=10, pady=5, sticky="w")
+            self.entries[name] = entry
+        self.entries["periods"].insert(0, "4,5,10")
+        self.entries["wcets"].insert(0, "1,2,3")
+
+        options = tk.Frame(form, bg=theme['bg'])
+        options.grid(row=4, column=0, columnspan=2, pady=10)
+        self.policy = tk.StringVar(value=realtime.EDF)
+        ttk.Combobox(options, values=realtime.POLICIES, textvariable=self.policy,
+                     width=15, font=("Arial", 12), state="readonly").pack(side="left", padx=10)
+        tk.Label(options, text="Horizon (blank = hyperperiod):", bg=theme['bg'], fg=theme['fg'],
+                 font=("Arial", 11)).pack(side="left", padx=(10, 5))
+        self.horizon_entry = tk.Entry(options, width=10, font=("Arial", 12), bg=theme['entry_bg'], fg=theme['entry_fg'])
+        self.horizon_entry.pack(side="left")
+        for text, command in [("Analyze", self.analyze), ("Simulate", self.simulate)]:
+            tk.Button(options, text=text, bg=theme['button_bg'], fg=theme['button_fg'], font=("Arial", 12, "bold"),
+                      command=command, padx=15, pady=8, cursor="hand2").pack(side="left", padx=10)
+
+        self.output_text = tk.Text(self.window, height=12, width=110, font=("Courier", 11),
+                                   bg=theme['output_bg'], fg=theme['output_fg'], wrap=tk.NONE)
+        self.output_text.pack(fill="x", padx=10)
+
+        self.chart = gantt.GanttChart(theme, figsize=(12, 3.5))
+        self.canvas = FigureCanvasTkAgg(self.chart.figure, master=self.window)
+        toolbar = NavigationToolbar2Tk(self.canvas, self.window, pack_toolbar=False)
+        toolbar.pack(fill="x")
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, pady=10)
+
+    def lift(self):
+        self.window.lift()
+
+    def exists(self):
+        return bool(self.window.winfo_exists())
+
+    def _read_tasks(self):
+        values = {}
+        for name, entry in self.entries.items():
+            text = entry.get().strip()
+            # Comma-separated, like the arrival, burst and priority entries
+            values[name] = list(map(int, text.split(","))) if text else None
+        if values["periods"] is None or values["wcets"] is None:
+            raise ValueError("Enter the periods and execution times")
+        return values
+
+    def _show(self, lines):
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert(tk.END, "\n".join(lines) + "\n")
+
+    def analyze(self):
+        try:
+            tasks = self._read_tasks()
+            report = realtime.analyze(tasks["periods"], tasks["wcets"], tasks["deadlines"], tasks["offsets"],
+                                      self.policy.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e), parent=self.window)
+            return
+        self._show(realtime.format_report(report))
+
+    def simulate(self):
+        try:
+            tasks = self._read_tasks()
+            text = self.horizon_entry.get().strip()
+            if text:
+                horizon = int(text)
+            else:
+                period = realtime.hyperperiod(tasks["periods"], realtime.DEFAULT_MAX_HORIZON)
+                if period is None:
+                    raise ValueError("The hyperperiod is too long to simulate; enter a shorter horizon")
+                horizon = max(tasks["offsets"] or [0]) + period
+            if horizon <= 0:
+                raise ValueError("Horizon must be positive")
+            if horizon > realtime.DEFAULT_MAX_HORIZON:
+                raise ValueError(f"Horizon {horizon} is too long to simulate; enter a shorter one")
+            result = realtime.simulate(tasks["periods"], tasks["wcets"], tasks["deadlines"], tasks["offsets"],
+                                       self.policy.get(), horizon)
+            report = realtime.analyze(tasks["periods"], tasks["wcets"], tasks["deadlines"], tasks["offsets"],
+                                      self.policy.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e), parent=self.window)
+            return
+
+        self._show(realtime.format_report(report) + realtime.format_misses(result))
+        labels = [f"T{i+1}" for i in range(len(tasks["periods"]))]
+        self.chart.update(labels, result.segments)
+        self.canvas.draw_idle()
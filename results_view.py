@@ -0,0 +1,126 @@
+"""
+Virtualized results table for large scheduling runs.
+
+A Treeview holds a fixed pool of rows, one per visible line, and scrolling
+just rewrites their values from the result arrays. Rendering cost therefore
+depends on the window height, not on the number of processes. Sorting by a
+column computes its row order once and caches it; reversing the direction
+reads the same order backwards.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+RESULT_COLUMNS = [
+    ("Process", 90),
+    ("Arrival", 100),
+    ("Burst", 100),
+    ("Start", 100),
+    ("Completion", 110),
+    ("Waiting", 100),
+    ("Turnaround", 110),
+]
+
+
+class ResultsTable:
+    def __init__(self, master, columns=RESULT_COLUMNS, height=15):
+        self.columns = [name for name, _ in columns]
+        self.height = height
+        self.frame = tk.Frame(master)
+
+        self.tree = ttk.Treeview(self.frame, columns=self.columns, show="headings",
+                                 height=height, selectmode="none")
+        for name, width in columns:
+            self.tree.heading(name, text=name, command=lambda c=name: self.sort_by(c))
+            self.tree.column(name, width=width, anchor="center")
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self._on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # The only rows that ever exist; their values are swapped on scroll
+        self.rows = [self.tree.insert("", "end", values=()) for _ in range(height)]
+
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll(3))
+
+        self.data = {}
+        self.count = 0
+        self.offset = 0
+        self.sort_column = None
+        self.descending = False
+        self.sort_orders = {}
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def set_data(self, data):
+        """`data` maps every column name to a sequence indexed by process."""
+        self.data = data
+        self.count = len(data[self.columns[0]]) if data else 0
+        self.offset = 0
+        self.sort_column = None
+        self.descending = False
+        self.sort_orders = {}
+        for name in self.columns:
+            self.tree.heading(name, text=name)
+        self.render()
+
+    def sort_by(self, column):
+        if not self.count:
+            return
+        if self.sort_column == column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+        if column not in self.sort_orders:
+            values = self.data[column]
+            if column == "Process":
+                # Names sort as P1, P10, P2...; the process index is the natural order
+                self.sort_orders[column] = range(self.count)
+            else:
+                self.sort_orders[column] = sorted(range(self.count), key=values.__getitem__)
+        for name in self.columns:
+            arrow = (" ▼" if self.descending else " ▲") if name == column else ""
+            self.tree.heading(name, text=name + arrow)
+        self.offset = 0
+        self.render()
+
+    def _row_index(self, position):
+        if self.sort_column is None:
+            return position
+        order = self.sort_orders[self.sort_column]
+        return order[self.count - 1 - position] if self.descending else order[position]
+
+    def render(self):
+        for slot, item in enumerate(self.rows):
+            position = self.offset + slot
+            if position < self.count:
+                row = self._row_index(position)
+                self.tree.item(item, values=[self.data[name][row] for name in self.columns])
+            else:
+                self.tree.item(item, values=())
+        if self.count > self.height:
+            self.scrollbar.set(self.offset / self.count, (self.offset + self.height) / self.count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_to(self, offset):
+        offset = max(0, min(offset, self.count - self.height))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def _scroll(self, lines):
+        self._scroll_to(self.offset + lines)
+        return "break"
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._scroll_to(int(float(value) * self.count))
+        elif action == "scroll":
+            step = self.height if unit == "pages" else 1
+            self._scroll_to(self.offset + int(value) * step)
+
+    def _on_mousewheel(self, event):
+        return self._scroll(-3 * int(event.delta / 120) or (-1 if event.delta > 0 else 1))
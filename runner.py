@@ -0,0 +1,119 @@
+"""
+Background execution of scheduling runs.
+
+simulate() runs one job headlessly and returns plain picklable results.
+BackgroundRun executes it in a worker process so the Tk main loop (and every
+other open tool window) keeps running; the GUI polls it with root.after()
+and can cancel it at any time by terminating the worker.
+"""
+import queue
+import time
+
+import multiburst
+import multicore
+import scheduler
+
+
+def simulate(algo, arrival, burst, priority=None, quantum=2, num_cores=1,
+             queue_mode=multicore.GLOBAL, work_stealing=False, balance_interval=None,
+             switch_cost=0, migration_penalty=0, **options):
+    """
+    Run one scheduling job and return a dict of result lists.
+
+    Extra keyword `options` (MLFQ boost_interval, CFS target_latency) are
+    passed through to scheduler.schedule. result["overhead"] holds the
+    context-switch count, total switching time and CPU efficiency.
+
+    When every burst is a [cpu, io, ..., cpu] sequence the run goes to
+    multiburst.simulate (options: devices, num_devices) and result["io"]
+    holds the multiburst.IOResult with CPU and device utilization.
+    """
+    if algo not in scheduler.ALGORITHMS:
+        raise ValueError(f"Unknown Algorithm: {algo}")
+    if multiburst.is_multiburst(burst):
+        if num_cores > 1:
+            raise ValueError("Processes with I/O bursts run on a single core")
+        io = multiburst.simulate(arrival, burst, algo, priority, quantum, options.get("devices"),
+                                 options.get("num_devices"), switch_cost)
+        overhead = {"switches": io.switches, "time": io.overhead_time, "efficiency": io.efficiency}
+        return {"st": io.start_time, "ct": io.completion_time, "wt": io.waiting_time,
+                "tat": io.turnaround_time, "segments": io.segments, "smp": None,
+                "overhead": overhead, "io": io}
+    if num_cores > 1:
+        smp = multicore.simulate_smp(arrival, burst, num_cores, algo, priority, quantum,
+                                     queue_mode, work_stealing, balance_interval,
+                                     switch_cost, migration_penalty)
+        st, ct, wt, tat = smp.start_time, smp.completion_time, smp.waiting_time, smp.turnaround_time
+        segments = smp.segments
+        overhead = {"switches": smp.switches, "time": smp.overhead_time, "efficiency": smp.efficiency}
+    else:
+        smp = None
+        segments = []
+        switches = []
+        st, ct, wt, tat = scheduler.schedule(algo, arrival, burst, priority, quantum, segments,
+                                             switch_cost=switch_cost, switches=switches, **options)
+        overhead = scheduler.overhead_summary(burst, switches)
+    return {"st": st, "ct": ct, "wt": wt, "tat": tat, "segments": segments, "smp": smp,
+            "overhead": overhead, "io": None}
+
+
+def _worker(results, job):
+    try:
+        results.put(("done", simulate(**job)))
+    except Exception as e:
+        results.put(("error", str(e)))
+
+
+def start_method():
+    """
+    "fork" when it is available and safe, otherwise "forkserver" or "spawn".
+
+    Forking skips re-importing the GUI modules in the worker, but only a
+    single-threaded process can be forked safely: while another thread runs
+    (Main.py's background warm-up imports, a host capture) the child may
+    inherit a lock, such as an import lock, that nothing will release.
+    """
+    # Imported here so the command-line mode, which calls simulate()
+    # directly, stays lean
+    import multiprocessing
+    import threading
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return "fork"
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+def _context():
+    # The child only runs the headless engine and never touches Tk
+    import multiprocessing
+    return multiprocessing.get_context(start_method())
+
+
+class BackgroundRun:
+    """One simulate() call running in a worker process."""
+    def __init__(self, **job):
+        context = _context()
+        self.results = context.Queue()
+        self.process = context.Process(target=_worker, args=(self.results, job), daemon=True)
+        self.started = time.perf_counter()
+        self.process.start()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def poll(self):
+        """Return ("done", result) or ("error", message) once finished, else None."""
+        try:
+            message = self.results.get_nowait()
+        except queue.Empty:
+            if not self.process.is_alive() and self.results.empty():
+                return ("error", f"Simulation worker exited with code {self.process.exitcode}")
+            return None
+        self.process.join()
+        return message
+
+    def cancel(self):
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
@@ -0,0 +1,527 @@
+"""
+Headless CPU scheduling engine.
+
+Pure Python, no tkinter or matplotlib imports, so it can be used from the
+GUI apps, scripts and batch jobs alike. Every algorithm takes plain lists
+(indexed by process) and returns start, completion, waiting and turnaround
+time lists in the same order. Passing a list as `segments` also records
+every stretch of CPU time as a (pid, start, end) tuple, in time order.
+
+Idle CPU time is skipped by jumping straight to the next arrival and the
+ready set is kept in a heap, so picking the next process costs O(log n)
+instead of a full rescan.
+
+Every algorithm also takes a `switch_cost`: whenever the CPU starts running
+a process other than the one that ran last, it first spends that long
+switching, and the process starts only afterwards. A `switches` list
+collects each switch as a (pid, start, end) tuple, like `segments`.
+"""
+import heapq
+from collections import deque
+
+
+def _context_switch(idx, last, t, switch_cost, switches):
+    """Return when `idx` can run if the CPU, free at `t`, last ran `last`."""
+    if idx == last:
+        return t
+    if switches is not None:
+        switches.append((idx, t, t + switch_cost))
+    return t + switch_cost
+
+
+def overhead_summary(burst, switches):
+    """Switch count, total switching time and CPU efficiency (useful / busy)."""
+    overhead = sum(end - start for _, start, end in switches)
+    useful = sum(burst)
+    busy = useful + overhead
+    return {"switches": len(switches), "time": overhead,
+            "efficiency": useful / busy if busy > 0 else 1.0}
+
+
+def fcfs(arrival, burst, segments=None, switch_cost=0, switches=None):
+    n = len(arrival)
+    order = sorted(range(n), key=arrival.__getitem__)
+
+    start_time = [0]*n
+    completion_time = [0]*n
+    waiting_time = [0]*n
+    turnaround_time = [0]*n
+
+    current_time = 0
+    last = -1
+    for idx in order:
+        if current_time < arrival[idx]:
+            current_time = arrival[idx]
+        if switch_cost:
+            current_time = _context_switch(idx, last, current_time, switch_cost, switches)
+            last = idx
+        start_time[idx] = current_time
+        current_time += burst[idx]
+        completion_time[idx] = current_time
+        turnaround_time[idx] = current_time - arrival[idx]
+        waiting_time[idx] = turnaround_time[idx] - burst[idx]
+        if segments is not None:
+            segments.append((idx, start_time[idx], current_time))
+
+    return start_time, completion_time, waiting_time, turnaround_time
+
+
+def _non_preemptive(arrival, burst, key, segments=None, switch_cost=0, switches=None):
+    """Run the ready process with the smallest key to completion, ties by index."""
+    n = len(arrival)
+    order = sorted(range(n), key=arrival.__getitem__)
+
+    start_time = [0]*n
+    completion_time = [0]*n
+    waiting_time = [0]*n
+    turnaround_time = [0]*n
+
+    ready = []
+    current_time = 0
+    last = -1
+    i = 0
+    for _ in range(n):
+        # Nothing ready: jump to the next arrival instead of ticking
+        if not ready and current_time < arrival[order[i]]:
+            current_time = arrival[order[i]]
+        while i < n and arrival[order[i]] <= current_time:
+            idx = order[i]
+            heapq.heappush(ready, (key[idx], idx))
+            i += 1
+
+        _, idx = heapq.heappop(ready)
+        if switch_cost:
+            current_time = _context_switch(idx, last, current_time, switch_cost, switches)
+            last = idx
+        start_time[idx] = current_time
+        current_time += burst[idx]
+        completion_time[idx] = current_time
+        turnaround_time[idx] = current_time - arrival[idx]
+        waiting_time[idx] = turnaround_time[idx] - burst[idx]
+        if segments is not None:
+            segments.append((idx, start_time[idx], current_time))
+
+    return start_time, completion_time, waiting_time, turnaround_time
+
+
+def sjf_with_at(arrival, burst, segments=None, switch_cost=0, switches=None):
+    return _non_preemptive(arrival, burst, burst, segments, switch_cost, switches)
+
+
+def sjf_without_at(burst, segments=None, switch_cost=0, switches=None):
+    n = len(burst)
+    order = sorted(range(n), key=burst.__getitem__)
+
+    start_time = [0]*n
+    completion_time = [0]*n
+    waiting_time = [0]*n
+    turnaround_time = [0]*n
+
+    current_time = 0
+    last = -1
+    for idx in order:
+        if switch_cost:
+            current_time = _context_switch(idx, last, current_time, switch_cost, switches)
+            last = idx
+        start_time[idx] = current_time
+        current_time += burst[idx]
+        completion_time[idx] = current_time
+        turnaround_time[idx] = current_time
+        waiting_time[idx] = start_time[idx]
+        if segments is not None:
+            segments.append((idx, start_time[idx], current_time))
+
+    return start_time, completion_time, waiting_time, turnaround_time
+
+
+def priority_scheduling(arrival, burst, priority, segments=None, switch_cost=0, switches=None):
+    # Lower number means higher priority
+    return _non_preemptive(arrival, burst, priority, segments, switch_cost, switches)
+
+
+def round_robin(arrival, burst, quantum, segments=None, switch_cost=0, switches=None):
+    """
+    Round Robin over a deque with a single cursor into the arrival order.
+
+    Each time slice does O(1) queue work plus the arrivals it admits, so the
+    whole run is linear in the number of slices. A process arriving at the
+    exact moment a quantum expires is queued ahead of the preempted process.
+    """
+    if quantum <= 0:
+        raise ValueError("Time quantum must be positive")
+
+    n = len(arrival)
+    remaining = list(burst)
+    current_time = 0
+    completion_time = [0]*n
+    start_time = [-1]*n
+    ready_queue = deque()
+    last = -1
+
+    order = sorted(range(n), key=arrival.__getitem__)
+
+    i = 0
+    while True:
+        while i < n and arrival[order[i]] <= current_time:
+            ready_queue.append(order[i])
+            i += 1
+
+        if not ready_queue:
+            if i < n:
+                current_time = arrival[order[i]]
+                continue
+            break
+
+        idx = ready_queue.popleft()
+        if switch_cost:
+            current_time = _context_switch(idx, last, current_time, switch_cost, switches)
+            last = idx
+
+        if start_time[idx] == -1:
+            start_time[idx] = current_time
+
+        if segments is not None:
+            segments.append((idx, current_time, current_time + min(quantum, remaining[idx])))
+
+        if remaining[idx] > quantum:
+            current_time += quantum
+            remaining[idx] -= quantum
+            # Arrivals up to the expiry instant go ahead of the preempted process
+            while i < n and arrival[order[i]] <= current_time:
+                ready_queue.append(order[i])
+                i += 1
+            ready_queue.append(idx)
+        else:
+            current_time += remaining[idx]
+            remaining[idx] = 0
+            completion_time[idx] = current_time
+
+    waiting_time = [completion_time[i] - arrival[i] - burst[i] for i in range(n)]
+    turnaround_time = [completion_time[i] - arrival[i] for i in range(n)]
+
+    return start_time, completion_time, waiting_time, turnaround_time
+
+
+# Event kinds; completions sort before arrivals at the same instant so the
+# CPU is released before newcomers compete for it.
+COMPLETION = 0
+ARRIVAL = 1
+
+
+def _preemptive(arrival, burst, priority=None, segments=None, switch_cost=0, switches=None):
+    """
+    Discrete-event core shared by SRTF and preemptive priority.
+
+    Arrival and completion events live in one heap; a completion pushed for a
+    process that is later preempted is left in place and skipped when popped.
+    With priority=None the key is the remaining time (SRTF), otherwise the
+    static priority. The run costs O(events log n), independent of how long
+    the bursts are. An arrival that preempts a process while it is still
+    being switched in cancels that switch: it is not charged, the CPU still
+    holds the process that ran before, and the preempted process has not
+    started yet.
+    """
+    n = len(arrival)
+    remaining = list(burst)
+    start_time = [-1]*n
+    completion_time = [0]*n
+
+    events = [(arrival[i], ARRIVAL, i, 0) for i in range(n)]
+    heapq.heapify(events)
+    key = remaining if priority is None else priority
+
+    ready = []
+    running = -1
+    last = -1
+    previous = -1                   # the process the CPU held before the current switch
+    run_since = dispatched_at = 0
+    dispatch = 0
+
+    while events:
+        t, kind, idx, token = heapq.heappop(events)
+        if kind == COMPLETION:
+            if idx == running and token == dispatch:
+                remaining[idx] = 0
+                completion_time[idx] = t
+                running = -1
+                if start_time[idx] == -1:
+                    start_time[idx] = dispatched_at
+                if segments is not None:
+                    segments.append((idx, dispatched_at, t))
+        else:
+            if running != -1:
+                if t > run_since:
+                    remaining[running] -= t - run_since
+                    run_since = t
+                if key[idx] < key[running]:
+                    heapq.heappush(ready, (key[running], running))
+                    if t < dispatched_at:
+                        last = previous
+                        if switches is not None:
+                            switches.pop()
+                    elif t > dispatched_at:
+                        if start_time[running] == -1:
+                            start_time[running] = dispatched_at
+                        if segments is not None:
+                            segments.append((running, dispatched_at, t))
+                    running = -1
+            heapq.heappush(ready, (key[idx], idx))
+
+        # Dispatch once every event at this instant has been applied
+        if running == -1 and ready and (not events or events[0][0] > t):
+            _, running = heapq.heappop(ready)
+            begin = t
+            if switch_cost:
+                previous = last
+                begin = _context_switch(running, last, t, switch_cost, switches)
+                last = running
+            run_since = dispatched_at = begin
+            dispatch += 1
+            heapq.heappush(events, (begin + remaining[running], COMPLETION, running, dispatch))
+
+    turnaround_time = [completion_time[i] - arrival[i] for i in range(n)]
+    waiting_time = [turnaround_time[i] - burst[i] for i in range(n)]
+
+    return start_time, completion_time, waiting_time, turnaround_time
+
+
+def srtf(arrival, burst, segments=None, switch_cost=0, switches=None):
+    return _preemptive(arrival, burst, None, segments, switch_cost, switches)
+
+
+def preemptive_priority(arrival, burst, priority, segments=None, switch_cost=0, switches=None):
+    # Lower number means higher priority
+    return _preemptive(arrival, burst, priority, segments, switch_cost, switches)
+
+
+def mlfq(arrival, burst, quanta=(2, 4, 8), boost_interval=None, segments=None, switch_cost=0, switches=None):
+    """
+    Multilevel feedback queue with one Round Robin queue per level.
+
+    Arrivals enter the top level. A process that uses up its level's quantum
+    (counted across preemptions) drops one level; the last level keeps
+    cycling with its own quantum, or runs to completion if it is None. A
+    process at a lower level is preempted as soon as anything arrives, and
+    every `boost_interval` time units all processes return to the top level
+    with a fresh allotment. Each slice costs O(1) plus the arrivals it admits.
+    """
+    if not quanta or any(q is not None and q <= 0 for q in quanta):
+        raise ValueError("Every MLFQ quantum must be positive")
+    if quanta[-1] is None:
+        quanta = [float("inf") if q is None else q for q in quanta]
+    if any(q == float("inf") for q in quanta[:-1]):
+        raise ValueError("Only the last MLFQ level may run without a quantum")
+    if boost_interval is not None and boost_interval <= 0:
+        raise ValueError("Priority boost interval must be positive")
+
+    n = len(arrival)
+    levels = len(quanta)
+    remaining = list(burst)
+    start_time = [-1]*n
+    completion_time = [0]*n
+    used = [0]*n
+    # A boost bumps the epoch; allotments from older epochs count as unused,
+    # so boosting never has to touch every process.
+    epoch_of = [0]*n
+    epoch = 0
+    queues = [deque() for _ in range(levels)]
+    last = -1
+
+    order = sorted(range(n), key=arrival.__getitem__)
+    next_boost = boost_interval if boost_interval else float("inf")
+
+    current_time = 0
+    i = 0
+    while True:
+        while i < n and arrival[order[i]] <= current_time:
+            queues[0].append(order[i])
+            i += 1
+        if current_time >= next_boost:
+            epoch += 1
+            for queue in queues[1:]:
+                queues[0].extend(queue)
+                queue.clear()
+            next_boost = (current_time // boost_interval + 1) * boost_interval
+
+        level = next((k for k in range(levels) if queues[k]), -1)
+        if level == -1:
+            if i < n:
+                current_time = arrival[order[i]]
+                continue
+            break
+
+        idx = queues[level].popleft()
+        if epoch_of[idx] != epoch:
+            epoch_of[idx] = epoch
+            used[idx] = 0
+        if switch_cost:
+            current_time = _context_switch(idx, last, current_time, switch_cost, switches)
+            last = idx
+        if start_time[idx] == -1:
+            start_time[idx] = current_time
+
+        # An arrival or boost during a context switch preempts right after it
+        end = current_time + min(quanta[level] - used[idx], remaining[idx])
+        if level > 0 and i < n and arrival[order[i]] < end:
+            end = max(arrival[order[i]], current_time)
+        if next_boost < end:
+            end = max(next_boost, current_time)
+
+        if segments is not None and end > current_time:
+            segments.append((idx, current_time, end))
+        remaining[idx] -= end - current_time
+        used[idx] += end - current_time
+        current_time = end
+
+        if remaining[idx] == 0:
+            completion_time[idx] = current_time
+            continue
+        # Arrivals up to this instant go ahead of the process just run
+        while i < n and arrival[order[i]] <= current_time:
+            queues[0].append(order[i])
+            i += 1
+        if used[idx] >= quanta[level]:
+            used[idx] = 0
+            queues[min(level + 1, levels - 1)].append(idx)
+        else:
+            # Preempted mid-slice: resume first once its level is served again
+            queues[level].appendleft(idx)
+
+    turnaround_time = [completion_time[i] - arrival[i] for i in range(n)]
+    waiting_time = [turnaround_time[i] - burst[i] for i in range(n)]
+
+    return start_time, completion_time, waiting_time, turnaround_time
+
+
+# Load weight per nice level, -20..19, as in the Linux CFS scheduler
+NICE_0_WEIGHT = 1024
+NICE_WEIGHTS = [
+    88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45, 36, 29, 23, 18, 15,
+]
+CFS_TARGET_LATENCY = 20
+
+
+def cfs(arrival, burst, priority=None, target_latency=CFS_TARGET_LATENCY, min_granularity=1, segments=None,
+        switch_cost=0, switches=None):
+    """
+    Completely-fair-style scheduling on virtual runtime.
+
+    Runnable processes sit in a heap ordered by vruntime, so each pick is
+    O(log n). A process runs for its weighted share of `target_latency`
+    (at least `min_granularity`) and its vruntime grows by the time run,
+    scaled by NICE_0_WEIGHT / weight. `priority` is read as a nice value
+    (-20..19, lower gets more CPU); None gives every process equal weight.
+    Newcomers start at the smallest vruntime in the queue so they cannot
+    monopolize the CPU. A process running alone keeps the CPU until the next
+    arrival instead of being re-picked every slice.
+    """
+    if target_latency <= 0 or min_granularity <= 0:
+        raise ValueError("CFS target latency and minimum granularity must be positive")
+
+    n = len(arrival)
+    if priority is None:
+        weight = [NICE_0_WEIGHT]*n
+    else:
+        weight = [NICE_WEIGHTS[min(max(p, -20), 19) + 20] for p in priority]
+    remaining = list(burst)
+    start_time = [-1]*n
+    completion_time = [0]*n
+    vruntime = [0.0]*n
+
+    order = sorted(range(n), key=arrival.__getitem__)
+    ready = []
+    total_weight = 0
+    min_vruntime = 0.0
+    last = -1
+
+    current_time = 0
+    i = 0
+    while True:
+        while i < n and arrival[order[i]] <= current_time:
+            idx = order[i]
+            vruntime[idx] = min_vruntime
+            heapq.heappush(ready, (min_vruntime, idx))
+            total_weight += weight[idx]
+            i += 1
+
+        if not ready:
+            if i < n:
+                current_time = arrival[order[i]]
+                continue
+            break
+
+        _, idx = heapq.heappop(ready)
+        if switch_cost:
+            current_time = _context_switch(idx, last, current_time, switch_cost, switches)
+            last = idx
+        if start_time[idx] == -1:
+            start_time[idx] = current_time
+
+        if ready:
+            run = max(min_granularity, target_latency * weight[idx] // total_weight)
+        else:
+            run = max(min_granularity, (arrival[order[i]] - current_time) if i < n else remaining[idx])
+        run = min(run, remaining[idx])
+
+        if segments is not None:
+            segments.append((idx, current_time, current_time + run))
+        current_time += run
+        remaining[idx] -= run
+        vruntime[idx] += run * NICE_0_WEIGHT / weight[idx]
+
+        if remaining[idx] == 0:
+            completion_time[idx] = current_time
+            total_weight -= weight[idx]
+        else:
+            heapq.heappush(ready, (vruntime[idx], idx))
+        if ready and ready[0][0] > min_vruntime:
+            min_vruntime = ready[0][0]
+
+    turnaround_time = [completion_time[i] - arrival[i] for i in range(n)]
+    waiting_time = [turnaround_time[i] - burst[i] for i in range(n)]
+
+    return start_time, completion_time, waiting_time, turnaround_time
+
+
+def _mlfq_quanta(quantum):
+    # A single quantum doubles per level; a sequence gives each level's quantum
+    if isinstance(quantum, (list, tuple)):
+        return quantum
+    return (quantum, 2 * quantum, 4 * quantum)
+
+
+ALGORITHMS = {
+    "FCFS": lambda arrival, burst, priority, quantum, segments, **options: fcfs(arrival, burst, segments, **options),
+    "SJF with AT": lambda arrival, burst, priority, quantum, segments, **options: sjf_with_at(arrival, burst, segments, **options),
+    "SJF without AT": lambda arrival, burst, priority, quantum, segments, **options: sjf_without_at(burst, segments, **options),
+    "Priority Scheduling": lambda arrival, burst, priority, quantum, segments, **options: priority_scheduling(arrival, burst, priority, segments, **options),
+    "Round Robin": lambda arrival, burst, priority, quantum, segments, **options: round_robin(arrival, burst, quantum, segments, **options),
+    "SRTF": lambda arrival, burst, priority, quantum, segments, **options: srtf(arrival, burst, segments, **options),
+    "Preemptive Priority": lambda arrival, burst, priority, quantum, segments, **options: preemptive_priority(arrival, burst, priority, segments, **options),
+    "MLFQ": lambda arrival, burst, priority, quantum, segments, boost_interval=None, **options:
+        mlfq(arrival, burst, _mlfq_quanta(quantum), boost_interval, segments, **options),
+    "CFS": lambda arrival, burst, priority, quantum, segments, target_latency=CFS_TARGET_LATENCY, **options:
+        cfs(arrival, burst, priority, target_latency, quantum, segments, **options),
+}
+
+# Algorithms whose schedule depends on `quantum`; the rest ignore it
+QUANTUM_ALGORITHMS = ("Round Robin", "MLFQ", "CFS")
+
+
+def schedule(algo, arrival, burst, priority=None, quantum=2, segments=None, **options):
+    """
+    Run the algorithm registered under `algo` and return (st, ct, wt, tat).
+
+    Every algorithm accepts `switch_cost` and `switches`. For MLFQ
+    `quantum` is the top-level quantum (doubled per level) or a list of
+    per-level quanta, and `boost_interval` may be passed; for CFS `quantum`
+    is the minimum slice and `target_latency` may be passed.
+    """
+    if algo not in ALGORITHMS:
+        raise ValueError(f"Unknown Algorithm: {algo}")
+    if priority is None:
+        priority = [0]*len(burst)
+    return ALGORITHMS[algo](arrival, burst, priority, quantum, segments, **options)
@@ -0,0 +1,66 @@
+"""
+Startup timing and background warm-up for the main menu.
+
+Main.py imports only tkinter before drawing the menu; every tool imports its
+own heavy dependencies (matplotlib, seaborn, psutil, cryptography, ...) when
+it opens. report_first_paint() measures how long the menu took to appear and
+compares it with a budget. warm_up() then imports those dependencies on a
+background thread while the menu sits idle, so the first tool opened is
+quick too. Python's import locks make this safe: a tool that opens mid
+warm-up simply waits for the module being imported.
+"""
+import importlib
+import os
+import sys
+import threading
+import time
+
+FIRST_PAINT_BUDGET_MS = 400
+
+
+def report_first_paint(root, launched, budget_ms=FIRST_PAINT_BUDGET_MS, on_paint=None, stream=None):
+    """
+    Print the time from `launched` (a perf_counter() value) to the first paint of `root`.
+
+    The window counts as painted at the first idle moment after it is
+    mapped, once Tk has drawn it. `on_paint(elapsed_ms, within_budget)` is
+    called afterwards.
+    """
+    def painted():
+        elapsed_ms = (time.perf_counter() - launched) * 1000
+        within = elapsed_ms <= budget_ms
+        print(f"Main menu first paint: {elapsed_ms:.0f} ms (budget {budget_ms} ms"
+              f"{'' if within else ', OVER BUDGET'})", file=stream or sys.stderr)
+        if on_paint is not None:
+            on_paint(elapsed_ms, within)
+
+    def mapped(event):
+        if event.widget is root:
+            root.unbind("<Map>", binding)
+            root.after_idle(painted)
+
+    binding = root.bind("<Map>", mapped, add="+")
+
+
+def warm_up(modules, enabled=None):
+    """
+    Import `modules` one by one on a daemon thread; returns the thread, or None.
+
+    Missing optional modules are skipped. Set SUITE_WARM_UP=0 to disable.
+    """
+    if enabled is None:
+        enabled = os.environ.get("SUITE_WARM_UP", "1") != "0"
+    if not enabled:
+        return None
+
+    def run():
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                # The tool that needs it reports the problem when it opens
+                pass
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
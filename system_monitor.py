@@ -6,6 +6,7 @@ import seaborn as sns
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.animation import FuncAnimation
 import time
+import lifecycle
 
 class ResourceMonitorApp:
     def __init__(self, root):
@@ -29,16 +30,32 @@ class ResourceMonitorApp:
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.root)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        # Prime the CPU counter so each update reads usage since the last one without blocking
+        psutil.cpu_percent(interval=None)
+
         # Start the real-time plotting
         self.ani = FuncAnimation(self.fig, self.update, interval=1000, cache_frame_data=False)
 
+    def pause(self):
+        """Stop sampling and redrawing while the window is hidden."""
+        self.ani.pause()
+
+    def resume(self):
+        psutil.cpu_percent(interval=None)
+        self.ani.resume()
+
+    def close(self):
+        """Stop the animation timer and release the figure."""
+        self.ani.event_source.stop()
+        plt.close(self.fig)
+
     def update(self, frame):
         # Record current time
         current_time = time.strftime("%H:%M:%S")
         self.x_data.append(current_time)
 
         # CPU usage
-        cpu = psutil.cpu_percent(interval=0.1)
+        cpu = psutil.cpu_percent(interval=None)
         self.cpu_data.append(cpu)
         self.ax1.clear()
         self.ax1.plot(self.x_data, self.cpu_data, label="CPU Usage", color="blue")
@@ -74,9 +91,10 @@ class ResourceMonitorApp:
             self.ram_data.pop(0)
 
         # Redraw the canvas to update the plot
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = ResourceMonitorApp(root)
+    lifecycle.WindowManager(root).track(root, app)
     root.mainloop()
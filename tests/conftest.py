@@ -0,0 +1,26 @@
+import os
+import random
+import sys
+
+import pytest
+
+# The modules live at the repository root, not in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Tests never open windows
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+
+@pytest.fixture
+def random_cases():
+    """Small random workloads as (arrival, burst, priority, quantum, switch_cost) tuples."""
+    rng = random.Random(2024)
+    cases = []
+    for _ in range(300):
+        n = rng.randint(1, 8)
+        cases.append(([rng.randint(0, 15) for _ in range(n)],
+                      [rng.randint(1, 9) for _ in range(n)],
+                      [rng.randint(0, 4) for _ in range(n)],
+                      rng.randint(1, 4),
+                      rng.choice([0, 0, 1, 2])))
+    return cases
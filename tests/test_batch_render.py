@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+import batch_render
+import compare
+import scheduler
+
+
+def test_quanta_only_sweep_quantum_algorithms():
+    scenarios = batch_render.expand_scenarios([
+        {"name": "mix", "algo": ["fcfs", "rr", "mlfq"], "quantum": [2, 4], "burst": [3, 5]},
+    ])
+    names = [scenario["name"] for scenario in scenarios]
+    assert names == ["mix-FCFS", "mix-Round-Robin-q2", "mix-Round-Robin-q4", "mix-MLFQ-q2", "mix-MLFQ-q4"]
+    assert len(set(names)) == len(names)
+
+
+@pytest.mark.parametrize("spec, message", [
+    ({"burst": [3]}, "no algorithm given"),
+    ({"algo": "fcfs", "burst": [3], "colour": "red"}, "unknown keys colour"),
+    ({"algo": "fcfs", "burst": [3, 4], "devices": [[], []]}, "devices need bursts given as CPU/IO sequences"),
+    ({"algo": "fcfs", "generate": 10, "num_devices": 2}, "num_devices need bursts given as CPU/IO sequences"),
+])
+def test_invalid_scenarios(spec, message):
+    with pytest.raises(ValueError, match=message):
+        batch_render.expand_scenarios([spec])
+
+
+def test_device_options_with_io_bursts():
+    [scenario] = batch_render.expand_scenarios([{"algo": "fcfs", "burst": [[2, 3, 2], [4]], "num_devices": 2}])
+    assert scenario["num_devices"] == 2
+
+
+def test_workload_errors():
+    with pytest.raises(ValueError, match="the burst list is empty"):
+        batch_render.load_workload({"name": "empty", "burst": []})
+    with pytest.raises(ValueError, match="same length"):
+        batch_render.load_workload({"name": "short", "burst": [3, 4], "arrival": [0]})
+    with pytest.raises(ValueError, match="no workload"):
+        batch_render.load_workload({"name": "none"})
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_render_batch(tmp_path, jobs):
+    scenarios = batch_render.expand_scenarios([
+        {"name": "flat", "algo": ["fcfs", "rr"], "burst": [3, 5, 2], "arrival": [0, 1, 2]},
+        {"name": "io", "algo": "rr", "burst": [[2, 3, 2], [4]], "num_devices": 2},
+        {"name": "smp", "algo": "fcfs", "generate": 20, "seed": 1, "num_cores": 2},
+    ])
+    reports = batch_render.render_batch(scenarios, str(tmp_path), jobs=jobs)
+    assert [report["name"] for report in reports] == [scenario["name"] for scenario in scenarios]
+    for report in reports:
+        assert "error" not in report, report.get("error")
+        assert all(os.path.getsize(path) > 0 for path in report["files"])
+    assert (tmp_path / "summary.txt").exists()
+
+
+def test_comparison_cases_and_labels():
+    cases = compare.comparison_cases(quanta=(1, 4), quantum=[2, 4, 8])
+    assert ("MLFQ", [2, 4, 8]) in cases and ("CFS", 2) in cases
+    assert ("Round Robin", 1) in cases and ("Round Robin", 4) in cases
+    assert len(cases) == len(scheduler.ALGORITHMS) + 1
+
+
+def test_compare_all_passes_algorithm_options():
+    rows = compare.compare_all([0, 1, 2], [6, 4, 5], quanta=(2,), quantum=2,
+                               options={"MLFQ": {"boost_interval": 10}, "CFS": {"target_latency": 8}})
+    labels = {row["algo"]: row["label"] for row in rows}
+    assert labels["MLFQ"] == "MLFQ (q=2, boost=10)"
+    assert labels["CFS"] == "CFS (q=2, latency=8)"
+    assert labels["FCFS"] == "FCFS"
+    fcfs = next(row for row in rows if row["algo"] == "FCFS")
+    assert fcfs["avg_waiting"] == pytest.approx((0 + 5 + 8) / 3)
@@ -0,0 +1,84 @@
+import os
+import pickle
+
+import numpy as np
+
+import cache
+import runner
+
+
+def job(**changes):
+    spec = {"algo": "Round Robin", "arrival": [0, 1, 2], "burst": [4, 3, 5], "quantum": 2}
+    spec.update(changes)
+    return spec
+
+
+def test_fingerprint_covers_every_input():
+    key = cache.fingerprint(**job())
+    assert key == cache.fingerprint(**job())
+    # NumPy arrays and lists with the same values are the same workload
+    assert key == cache.fingerprint(**job(arrival=np.array([0, 1, 2]), burst=np.array([4, 3, 5])))
+    assert key != cache.fingerprint(**job(quantum=3))
+    assert key != cache.fingerprint(**job(burst=[4, 3, 6]))
+    assert key != cache.fingerprint(**job(algo="FCFS"))
+    assert key != cache.fingerprint(**job(switch_cost=1))
+
+
+def test_memory_hits_and_misses():
+    results = cache.ResultCache()
+    calls = []
+
+    def run(**spec):
+        calls.append(spec)
+        return runner.simulate(**spec)
+
+    first = results.get_or_run(run, **job())
+    second = results.get_or_run(run, **job())
+    assert second is first
+    assert len(calls) == 1
+    assert (results.hits, results.misses) == (1, 1)
+    results.get_or_run(run, **job(quantum=3))
+    assert len(calls) == 2
+
+
+def test_lru_eviction_under_budget():
+    results = cache.ResultCache(max_bytes=3 * cache.estimate_size(list(range(100))))
+    for key in "abcd":
+        results.put(key, list(range(100)))
+    assert "a" not in results and "d" in results
+    assert results.total_bytes <= results.max_bytes
+
+
+def test_disk_tier_survives_sessions(tmp_path):
+    key = cache.fingerprint(**job())
+    results = cache.ResultCache(directory=str(tmp_path))
+    results.put(key, {"ct": [1, 2, 3]})
+    later = cache.ResultCache(directory=str(tmp_path))
+    assert later.get(key) == {"ct": [1, 2, 3]}
+    assert later.hits == 1
+
+
+def test_results_from_another_engine_are_misses(tmp_path):
+    key = cache.fingerprint(**job())
+    results = cache.ResultCache(directory=str(tmp_path))
+    assert os.path.basename(results.directory) == "v" + cache.engine_version()
+    with open(results._path(key), "wb") as f:
+        pickle.dump(("old-engine", {"ct": [0]}), f)
+    assert results.get(key) is None
+    # Files from before results were versioned, and damaged ones, too
+    with open(results._path(key), "wb") as f:
+        pickle.dump({"ct": [0]}, f)
+    assert results.get(key) is None
+    with open(results._path(key), "wb") as f:
+        f.write(b"not a pickle")
+    assert results.get(key) is None
+    assert results.misses == 3
+
+
+def test_version_bump_changes_keys_and_directory(tmp_path, monkeypatch):
+    key = cache.fingerprint(**job())
+    directory = cache.ResultCache(directory=str(tmp_path)).directory
+    monkeypatch.setattr(cache, "CACHE_VERSION", cache.CACHE_VERSION + 1)
+    monkeypatch.setattr(cache, "_engine_version", None)
+    assert cache.fingerprint(**job()) != key
+    assert cache.ResultCache(directory=str(tmp_path)).directory != directory
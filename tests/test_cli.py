@@ -0,0 +1,67 @@
+import csv
+
+import pytest
+
+import cli
+
+
+def run_cli(capsys, *argv):
+    """Run the CLI and return (exit status, stdout, stderr)."""
+    try:
+        status = cli.main(list(argv))
+    except SystemExit as e:
+        status = e.code
+    captured = capsys.readouterr()
+    return status, captured.out, captured.err
+
+
+@pytest.mark.parametrize("argv, message", [
+    (["--algo", "rr", "--burst", "3,4", "--quantum", ","], "expected at least one integer"),
+    (["--algo", "rr", "--burst", "3,4", "--quantum", "0"], "expected positive integers"),
+    (["--algo", "rr", "--burst", "3,4", "--quantum", "2,x"], "expected comma-separated integers"),
+    (["--algo", "fcfs", "--burst", ","], "expected at least one integer"),
+    (["--algo", "fcfs", "--burst", "3,-1"], "expected positive integers"),
+    (["--algo", "fcfs", "--burst", "3,4", "--arrival", "0"], "must have the same length"),
+    (["--algo", "lottery", "--burst", "3"], "unknown algorithm"),
+    (["--algo", "fcfs", "--burst", "3", "--boost", "5"], "--boost only applies to MLFQ"),
+    (["--algo", "fcfs", "--burst", "3", "--latency", "5"], "--latency only applies to CFS"),
+    (["--algo", "fcfs", "--generate", "0"], "could not load workload"),
+    (["--algo", "fcfs", "--trace", "/nonexistent/trace.csv"], "could not load workload"),
+    (["--algo", "srtf", "--burst", "3,4", "--cores", "2"], "not supported on multiple cores"),
+    (["--algo", "fcfs"], "one of the arguments"),
+])
+def test_argument_errors(capsys, argv, message):
+    status, _, err = run_cli(capsys, *argv)
+    assert status == 2
+    assert message in err
+    assert "Traceback" not in err
+
+
+def test_aliases_and_full_names():
+    assert cli.algorithm_name("RR") == "Round Robin"
+    assert cli.algorithm_name(" preemptive priority ") == "Preemptive Priority"
+
+
+def test_results_csv(tmp_path, capsys):
+    out = tmp_path / "results.csv"
+    segments = tmp_path / "segments.csv"
+    status, _, _ = run_cli(capsys, "--algo", "rr", "--burst", "5,3", "--arrival", "0,1", "--quantum", "2",
+                           "--out", str(out), "--segments", str(segments), "--quiet")
+    assert status == 0
+    with open(out) as f:
+        rows = list(csv.DictReader(f))
+    assert [row["completion"] for row in rows] == ["8", "7"]
+    with open(segments) as f:
+        assert len(list(csv.reader(f))) > 2
+
+
+def test_mlfq_level_quanta_and_boost(capsys):
+    status, _, _ = run_cli(capsys, "--algo", "mlfq", "--burst", "9,9", "--quantum", "1,2,4", "--boost", "6",
+                           "--quiet")
+    assert status == 0
+
+
+def test_generated_workload(capsys):
+    status, out, _ = run_cli(capsys, "--algo", "sjf", "--generate", "50", "--seed", "3")
+    assert status == 0
+    assert "SJF with AT" in out
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+import metrics
+import multiburst
+import multicore
+import online
+import runner
+import scheduler
+import workloads
+
+
+def batch_result(algo, arrival, burst, priority, quantum, switch_cost):
+    switches = []
+    st, ct, _, _ = scheduler.schedule(algo, arrival, burst, priority, quantum,
+                                      switch_cost=switch_cost, switches=switches)
+    return st, ct, len(switches)
+
+
+@pytest.mark.parametrize("algo", list(online.POLICIES))
+def test_online_matches_batch(algo, random_cases):
+    for arrival, burst, priority, quantum, switch_cost in random_cases:
+        sim = online.OnlineScheduler(algo, quantum, switch_cost=switch_cost)
+        for a, b, p in zip(arrival, burst, priority):
+            sim.submit(a, b, p)
+        sim.run()
+        st, ct, switches = batch_result(algo, arrival, burst, priority, quantum, switch_cost)
+        assert (sim.start_time, sim.completion_time, sim.switches) == (st, ct, switches)
+
+
+@pytest.mark.parametrize("algo", list(online.POLICIES))
+def test_online_advance_in_steps(algo, random_cases):
+    # Submitting each job as the clock reaches it gives the same schedule
+    for arrival, burst, priority, quantum, switch_cost in random_cases:
+        sim = online.OnlineScheduler(algo, quantum, switch_cost=switch_cost)
+        for a, b, p in sorted(zip(arrival, burst, priority), key=lambda job: job[0]):
+            sim.advance(a)
+            sim.submit(a, b, p)
+        sim.run()
+        order = sorted(range(len(arrival)), key=arrival.__getitem__)
+        st, ct, _ = batch_result(algo, [arrival[i] for i in order], [burst[i] for i in order],
+                                 [priority[i] for i in order], quantum, switch_cost)
+        assert (sim.start_time, sim.completion_time) == (st, ct)
+
+
+def test_online_rejects_past_arrivals():
+    sim = online.OnlineScheduler("FCFS")
+    sim.advance(5)
+    with pytest.raises(ValueError):
+        sim.submit(4, 1)
+
+
+@pytest.mark.parametrize("algo", list(multiburst.POLICIES))
+def test_single_burst_multiburst_matches_batch(algo, random_cases):
+    for arrival, burst, priority, quantum, switch_cost in random_cases:
+        io = multiburst.simulate(arrival, [[b] for b in burst], algo, priority, quantum,
+                                 switch_cost=switch_cost)
+        assert (io.start_time, io.completion_time, io.switches) == \
+            batch_result(algo, arrival, burst, priority, quantum, switch_cost)
+
+
+def test_multiburst_accounts_for_io():
+    io = multiburst.simulate([0, 0], [[2, 3, 2], [4]], "FCFS")
+    assert io.cpu_time == [4, 4]
+    assert io.io_time == [3, 0]
+    assert io.completion_time == [8, 6]
+    assert io.device_segments == [(0, 0, 2, 5)]
+    with pytest.raises(ValueError):
+        multiburst.simulate([0], [[2, 3]], "FCFS")
+
+
+@pytest.mark.parametrize("algo", list(multicore.POLICIES))
+def test_one_core_matches_batch(algo, random_cases):
+    for arrival, burst, priority, quantum, switch_cost in random_cases:
+        smp = multicore.simulate_smp(arrival, burst, 1, algo, priority, quantum, switch_cost=switch_cost)
+        st, ct, _ = batch_result(algo, arrival, burst, priority, quantum, switch_cost)
+        assert (smp.start_time, smp.completion_time) == (st, ct)
+
+
+@pytest.mark.parametrize("queue_mode, work_stealing, balance_interval", [
+    (multicore.GLOBAL, False, None),
+    (multicore.PER_CORE, False, None),
+    (multicore.PER_CORE, True, None),
+    (multicore.PER_CORE, True, 5),
+])
+@pytest.mark.parametrize("algo", list(multicore.POLICIES))
+def test_cores_never_overlap(algo, queue_mode, work_stealing, balance_interval, random_cases):
+    for arrival, burst, priority, quantum, switch_cost in random_cases:
+        smp = multicore.simulate_smp(arrival, burst, 3, algo, priority, quantum, queue_mode,
+                                     work_stealing, balance_interval, switch_cost, migration_penalty=1)
+        ran = [0]*len(burst)
+        by_core = {}
+        for pid, core, start, end in smp.segments:
+            assert arrival[pid] <= start < end
+            ran[pid] += end - start
+            by_core.setdefault(core, []).append((start, end))
+        assert ran == burst
+        for spans in by_core.values():
+            spans.sort()
+            assert all(a[1] <= b[0] for a, b in zip(spans, spans[1:]))
+        # A process never runs on two cores at once
+        for pid in range(len(burst)):
+            spans = sorted((s, e) for p, _, s, e in smp.segments if p == pid)
+            assert all(a[1] <= b[0] for a, b in zip(spans, spans[1:]))
+
+
+def test_runner_dispatches_by_workload():
+    result = runner.simulate("Round Robin", [0, 1], [3, 2], quantum=1, switch_cost=1)
+    assert result["smp"] is None and result["io"] is None
+    assert result["overhead"]["switches"] == len(result["segments"])
+    assert runner.simulate("FCFS", [0, 0], [3, 2], num_cores=2)["smp"].makespan == 3
+    assert runner.simulate("FCFS", [0], [[1, 2, 1]])["io"].completion_time == [4]
+    with pytest.raises(ValueError):
+        runner.simulate("Lottery", [0], [1])
+
+
+def test_generated_workloads():
+    arrival, burst, priority = workloads.generate_workload(200, seed=1)
+    again = workloads.generate_workload(200, seed=1)
+    assert all((a == b).all() for a, b in zip((arrival, burst, priority), again))
+    assert len(arrival) == 200 and burst.min() > 0 and (arrival[1:] >= arrival[:-1]).all()
+    with pytest.raises(ValueError):
+        workloads.generate_workload(0)
+
+
+def test_quantile_sketch():
+    sketch = metrics.QuantileSketch()
+    for value in np.arange(1, 10001):
+        sketch.add(value)
+    assert sketch.quantile(0.5) == pytest.approx(5000, rel=0.02)
+    assert sketch.percentiles() == pytest.approx({50: 5000, 95: 9500, 99: 9900}, rel=0.02)
+    assert (sketch.min, sketch.max) == (1, 10000)
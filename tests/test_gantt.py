@@ -0,0 +1,14 @@
+import gantt
+import multiburst
+
+
+def test_chart_stays_bounded_across_runs():
+    counts = gantt.check_bounded(runs=60)
+    assert gantt.check_failures(counts) == []
+
+
+def test_io_schedule_lanes():
+    io = multiburst.simulate([0, 0], [[2, 3, 2], [4]], "FCFS", num_devices=2)
+    segments, lanes = gantt.io_schedule(io)
+    assert len(lanes) == 3
+    assert sorted(segment[0] for segment in segments) == [0, 0, 0, 1]
@@ -0,0 +1,72 @@
+import random
+import time
+
+import pytest
+
+import realtime
+
+
+def random_task_sets(count, offsets=False):
+    rng = random.Random(99)
+    for _ in range(count):
+        n = rng.randint(1, 4)
+        periods = [rng.choice([2, 3, 4, 5, 6, 8, 10, 12]) for _ in range(n)]
+        wcets = [rng.randint(1, max(1, p // 2)) for p in periods]
+        deadlines = [rng.randint(w, p) for w, p in zip(wcets, periods)]
+        task_offsets = [rng.randint(0, p - 1) for p in periods] if offsets else None
+        yield periods, wcets, deadlines, task_offsets
+
+
+@pytest.mark.parametrize("policy", realtime.POLICIES)
+def test_analysis_agrees_with_simulation(policy):
+    decided_false = 0
+    for periods, wcets, deadlines, _ in random_task_sets(500):
+        report = realtime.analyze(periods, wcets, deadlines, policy=policy)
+        result = realtime.simulate(periods, wcets, deadlines, policy=policy)
+        assert report["schedulable"] == (not result.misses), (periods, wcets, deadlines, report["method"])
+        decided_false += not report["schedulable"]
+    # Both outcomes are exercised
+    assert 0 < decided_false < 500
+
+
+@pytest.mark.parametrize("policy", realtime.POLICIES)
+def test_analysis_with_offsets_agrees_with_simulation(policy):
+    for periods, wcets, deadlines, offsets in random_task_sets(300, offsets=True):
+        report = realtime.analyze(periods, wcets, deadlines, offsets, policy=policy)
+        horizon = max(offsets) + 2 * realtime.hyperperiod(periods)
+        result = realtime.simulate(periods, wcets, deadlines, offsets, policy, horizon)
+        assert report["schedulable"] == (not result.misses), (periods, wcets, deadlines, offsets)
+
+
+def test_response_times_match_simulation():
+    periods, wcets = [4, 6, 12], [1, 2, 3]
+    report = realtime.analyze(periods, wcets, [3, 5, 12], policy=realtime.RM)
+    result = realtime.simulate(periods, wcets, [3, 5, 12], policy=realtime.RM)
+    assert report["response_times"] == result.max_response == [1, 3, 10]
+
+
+def test_hyperperiod_limit():
+    assert realtime.hyperperiod([4, 6, 10]) == 60
+    assert realtime.hyperperiod([4, 6, 10], limit=59) is None
+    assert realtime.hyperperiod([4, 6, 10], limit=60) == 60
+
+
+def test_huge_hyperperiod_stays_undecided_and_fast():
+    primes = [p for p in range(1000, 8000) if all(p % d for d in range(2, int(p**0.5) + 1))][:300]
+    wcets = [1]*len(primes)
+    # Deadlines shorter than the periods and offsets force the simulation fallback
+    deadlines = [1]*len(primes)
+    offsets = list(range(len(primes)))
+    t0 = time.perf_counter()
+    report = realtime.analyze(primes, wcets, deadlines, offsets, policy=realtime.EDF)
+    assert time.perf_counter() - t0 < 5
+    assert report["schedulable"] is None
+    assert "exceed" in report["method"]
+    with pytest.raises(ValueError):
+        realtime.simulate(primes, wcets)
+
+
+def test_overload_fails_on_utilization():
+    report = realtime.analyze([2, 3], [1, 2])
+    assert report["schedulable"] is False
+    assert report["method"] == "utilization above 1"
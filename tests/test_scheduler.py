@@ -0,0 +1,208 @@
+import numpy as np
+import pytest
+
+import batch_scheduler
+import scheduler
+
+
+# Reference implementations: the original GUI's scan-every-tick versions
+
+def baseline_fcfs(arrival, burst):
+    n = len(arrival)
+    start_time = [0]*n
+    completion_time = [0]*n
+    current_time = 0
+    for idx in sorted(range(n), key=lambda i: arrival[i]):
+        current_time = max(current_time, arrival[idx])
+        start_time[idx] = current_time
+        current_time += burst[idx]
+        completion_time[idx] = current_time
+    return start_time, completion_time
+
+
+def baseline_non_preemptive(arrival, burst, key):
+    n = len(arrival)
+    completed = [False]*n
+    start_time = [0]*n
+    completion_time = [0]*n
+    current_time = 0
+    for _ in range(n):
+        idx = -1
+        while idx == -1:
+            best = float("inf")
+            for i in range(n):
+                if arrival[i] <= current_time and not completed[i] and key[i] < best:
+                    best = key[i]
+                    idx = i
+            if idx == -1:
+                current_time += 1
+        start_time[idx] = current_time
+        current_time += burst[idx]
+        completion_time[idx] = current_time
+        completed[idx] = True
+    return start_time, completion_time
+
+
+def baseline_round_robin(arrival, burst, quantum):
+    n = len(arrival)
+    remaining = list(burst)
+    start_time = [-1]*n
+    completion_time = [0]*n
+    order = sorted(range(n), key=lambda i: arrival[i])
+    ready = []
+    current_time = 0
+    i = 0
+    while True:
+        while i < n and arrival[order[i]] <= current_time:
+            ready.append(order[i])
+            i += 1
+        if not ready:
+            if i == n:
+                break
+            current_time = arrival[order[i]]
+            continue
+        idx = ready.pop(0)
+        if start_time[idx] == -1:
+            start_time[idx] = current_time
+        run = min(quantum, remaining[idx])
+        current_time += run
+        remaining[idx] -= run
+        if remaining[idx]:
+            # Arrivals during the slice queue ahead of the preempted process
+            while i < n and arrival[order[i]] <= current_time:
+                ready.append(order[i])
+                i += 1
+            ready.append(idx)
+        else:
+            completion_time[idx] = current_time
+    return start_time, completion_time
+
+
+def baseline_preemptive(arrival, burst, priority=None):
+    """Unit-step simulation; priority=None means shortest remaining time first."""
+    n = len(arrival)
+    remaining = list(burst)
+    key = remaining if priority is None else priority
+    start_time = [-1]*n
+    completion_time = [0]*n
+    running = -1
+    t = 0
+    while any(remaining):
+        ready = [i for i in range(n) if arrival[i] <= t and remaining[i] and i != running]
+        best = min(ready, key=lambda i: (key[i], i), default=-1)
+        if best != -1 and (running == -1 or key[best] < key[running]):
+            running = best
+        if running != -1:
+            if start_time[running] == -1:
+                start_time[running] = t
+            remaining[running] -= 1
+            if not remaining[running]:
+                completion_time[running] = t + 1
+                running = -1
+        t += 1
+    return start_time, completion_time
+
+
+def check_segments(arrival, burst, st, ct, segments):
+    """Segments cover each burst exactly, never overlap and agree with st/ct."""
+    ran = [0]*len(burst)
+    previous_end = 0
+    for pid, start, end in segments:
+        assert start < end and start >= previous_end and start >= arrival[pid]
+        ran[pid] += end - start
+        previous_end = end
+    assert ran == list(burst)
+    for pid in range(len(burst)):
+        own = [segment for segment in segments if segment[0] == pid]
+        assert st[pid] == own[0][1]
+        assert ct[pid] == own[-1][2]
+
+
+def test_fcfs_matches_baseline(random_cases):
+    for arrival, burst, _, _, _ in random_cases:
+        st, ct, wt, tat = scheduler.fcfs(arrival, burst)
+        assert (st, ct) == baseline_fcfs(arrival, burst)
+        assert tat == [c - a for c, a in zip(ct, arrival)]
+        assert wt == [t - b for t, b in zip(tat, burst)]
+
+
+def test_non_preemptive_matches_baseline(random_cases):
+    for arrival, burst, priority, _, _ in random_cases:
+        st, ct, _, _ = scheduler.sjf_with_at(arrival, burst)
+        assert (st, ct) == baseline_non_preemptive(arrival, burst, burst)
+        st, ct, _, _ = scheduler.priority_scheduling(arrival, burst, priority)
+        assert (st, ct) == baseline_non_preemptive(arrival, burst, priority)
+        st, ct, _, _ = scheduler.sjf_without_at(burst)
+        assert (st, ct) == baseline_non_preemptive([0]*len(burst), burst, burst)
+
+
+def test_round_robin_matches_baseline(random_cases):
+    for arrival, burst, _, quantum, _ in random_cases:
+        st, ct, _, _ = scheduler.round_robin(arrival, burst, quantum)
+        assert (st, ct) == baseline_round_robin(arrival, burst, quantum)
+
+
+def test_preemptive_matches_unit_step_simulation(random_cases):
+    for arrival, burst, priority, _, _ in random_cases:
+        st, ct, _, _ = scheduler.srtf(arrival, burst)
+        assert (st, ct) == baseline_preemptive(arrival, burst)
+        st, ct, _, _ = scheduler.preemptive_priority(arrival, burst, priority)
+        assert (st, ct) == baseline_preemptive(arrival, burst, priority)
+
+
+@pytest.mark.parametrize("algo", list(scheduler.ALGORITHMS))
+def test_segments_account_for_every_burst(algo, random_cases):
+    for arrival, burst, priority, quantum, _ in random_cases:
+        segments = []
+        st, ct, _, _ = scheduler.schedule(algo, arrival, burst, priority, quantum, segments)
+        if algo == "SJF without AT":
+            arrival = [0]*len(burst)
+        check_segments(arrival, burst, st, ct, segments)
+
+
+@pytest.mark.parametrize("algo", list(scheduler.ALGORITHMS))
+def test_switch_cost(algo, random_cases):
+    for arrival, burst, priority, quantum, switch_cost in random_cases:
+        segments = []
+        switches = []
+        st, ct, _, _ = scheduler.schedule(algo, arrival, burst, priority, quantum, segments,
+                                          switch_cost=switch_cost, switches=switches)
+        if algo == "SJF without AT":
+            arrival = [0]*len(burst)
+        check_segments(arrival, burst, st, ct, segments)
+        # Switches and segments share one CPU
+        busy = sorted([(s, e) for _, s, e in segments] + [(s, e) for _, s, e in switches if e > s])
+        assert all(a[1] <= b[0] for a, b in zip(busy, busy[1:]))
+        assert all(end - start == switch_cost for _, start, end in switches)
+        summary = scheduler.overhead_summary(burst, switches)
+        assert summary["time"] == switch_cost * len(switches)
+        if not switch_cost:
+            assert switches == []
+
+
+def test_switch_cancelled_by_preemption():
+    # P1 arrives while P0 is still being switched in, so that switch is
+    # never charged and P0 only starts after P1
+    switches = []
+    st, ct, _, _ = scheduler.srtf([0, 1], [5, 1], switch_cost=2, switches=switches)
+    assert switches == [(1, 1, 3), (0, 4, 6)]
+    assert st == [6, 3]
+    assert ct == [11, 4]
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        scheduler.schedule("Lottery", [0], [1])
+
+
+@pytest.mark.parametrize("switch_cost", [0, 3])
+def test_vectorized_batch_matches_scheduler(switch_cost):
+    rng = np.random.default_rng(7)
+    arrival = rng.integers(0, 500, 2000)
+    burst = rng.integers(1, 20, 2000)
+    expected = scheduler.fcfs(arrival.tolist(), burst.tolist(), switch_cost=switch_cost, switches=[])
+    for got, want in zip(batch_scheduler.fcfs_batch(arrival, burst, switch_cost), expected):
+        assert got.tolist() == want
+    expected = scheduler.sjf_without_at(burst.tolist(), switch_cost=switch_cost, switches=[])
+    for got, want in zip(batch_scheduler.sjf_without_at_batch(burst, switch_cost), expected):
+        assert got.tolist() == want
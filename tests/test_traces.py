@@ -0,0 +1,34 @@
+import pytest
+
+import scheduler
+import traces
+
+JOBS = [(0, 5, 1), (2, 3, 0), (2, 8, 2), (9, 1, 0)]
+
+
+@pytest.mark.parametrize("writer, name", [(traces.write_csv, "jobs.csv"), (traces.write_binary, "jobs.bin")])
+def test_round_trip(tmp_path, writer, name):
+    path = str(tmp_path / name)
+    assert writer(path, iter(JOBS)) == len(JOBS)
+    arrival, burst, priority = traces.load_trace(path)
+    assert list(zip(arrival, burst, priority)) == JOBS
+    # The typed arrays go straight into the schedulers
+    assert scheduler.fcfs(arrival, burst)[1] == [5, 8, 16, 17]
+
+
+def test_csv_variants(tmp_path):
+    path = tmp_path / "variants.csv"
+    path.write_text("# comment\nburst,arrival\n4,0\n2,1\n")
+    assert [list(values) for values in traces.load_trace(str(path))] == [[0, 1], [4, 2], [0, 0]]
+    path.write_text("7\n3\n")
+    assert [list(values) for values in traces.load_trace(str(path))] == [[0, 0], [7, 3], [0, 0]]
+
+
+def test_invalid_traces(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("0,x\n")
+    with pytest.raises(ValueError, match="line 1"):
+        traces.load_trace(str(path))
+    path.write_text("0,0\n")
+    with pytest.raises(ValueError, match="positive"):
+        traces.load_trace(str(path))
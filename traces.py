@@ -0,0 +1,137 @@
+"""
+Streaming workload traces for the CPU scheduling simulator.
+
+Two formats are supported:
+
+* CSV with arrival, burst and optional priority columns. A header row is
+  optional; when present the columns are matched by name.
+* A compact binary format: an 8 byte header (b"SCHT", format version,
+  reserved) followed by little-endian records of int64 arrival, uint32 burst
+  and int32 priority (16 bytes per job).
+
+The readers are generators that parse the file incrementally, so the raw
+text is never held in memory. load_trace() collects the jobs into compact
+typed arrays that the scheduling functions accept like lists.
+"""
+import csv
+import struct
+from array import array
+
+MAGIC = b"SCHT"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<qIi")
+RECORDS_PER_READ = 4096
+
+COLUMN_NAMES = {
+    "arrival": ("arrival", "arrival_time", "at"),
+    "burst": ("burst", "burst_time", "bt"),
+    "priority": ("priority", "prio"),
+}
+
+
+def _column_index(header):
+    names = [name.strip().lower() for name in header]
+    index = {}
+    for column, aliases in COLUMN_NAMES.items():
+        for alias in aliases:
+            if alias in names:
+                index[column] = names.index(alias)
+                break
+    if "burst" not in index:
+        raise ValueError("Trace header has no burst column")
+    return index.get("arrival"), index["burst"], index.get("priority")
+
+
+def iter_csv(path):
+    """Yield (arrival, burst, priority) tuples from a CSV trace."""
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        columns = None
+        for line_no, row in enumerate(reader, start=1):
+            if not row or row[0].lstrip().startswith("#"):
+                continue
+            if columns is None:
+                if not row[0].strip().lstrip("-").isdigit():
+                    columns = _column_index(row)
+                    continue
+                columns = (0, 1, 2)
+            arrival_col, burst_col, priority_col = columns
+            try:
+                if len(row) == 1 and columns == (0, 1, 2):
+                    # A bare list of bursts: everything arrives at 0
+                    yield 0, int(row[0]), 0
+                    continue
+                arrival = int(row[arrival_col]) if arrival_col is not None else 0
+                burst = int(row[burst_col])
+                priority = int(row[priority_col]) if priority_col is not None and priority_col < len(row) else 0
+            except (ValueError, IndexError):
+                raise ValueError(f"{path}, line {line_no}: invalid row {row!r}")
+            yield arrival, burst, priority
+
+
+def iter_binary(path):
+    """Yield (arrival, burst, priority) tuples from a binary trace."""
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path}: truncated trace header")
+        magic, version, _ = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a version {VERSION} scheduling trace")
+        while True:
+            chunk = f.read(RECORD.size * RECORDS_PER_READ)
+            if not chunk:
+                break
+            if len(chunk) % RECORD.size:
+                raise ValueError(f"{path}: truncated trace record")
+            yield from RECORD.iter_unpack(chunk)
+
+
+def is_binary(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def iter_trace(path):
+    """Yield jobs from a CSV or binary trace, detected by the file header."""
+    return iter_binary(path) if is_binary(path) else iter_csv(path)
+
+
+def write_binary(path, jobs):
+    """Write (arrival, burst, priority) jobs from any iterable to a binary trace."""
+    count = 0
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0))
+        buffer = bytearray()
+        for arrival, burst, priority in jobs:
+            buffer += RECORD.pack(arrival, burst, priority)
+            count += 1
+            if len(buffer) >= RECORD.size * RECORDS_PER_READ:
+                f.write(buffer)
+                buffer.clear()
+        f.write(buffer)
+    return count
+
+
+def write_csv(path, jobs):
+    count = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["arrival", "burst", "priority"])
+        for job in jobs:
+            writer.writerow(job)
+            count += 1
+    return count
+
+
+def load_trace(path):
+    """Return (arrival, burst, priority) as int64 arrays for the schedulers."""
+    arrival, burst, priority = array("q"), array("q"), array("q")
+    for a, b, p in iter_trace(path):
+        if b <= 0:
+            raise ValueError(f"{path}: burst times must be positive")
+        arrival.append(a)
+        burst.append(b)
+        priority.append(p)
+    return arrival, burst, priority
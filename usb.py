@@ -1,8 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import subprocess
-import threading
 import pyudev
+import lifecycle
 
 class USBMonitorApp:
     def __init__(self, master):
@@ -10,6 +10,7 @@ class USBMonitorApp:
         self.master.title("USB Device Monitor ⚡")
         self.master.geometry("800x600")
         self.master.resizable(True, True)
+        self.usb_monitor = None
 
         self.create_ui()
         self.monitor_usb_devices()
@@ -80,20 +81,29 @@ class USBMonitorApp:
             self.details_label.config(text=f"❌ Error fetching details:\n{e}")
 
     def start_usb_event_listener(self):
-        """Start a thread to monitor USB events."""
-        threading.Thread(target=self.usb_event_listener, daemon=True).start()
+        """Watch the udev socket from the Tk event loop, so no thread polls it."""
+        context = pyudev.Context()
+        self.usb_monitor = pyudev.Monitor.from_netlink(context)
+        self.usb_monitor.filter_by(subsystem='usb')
+        self.usb_monitor.start()
+        self.master.tk.createfilehandler(self.usb_monitor, tk.READABLE, self.usb_event_listener)
 
-    def usb_event_listener(self):
+    def usb_event_listener(self, monitor, mask):
         """Real-time USB event monitoring using pyudev."""
-        context = pyudev.Context()
-        monitor = pyudev.Monitor.from_netlink(context)
-        monitor.filter_by(subsystem='usb')
-        for device in iter(monitor.poll, None):
-            # Update UI in main thread
-            self.master.after(100, self.monitor_usb_devices)
+        # Drain the queued events, then refresh once
+        while self.usb_monitor.poll(timeout=0) is not None:
+            pass
+        self.monitor_usb_devices()
+
+    def close(self):
+        """Stop watching for USB events."""
+        if self.usb_monitor is not None:
+            self.master.tk.deletefilehandler(self.usb_monitor)
+            self.usb_monitor = None
 
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = USBMonitorApp(root)
+    lifecycle.WindowManager(root).track(root, app)
     root.mainloop()
@@ -0,0 +1,104 @@
+"""
+Seeded synthetic workloads for stress-testing the schedulers.
+
+Everything is generated with vectorized NumPy calls, so a million jobs take
+a fraction of a second, and the same seed always gives the same workload.
+"""
+import numpy as np
+
+ARRIVAL_PATTERNS = ["Poisson", "Bursty", "All at 0"]
+BURST_DISTRIBUTIONS = ["Exponential", "Lognormal", "Pareto"]
+
+
+def _arrivals(rng, n, pattern, rate, burstiness, group_size):
+    if pattern == "All at 0":
+        return np.zeros(n, dtype=np.int64)
+    if rate <= 0:
+        raise ValueError("Arrival rate must be positive")
+    if pattern == "Poisson":
+        gaps = rng.exponential(1.0 / rate, n)
+    elif pattern == "Bursty":
+        # Jobs come in groups `burstiness` times faster than the mean rate,
+        # separated by quiet gaps sized so the long-run rate is still `rate`.
+        if burstiness < 1 or group_size < 1:
+            raise ValueError("Burstiness and group size must be at least 1")
+        gaps = rng.exponential(1.0 / (rate * burstiness), n)
+        new_group = rng.random(n) < 1.0 / group_size
+        quiet = (1.0 - 1.0 / burstiness) * group_size / rate
+        gaps[new_group] += rng.exponential(quiet, int(new_group.sum()))
+    else:
+        raise ValueError(f"Unknown arrival pattern: {pattern}")
+    gaps[0] = 0.0
+    return np.floor(np.cumsum(gaps)).astype(np.int64)
+
+
+def _bursts(rng, n, distribution, mean, sigma, alpha):
+    if mean <= 0:
+        raise ValueError("Mean burst time must be positive")
+    if distribution == "Exponential":
+        bursts = rng.exponential(mean, n)
+    elif distribution == "Lognormal":
+        bursts = rng.lognormal(np.log(mean) - sigma**2 / 2, sigma, n)
+    elif distribution == "Pareto":
+        if alpha <= 1:
+            raise ValueError("Pareto shape must be greater than 1 for a finite mean")
+        bursts = (rng.pareto(alpha, n) + 1.0) * (mean * (alpha - 1) / alpha)
+    else:
+        raise ValueError(f"Unknown burst distribution: {distribution}")
+    return np.maximum(np.ceil(bursts), 1).astype(np.int64)
+
+
+def generate_workload(n, seed=None, arrival_pattern="Poisson", rate=0.1,
+                      burst_distribution="Lognormal", mean_burst=10, sigma=1.0, alpha=1.5,
+                      priority_weights=(0.2, 0.3, 0.5), burstiness=10, group_size=20):
+    """
+    Return (arrival, burst, priority) int64 arrays for `n` jobs.
+
+    `rate` is the mean number of arrivals per time unit. Priorities are drawn
+    from 0..len(priority_weights)-1 with the given relative weights, so the
+    default mix has few urgent (0) jobs and many background ones.
+    """
+    if n <= 0:
+        raise ValueError("Number of jobs must be positive")
+    rng = np.random.default_rng(seed)
+    arrival = _arrivals(rng, n, arrival_pattern, rate, burstiness, group_size)
+    burst = _bursts(rng, n, burst_distribution, mean_burst, sigma, alpha)
+    weights = np.asarray(priority_weights, dtype=np.float64)
+    if weights.ndim != 1 or weights.size == 0 or (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError("Priority weights must be non-negative and not all zero")
+    priority = rng.choice(weights.size, n, p=weights / weights.sum()).astype(np.int64)
+    return arrival, burst, priority
+
+
+def generate_multiburst(n, seed=None, cpu_bursts=12, num_devices=2, mean_io=20,
+                        arrival_pattern="Poisson", rate=0.005, burst_distribution="Lognormal",
+                        mean_burst=10, sigma=1.0, alpha=1.5, priority_weights=(0.2, 0.3, 0.5),
+                        burstiness=10, group_size=20):
+    """
+    Return (arrival, bursts, devices, priority) for `n` CPU/I-O processes.
+
+    Each process has between 1 and 2 * cpu_bursts - 1 CPU bursts (cpu_bursts
+    on average) with exponential I/O bursts of mean `mean_io` between them,
+    each on a uniformly chosen device. `bursts` and `devices` are lists of
+    lists, as multiburst.simulate() takes them.
+    """
+    if cpu_bursts < 1 or num_devices < 1:
+        raise ValueError("Processes need at least one CPU burst and one device")
+    if mean_io <= 0:
+        raise ValueError("Mean I/O time must be positive")
+    arrival, _, priority = generate_workload(n, seed, arrival_pattern, rate, burst_distribution, mean_burst,
+                                             sigma, alpha, priority_weights, burstiness, group_size)
+    rng = np.random.default_rng(None if seed is None else seed + 1)
+    cpu_counts = rng.integers(1, 2 * cpu_bursts, n)
+    lengths = 2 * cpu_counts - 1
+    ends = np.cumsum(lengths)
+    # Position of every burst within its own process: even is CPU, odd is I/O
+    position = np.arange(ends[-1]) - np.repeat(ends - lengths, lengths)
+    is_io = position % 2 == 1
+    flat = _bursts(rng, position.size, burst_distribution, mean_burst, sigma, alpha)
+    flat[is_io] = np.maximum(np.ceil(rng.exponential(mean_io, int(is_io.sum()))), 1).astype(np.int64)
+    devices = rng.integers(0, num_devices, int(is_io.sum()))
+
+    bursts = [part.tolist() for part in np.split(flat, ends[:-1])]
+    device_lists = [part.tolist() for part in np.split(devices, np.cumsum(cpu_counts - 1)[:-1])]
+    return arrival.tolist(), bursts, device_lists, priority.tolist()